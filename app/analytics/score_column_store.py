@@ -0,0 +1,376 @@
+# Standard library imports
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Related third-party imports
+import numpy as np
+from sqlalchemy import Engine, select
+
+# Local application/library specific imports
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.repository_listener import RepositoryListener
+from app.schemas.score_statistics import (
+    ColumnStoreStats,
+    HistogramBin,
+    RollingAveragePoint,
+    ScoreStatistics,
+)
+
+EPOCH = date(1970, 1, 1)
+NO_TEAM = -1
+INITIAL_CAPACITY = 1024
+LOAD_CHUNK_SIZE = 10000
+
+
+def day_number(value: date) -> int:
+    return (value - EPOCH).days
+
+
+class ScoreColumnStore(RepositoryListener):
+    """
+    Copy of baseball_player_scores held as NumPy columns, for statistics
+    computed with vectorized masks instead of SQL queries.
+
+    Names and teams are dictionary encoded to int32 codes and match dates
+    stored as int32 day numbers. The copy is loaded once with `load` and
+    then follows the repository writes of this process as a listener.
+    Deleted rows are flagged and compacted away once they are the
+    majority, so every write costs O(1) amortized.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        # Writes applied while a load runs, replayed on the loaded copy.
+        self._replay: Optional[List[Tuple[Callable[[Any], None], Any]]] = (
+            None
+        )
+        self._allocate(max(capacity, 1))
+        self._size = 0
+        self._deleted = 0
+        # Row position of each live id.
+        self._positions: Dict[int, int] = {}
+        self._player_codes: Dict[str, int] = {}
+        self._team_codes: Dict[str, int] = {}
+        self._build_seconds = 0.0
+        self._writes_applied = 0
+        self._write_seconds = 0.0
+
+    def load(self, engine: Engine) -> None:
+        """
+        Replace the contents with the rows currently in the table. The new
+        copy is built without holding the lock, queries keep reading the
+        previous one meanwhile, and swapped in with the writes applied
+        during the load replayed on it.
+        """
+        table = BaseballPlayerScore.__table__
+        with self._load_lock:
+            started = time.perf_counter()
+            with self._lock:
+                self._replay = []
+            loaded = ScoreColumnStore()
+            try:
+                with engine.connect() as connection:
+                    rows = connection.execution_options(
+                        yield_per=LOAD_CHUNK_SIZE
+                    ).execute(select(*table.columns))
+                    for chunk in rows.partitions():
+                        loaded._append_chunk(chunk)
+            finally:
+                with self._lock:
+                    replay, self._replay = self._replay, None
+            with self._lock:
+                for name in _STATE:
+                    setattr(self, name, getattr(loaded, name))
+                for write, entity in replay:
+                    write(entity)
+                self._build_seconds = time.perf_counter() - started
+
+    def after_create(self, entity: Any) -> None:
+        self._apply(self._create, entity)
+
+    def after_update(self, entity: Any, changed_fields: Iterable[str]) -> None:
+        self._apply(self._upsert, entity)
+
+    def after_delete(self, entity: Any) -> None:
+        self._apply(self._delete, entity)
+
+    def statistics(
+        self,
+        player_name: Optional[str] = None,
+        player_team: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        percentiles: Sequence[float] = (50, 90, 99),
+        bins: int = 10
+    ) -> ScoreStatistics:
+        with self._lock:
+            mask = self._mask(player_name, player_team, start_date, end_date)
+            scores = self._scores[:self._size][mask]
+        if scores.size == 0:
+            return ScoreStatistics(count=0)
+
+        counts, edges = np.histogram(scores, bins=bins)
+        return ScoreStatistics(
+            count=int(scores.size),
+            mean=float(scores.mean()),
+            stddev=float(scores.std()),
+            min=int(scores.min()),
+            max=int(scores.max()),
+            percentiles={
+                f"{percentile:g}": float(value)
+                for percentile, value in zip(
+                    percentiles,
+                    np.percentile(scores, percentiles)
+                )
+            },
+            histogram=[
+                HistogramBin(
+                    lower=float(edges[index]),
+                    upper=float(edges[index + 1]),
+                    count=int(count)
+                )
+                for index, count in enumerate(counts)
+            ],
+        )
+
+    def rolling_average(
+        self,
+        window_days: int,
+        player_name: Optional[str] = None,
+        player_team: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[RollingAveragePoint]:
+        """
+        Mean score over the `window_days` days ending on each match date of
+        the selection. Windows at the start of the range only see matches
+        inside the range.
+        """
+        with self._lock:
+            mask = self._mask(player_name, player_team, start_date, end_date)
+            days = self._days[:self._size][mask]
+            scores = self._scores[:self._size][mask]
+        if days.size == 0:
+            return []
+
+        first_day = int(days.min())
+        offsets = days - first_day
+        # Totals per calendar day, then windowed through prefix sums.
+        day_totals = np.bincount(offsets, weights=scores)
+        day_matches = np.bincount(offsets)
+        total_sums = np.concatenate(([0.0], np.cumsum(day_totals)))
+        match_sums = np.concatenate(([0], np.cumsum(day_matches)))
+        ends = np.flatnonzero(day_matches) + 1
+        starts = np.maximum(ends - window_days, 0)
+        window_totals = total_sums[ends] - total_sums[starts]
+        window_matches = match_sums[ends] - match_sums[starts]
+        return [
+            RollingAveragePoint(
+                match_date=EPOCH + timedelta(days=first_day + int(end) - 1),
+                average_score=float(total / matches),
+                matches=int(matches)
+            )
+            for end, total, matches in zip(
+                ends,
+                window_totals,
+                window_matches
+            )
+        ]
+
+    def stats(self) -> ColumnStoreStats:
+        with self._lock:
+            arrays = (
+                self._ids,
+                self._players,
+                self._teams,
+                self._scores,
+                self._days,
+                self._alive,
+            )
+            names = list(self._player_codes) + list(self._team_codes)
+            memory_bytes = (
+                sum(array.nbytes for array in arrays)
+                + sum(sys.getsizeof(name) for name in names)
+                + sys.getsizeof(self._positions)
+                + sys.getsizeof(self._player_codes)
+                + sys.getsizeof(self._team_codes)
+            )
+            return ColumnStoreStats(
+                rows=self._size - self._deleted,
+                deleted_rows=self._deleted,
+                capacity=len(self._ids),
+                players=len(self._player_codes),
+                teams=len(self._team_codes),
+                memory_bytes=memory_bytes,
+                build_seconds=self._build_seconds,
+                writes_applied=self._writes_applied,
+                mean_write_microseconds=(
+                    self._write_seconds / self._writes_applied * 1e6
+                    if self._writes_applied else 0.0
+                ),
+            )
+
+    def _mask(
+        self,
+        player_name: Optional[str],
+        player_team: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> np.ndarray:
+        mask = self._alive[:self._size].copy()
+        if player_name is not None:
+            code = self._player_codes.get(player_name)
+            if code is None:
+                mask[:] = False
+            else:
+                mask &= self._players[:self._size] == code
+        if player_team is not None:
+            code = self._team_codes.get(player_team)
+            if code is None:
+                mask[:] = False
+            else:
+                mask &= self._teams[:self._size] == code
+        if start_date is not None:
+            mask &= self._days[:self._size] >= day_number(start_date)
+        if end_date is not None:
+            mask &= self._days[:self._size] <= day_number(end_date)
+        return mask
+
+    def _apply(self, write: Callable[[Any], None], entity: Any) -> None:
+        with self._timed_write():
+            write(entity)
+            if self._replay is not None:
+                self._replay.append((write, entity))
+
+    def _create(self, entity: Any) -> None:
+        if entity.id not in self._positions:
+            self._append(entity)
+
+    def _upsert(self, entity: Any) -> None:
+        position = self._positions.get(entity.id)
+        if position is None:
+            self._append(entity)
+        else:
+            self._write(position, entity)
+
+    def _delete(self, entity: Any) -> None:
+        position = self._positions.pop(entity.id, None)
+        if position is None:
+            return
+        self._alive[position] = False
+        self._deleted += 1
+        if self._deleted * 2 > self._size:
+            self._compact()
+
+    @contextmanager
+    def _timed_write(self):
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                yield
+            finally:
+                self._write_seconds += time.perf_counter() - started
+                self._writes_applied += 1
+
+    def _allocate(self, capacity: int) -> None:
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._players = np.zeros(capacity, dtype=np.int32)
+        self._teams = np.zeros(capacity, dtype=np.int32)
+        self._scores = np.zeros(capacity, dtype=np.int32)
+        self._days = np.zeros(capacity, dtype=np.int32)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    def _append(self, row: Any) -> None:
+        if self._size == len(self._ids):
+            self._resize(len(self._ids) * 2)
+        position = self._size
+        self._size += 1
+        self._positions[row.id] = position
+        self._write(position, row)
+
+    def _append_chunk(self, rows: Sequence[Any]) -> None:
+        start, count = self._size, len(rows)
+        capacity = len(self._ids)
+        while capacity < start + count:
+            capacity *= 2
+        if capacity != len(self._ids):
+            self._resize(capacity)
+        end = start + count
+
+        self._ids[start:end] = [row.id for row in rows]
+        self._players[start:end] = [
+            _encode(self._player_codes, row.player_name) for row in rows
+        ]
+        self._teams[start:end] = [
+            NO_TEAM if row.player_team is None
+            else _encode(self._team_codes, row.player_team)
+            for row in rows
+        ]
+        self._scores[start:end] = [row.score for row in rows]
+        self._days[start:end] = [day_number(row.match_date) for row in rows]
+        self._alive[start:end] = True
+        self._positions.update(
+            zip(self._ids[start:end].tolist(), range(start, end))
+        )
+        self._size = end
+
+    def _write(self, position: int, row: Any) -> None:
+        self._ids[position] = row.id
+        self._players[position] = _encode(self._player_codes, row.player_name)
+        self._teams[position] = (
+            NO_TEAM if row.player_team is None
+            else _encode(self._team_codes, row.player_team)
+        )
+        self._scores[position] = row.score
+        self._days[position] = day_number(row.match_date)
+        self._alive[position] = True
+
+    def _resize(self, capacity: int) -> None:
+        for name in ('_ids', '_players', '_teams', '_scores', '_days',
+                     '_alive'):
+            array = getattr(self, name)
+            resized = np.zeros(capacity, dtype=array.dtype)
+            resized[:self._size] = array[:self._size]
+            setattr(self, name, resized)
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive[:self._size])
+        for name in ('_ids', '_players', '_teams', '_scores', '_days',
+                     '_alive'):
+            array = getattr(self, name)
+            array[:keep.size] = array[keep]
+            array[keep.size:self._size] = 0
+        self._size = int(keep.size)
+        self._deleted = 0
+        self._positions = {
+            int(score_id): position
+            for position, score_id in enumerate(self._ids[:self._size])
+        }
+
+
+# Attributes holding the copy, swapped in whole by load.
+_STATE = (
+    '_ids', '_players', '_teams', '_scores', '_days', '_alive',
+    '_size', '_deleted', '_positions', '_player_codes', '_team_codes',
+)
+
+
+def _encode(codes: Dict[str, int], value: str) -> int:
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(codes)
+    return code
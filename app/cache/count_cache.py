@@ -0,0 +1,66 @@
+# Standard library imports
+import time
+from typing import Any, Callable, Iterable, Sequence
+
+# Local application/library specific imports
+from app.cache.lru_ttl_cache import LruTtlCache
+from app.repositories.repository_listener import RepositoryListener
+
+
+class CountCache(LruTtlCache[int], RepositoryListener):
+    """
+    LRU cache of exact search counts keyed by the normalized filter.
+
+    Entries are dropped when a write touches a row the filter could match,
+    all of them when a statement writes many rows at once. Writes made
+    outside this process are not seen, `ttl_seconds` bounds how long a
+    count can miss them.
+    A count computed while a write happened is not stored, see `generation`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            clock=clock
+        )
+
+    def invalidate_matching(
+        self,
+        entity: Any,
+        changed_fields: Iterable[str] = ()
+    ) -> None:
+        changed_fields = tuple(changed_fields)
+        self.invalidate_where(
+            lambda search_filter: search_filter.matches(
+                entity,
+                changed_fields
+            )
+        )
+
+    def after_create(self, entity: Any) -> None:
+        self.invalidate_matching(entity)
+
+    def after_update(self, entity: Any, changed_fields: Iterable[str]) -> None:
+        self.invalidate_matching(entity, changed_fields)
+
+    def after_delete(self, entity: Any) -> None:
+        self.invalidate_matching(entity)
+
+    def after_create_many(self, entities: Sequence[Any]) -> None:
+        self.clear()
+
+    def after_update_many(
+        self,
+        entities: Sequence[Any],
+        changed_fields: Iterable[str]
+    ) -> None:
+        self.clear()
+
+    def after_delete_many(self, entities: Sequence[Any]) -> None:
+        self.clear()
@@ -0,0 +1,22 @@
+# Standard library imports
+from typing import Any, Iterable
+
+# Local application/library specific imports
+from app.cache.lru_ttl_cache import LruTtlCache
+from app.repositories.repository_listener import RepositoryListener
+from app.schemas.score_dto import ScoreDTO
+
+
+class ScoreEntityCache(LruTtlCache[ScoreDTO], RepositoryListener):
+    """
+    Score DTOs keyed by id, read through by the score services.
+
+    Updates and deletes drop the entry of the written id only. Creates
+    need nothing since misses are not cached.
+    """
+
+    def after_update(self, entity: Any, changed_fields: Iterable[str]) -> None:
+        self.invalidate(entity.id)
+
+    def after_delete(self, entity: Any) -> None:
+        self.invalidate(entity.id)
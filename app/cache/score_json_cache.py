@@ -0,0 +1,36 @@
+# Standard library imports
+from typing import Any, Hashable, List, Sequence
+
+# Local application/library specific imports
+from app.cache.lru_ttl_cache import LruTtlCache
+from app.helper.score_json_writer import encode_score_json
+
+
+def score_json_key(score: Any) -> Hashable:
+    # Every field of ScoreDTO, the values a fragment was encoded from.
+    return (
+        score.id,
+        score.player_name,
+        score.player_team,
+        score.score,
+        score.match_date,
+    )
+
+
+class ScoreJsonCache(LruTtlCache[bytes]):
+    """
+    Encoded score JSON keyed by the values of the score it encodes. A
+    written score has other values and so another key, whichever process
+    wrote it: entries never need invalidating and simply age out.
+    """
+
+    def encode_row(self, row: Any) -> bytes:
+        key = score_json_key(row)
+        fragment = self.get(key)
+        if fragment is None:
+            fragment = encode_score_json(row)
+            self.set(key, fragment, self.generation)
+        return fragment
+
+    def encode_rows(self, rows: Sequence[Any]) -> List[bytes]:
+        return [self.encode_row(row) for row in rows]
@@ -0,0 +1,66 @@
+# Standard library imports
+from typing import Any, Iterable, NamedTuple, Optional, Sequence, Union
+
+# Local application/library specific imports
+from app.cache.lru_ttl_cache import LruTtlCache
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.repositories.repository_listener import RepositoryListener
+from app.schemas.pagination_response import PaginationResponse
+
+
+class SearchCacheKey(NamedTuple):
+    search_filter: ScoreSearchFilter
+    page: int
+    page_size: int
+    sort_order: ScoreSortOrder
+    cursor: Optional[str]
+    include_total: TotalCountMode
+    # Encoded JSON (search_scores_json) rather than a PaginationResponse.
+    as_json: bool = False
+
+
+class SearchResultCache(
+    LruTtlCache[Union[PaginationResponse, bytes]],
+    RepositoryListener
+):
+    """
+    Search responses keyed by normalized filter and page.
+
+    A write drops every page of the searches whose filter could match the
+    written row, before or after the write. Other searches stay cached.
+    Writes of many rows at once drop every search, matching each row
+    against each cached filter would cost more than searching again.
+    """
+
+    def after_create(self, entity: Any) -> None:
+        self._invalidate_matching(entity)
+
+    def after_update(self, entity: Any, changed_fields: Iterable[str]) -> None:
+        self._invalidate_matching(entity, tuple(changed_fields))
+
+    def after_delete(self, entity: Any) -> None:
+        self._invalidate_matching(entity)
+
+    def after_create_many(self, entities: Sequence[Any]) -> None:
+        self.clear()
+
+    def after_update_many(
+        self,
+        entities: Sequence[Any],
+        changed_fields: Iterable[str]
+    ) -> None:
+        self.clear()
+
+    def after_delete_many(self, entities: Sequence[Any]) -> None:
+        self.clear()
+
+    def _invalidate_matching(
+        self,
+        entity: Any,
+        changed_fields: Iterable[str] = ()
+    ) -> None:
+        self.invalidate_where(
+            lambda key: key.search_filter.matches(entity, changed_fields)
+        )
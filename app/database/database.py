@@ -1,13 +1,44 @@
+# Standard library imports
+import os
+
 # Related third-party imports
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-# Create an in-memory SQLite database,
-# need to change this later if this app becomes a real service.
-engine = create_engine('sqlite:///mydatabase.db', echo=True)
+# Local application/library specific imports
+from app.database.engine_profile import (
+    install_sqlite_pragmas,
+    load_engine_profile,
+)
+from app.settings import DATABASE_ASYNC
+
+# URL, pool and SQLite pragmas come from DATABASE_PROFILE and the related
+# environment variables, see engine_profile.py.
+engine_profile = load_engine_profile(os.environ)
+
+engine = create_engine(engine_profile.url, **engine_profile.engine_options())
+install_sqlite_pragmas(engine, engine_profile)
 
 # Base class for models.
 Base = declarative_base()
 
 # Session factory.
 SessionLocal = sessionmaker(bind=engine)
+
+# Async engine and session factory, only created when the async stack is
+# enabled so aiosqlite stays an optional dependency.
+async_engine = None
+AsyncSessionLocal = None
+if DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        engine_profile.async_url,
+        **engine_profile.engine_options()
+    )
+    install_sqlite_pragmas(async_engine.sync_engine, engine_profile)
+    # Entities are returned to the router after commit, keep them loaded.
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        expire_on_commit=False
+    )
@@ -1,11 +1,41 @@
 # Standard library imports
+import argparse
+import sys
+import time
 from datetime import date
+from itertools import islice
+from typing import Callable, Dict, Optional
 
 # Related third-party imports
+from sqlalchemy import Connection, Engine, func, select
 from sqlalchemy.orm import Session
 
 # Local application/library specific imports
+from app.database.name_search_index import (
+    install_name_search,
+    rebuild_name_search,
+)
+from app.database.score_generator import GeneratorConfig, generate_scores
+from app.database.summary_triggers import install_summary_triggers
 from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.summary_queries import rebuild_statements
+from app.settings import (
+    SEED_BATCH_SIZE,
+    SEED_LAST_SEASON,
+    SEED_RANDOM_SEED,
+    SEED_ROSTER_SIZE,
+    SEED_ROWS,
+    SEED_TEAMS,
+)
+
+# Connection settings of the load, restored afterwards. Nothing needs to
+# survive a crash while an empty database is being filled.
+LOAD_PRAGMAS: Dict[str, str] = {
+    'journal_mode': 'MEMORY',
+    'synchronous': 'OFF',
+    'cache_size': str(-256 * 1024),
+    'temp_store': 'MEMORY',
+}
 
 
 def seed_data(db: Session):
@@ -27,3 +57,182 @@ def seed_data(db: Session):
     for score in player_scores:
         db.add(score)
     db.commit()
+
+
+def seed_config_from_settings(rows: int = SEED_ROWS) -> GeneratorConfig:
+    return GeneratorConfig(
+        rows=rows,
+        teams=SEED_TEAMS,
+        roster_size=SEED_ROSTER_SIZE,
+        last_season=SEED_LAST_SEASON,
+        seed=SEED_RANDOM_SEED,
+    )
+
+
+def seed_synthetic_data(
+    engine: Engine,
+    config: GeneratorConfig,
+    batch_size: int = SEED_BATCH_SIZE,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Load the scores of `config` into the empty scores table and return
+    the number of rows loaded. `on_progress` is called with the rows
+    loaded so far after each batch.
+
+    The score triggers and secondary indexes are dropped during the load,
+    which only runs batched executemany inserts, then the indexes, the
+    summaries and the name search index are rebuilt in one pass each and
+    the triggers reinstalled.
+
+    Raises ValueError when the table already holds scores.
+    """
+    table = BaseballPlayerScore.__table__
+    with engine.connect() as connection:
+        if connection.scalar(select(func.count()).select_from(table)):
+            raise ValueError(
+                "The scores table is not empty, synthetic data is only "
+                "loaded into an empty database."
+            )
+        connection.commit()
+
+        restored_pragmas = _relax_pragmas(connection)
+        loaded = 0
+        try:
+            _drop_write_overhead(connection)
+            connection.commit()
+
+            rows = generate_scores(config)
+            while batch := list(islice(rows, batch_size)):
+                connection.execute(table.insert(), batch)
+                connection.commit()
+                loaded += len(batch)
+                if on_progress is not None:
+                    on_progress(loaded)
+        finally:
+            connection.rollback()
+            _restore_write_overhead(connection)
+            connection.commit()
+            _set_pragmas(connection, restored_pragmas)
+    return loaded
+
+
+def _relax_pragmas(connection: Connection) -> Dict[str, str]:
+    """Apply LOAD_PRAGMAS and return the values they replaced."""
+    if connection.dialect.name != 'sqlite':
+        return {}
+    previous = {
+        name: str(connection.exec_driver_sql(f"PRAGMA {name}").scalar())
+        for name in LOAD_PRAGMAS
+    }
+    connection.commit()
+    _set_pragmas(connection, LOAD_PRAGMAS)
+    return previous
+
+
+def _set_pragmas(connection: Connection, pragmas: Dict[str, str]) -> None:
+    for name, value in pragmas.items():
+        connection.exec_driver_sql(f"PRAGMA {name} = {value}")
+    connection.commit()
+
+
+def _drop_write_overhead(connection: Connection) -> None:
+    table = BaseballPlayerScore.__table__
+    if connection.dialect.name == 'sqlite':
+        triggers = connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'trigger' AND tbl_name = ?",
+            (table.name,)
+        ).scalars().all()
+        for trigger in triggers:
+            connection.exec_driver_sql(f"DROP TRIGGER {trigger}")
+    for index in table.indexes:
+        index.drop(bind=connection, checkfirst=True)
+
+
+def _restore_write_overhead(connection: Connection) -> None:
+    for index in BaseballPlayerScore.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+    for statement in rebuild_statements():
+        connection.execute(statement)
+    install_summary_triggers(connection)
+    install_name_search(connection)
+    rebuild_name_search(connection)
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql("ANALYZE")
+
+
+def main(argv=None) -> int:
+    # Imported here so the generator can be used without the application
+    # engine.
+    from app.database.database import engine
+    from app.database.schema_migrations import upgrade_schema
+
+    parser = argparse.ArgumentParser(
+        description="Fill an empty database with reproducible synthetic "
+                    "scores. Defaults come from the SEED_* settings."
+    )
+    defaults = seed_config_from_settings()
+    parser.add_argument("--rows", type=int, default=defaults.rows or 100000)
+    parser.add_argument("--teams", type=int, default=defaults.teams)
+    parser.add_argument(
+        "--roster-size",
+        type=int,
+        default=defaults.roster_size
+    )
+    parser.add_argument(
+        "--last-season",
+        type=int,
+        default=defaults.last_season
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=SEED_BATCH_SIZE,
+        help="Rows inserted per transaction"
+    )
+    args = parser.parse_args(argv)
+    for name in ("rows", "teams", "roster_size", "batch_size"):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be at least 1")
+
+    config = GeneratorConfig(
+        rows=args.rows,
+        teams=args.teams,
+        roster_size=args.roster_size,
+        last_season=args.last_season,
+        seed=args.seed,
+    )
+    upgrade_schema(engine)
+    started = time.perf_counter()
+
+    def print_progress(loaded: int):
+        elapsed = time.perf_counter() - started
+        print(
+            f"{loaded} rows loaded "
+            f"({loaded / max(elapsed, 1e-9):.0f} rows/s)",
+            file=sys.stderr
+        )
+
+    try:
+        loaded = seed_synthetic_data(
+            engine,
+            config,
+            args.batch_size,
+            print_progress
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(
+        f"{loaded} scores of seasons {config.first_season} to "
+        f"{config.last_season} loaded in "
+        f"{time.perf_counter() - started:.2f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+# Standard library imports
+import argparse
+import sys
+
+# Local application/library specific imports
+from app.database.database import engine
+from app.database.schema_migrations import (
+    find_duplicate_player_dates,
+    remove_duplicate_scores,
+    upgrade_schema,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="List the scores sharing a player and date, which "
+                    "block the unique index added on startup, and delete "
+                    "all but the oldest score of each."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only list the duplicates, delete nothing"
+    )
+    args = parser.parse_args(argv)
+
+    with engine.begin() as connection:
+        duplicates = find_duplicate_player_dates(connection)
+        for player_name, match_date, count in duplicates:
+            print(f"{player_name} on {match_date}: {count} scores")
+        if args.dry_run or not duplicates:
+            print(f"{len(duplicates)} player and date pairs duplicated")
+            return 0
+        removed = remove_duplicate_scores(connection)
+
+    print(f"Removed {removed} duplicate scores, kept the oldest of each")
+    # Adds the unique index. Summaries built before followed the deletes
+    # through their triggers, missing ones are built from what is left.
+    upgrade_schema(engine)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
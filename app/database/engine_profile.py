@@ -0,0 +1,204 @@
+# Standard library imports
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+# Related third-party imports
+from sqlalchemy import Engine, event, make_url
+from sqlalchemy.pool import StaticPool
+
+# Settings each profile starts from, any of them can be overridden by the
+# environment variable of the same name.
+PROFILE_DEFAULTS: Dict[str, Dict[str, str]] = {
+    'development': {
+        'DATABASE_POOL_PRE_PING': 'false',
+        'SQLITE_JOURNAL_MODE': '',
+        'SQLITE_SYNCHRONOUS': '',
+        'SQLITE_MMAP_SIZE': '',
+        'SQLITE_CACHE_SIZE': '',
+    },
+    'production': {
+        'DATABASE_POOL_PRE_PING': 'true',
+        # Readers no longer wait for writers and commits skip an fsync.
+        'SQLITE_JOURNAL_MODE': 'WAL',
+        'SQLITE_SYNCHRONOUS': 'NORMAL',
+        'SQLITE_MMAP_SIZE': str(256 * 1024 * 1024),
+        # Negative sizes are in KiB: 64 MiB of page cache per connection.
+        'SQLITE_CACHE_SIZE': str(-64 * 1024),
+    },
+}
+
+COMMON_DEFAULTS: Dict[str, str] = {
+    'DATABASE_URL': 'sqlite:///mydatabase.db',
+    'DATABASE_ECHO': 'false',
+    'DATABASE_POOL_SIZE': '5',
+    'DATABASE_MAX_OVERFLOW': '10',
+    'SQLITE_BUSY_TIMEOUT_MS': '5000',
+}
+
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
+class EngineProfile(NamedTuple):
+    """
+    Engine and connection settings of the application database. Pragmas
+    left to None keep SQLite's own default.
+    """
+    name: str
+    url: str
+    async_url: str
+    echo: bool
+    pool_size: int
+    max_overflow: int
+    pool_pre_ping: bool
+    journal_mode: Optional[str]
+    synchronous: Optional[str]
+    mmap_size: Optional[int]
+    cache_size: Optional[int]
+    busy_timeout_ms: Optional[int]
+
+    @property
+    def is_sqlite(self) -> bool:
+        return make_url(self.url).get_backend_name() == 'sqlite'
+
+    def engine_options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {
+            'echo': self.echo,
+            'pool_pre_ping': self.pool_pre_ping,
+        }
+        if self.is_sqlite and make_url(self.url).database in (
+            None, '', ':memory:'
+        ):
+            # Every connection to ":memory:" opens a new empty database,
+            # share a single one between threads instead.
+            options['poolclass'] = StaticPool
+            options['connect_args'] = {'check_same_thread': False}
+        else:
+            options['pool_size'] = self.pool_size
+            options['max_overflow'] = self.max_overflow
+        return options
+
+    def pragmas(self) -> Dict[str, Any]:
+        pragmas = {
+            'journal_mode': self.journal_mode,
+            'synchronous': self.synchronous,
+            'mmap_size': self.mmap_size,
+            'cache_size': self.cache_size,
+            'busy_timeout': self.busy_timeout_ms,
+        }
+        return {
+            name: value for name, value in pragmas.items()
+            if value is not None
+        }
+
+
+def load_engine_profile(environ: Mapping[str, str]) -> EngineProfile:
+    """
+    Build the profile selected by DATABASE_PROFILE, `development` unless
+    set, with the overrides found in `environ`.
+
+    Raises ValueError for an unknown profile or an invalid setting.
+    """
+    name = environ.get('DATABASE_PROFILE', 'development').lower()
+    if name not in PROFILE_DEFAULTS:
+        raise ValueError(
+            f"Unknown DATABASE_PROFILE [{name}], expected one of "
+            f"{', '.join(PROFILE_DEFAULTS)}."
+        )
+    defaults = {**COMMON_DEFAULTS, **PROFILE_DEFAULTS[name]}
+
+    def setting(key: str) -> str:
+        return environ.get(key, defaults.get(key, '')).strip()
+
+    url = setting('DATABASE_URL')
+    return EngineProfile(
+        name=name,
+        url=url,
+        async_url=setting('DATABASE_ASYNC_URL') or _async_url(url),
+        echo=setting('DATABASE_ECHO').lower() == 'true',
+        pool_size=int(setting('DATABASE_POOL_SIZE')),
+        max_overflow=int(setting('DATABASE_MAX_OVERFLOW')),
+        pool_pre_ping=setting('DATABASE_POOL_PRE_PING').lower() == 'true',
+        journal_mode=_choice(
+            'SQLITE_JOURNAL_MODE',
+            setting('SQLITE_JOURNAL_MODE'),
+            JOURNAL_MODES
+        ),
+        synchronous=_choice(
+            'SQLITE_SYNCHRONOUS',
+            setting('SQLITE_SYNCHRONOUS'),
+            SYNCHRONOUS_LEVELS
+        ),
+        mmap_size=_optional_int(setting('SQLITE_MMAP_SIZE')),
+        cache_size=_optional_int(setting('SQLITE_CACHE_SIZE')),
+        busy_timeout_ms=_optional_int(setting('SQLITE_BUSY_TIMEOUT_MS')),
+    )
+
+
+def install_sqlite_pragmas(engine: Engine, profile: EngineProfile) -> None:
+    """
+    Apply the profile pragmas to every new connection of a sync engine, or
+    of the `sync_engine` of an async one.
+    """
+    if not profile.is_sqlite:
+        return
+    statements = [
+        f"PRAGMA {name} = {value}"
+        for name, value in profile.pragmas().items()
+    ]
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def describe_engine(engine: Engine, profile: EngineProfile) -> str:
+    """
+    One line summary of the engine settings, with pragmas read back from a
+    live connection so it shows what SQLite actually applied.
+    """
+    settings = {
+        'profile': profile.name,
+        'url': engine.url.render_as_string(hide_password=True),
+        'echo': profile.echo,
+        'pool': type(engine.pool).__name__,
+        'pool_size': profile.engine_options().get('pool_size'),
+        'max_overflow': profile.engine_options().get('max_overflow'),
+        'pool_pre_ping': profile.pool_pre_ping,
+    }
+    if profile.is_sqlite:
+        with engine.connect() as connection:
+            for name in ('journal_mode', 'synchronous', 'mmap_size',
+                         'cache_size', 'busy_timeout'):
+                value = connection.exec_driver_sql(
+                    f"PRAGMA {name}"
+                ).scalar()
+                if name == 'synchronous':
+                    value = SYNCHRONOUS_LEVELS[value]
+                settings[name] = value
+    return ' '.join(f"{key}={value}" for key, value in settings.items())
+
+
+def _async_url(url: str) -> str:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == 'sqlite':
+        parsed = parsed.set(drivername='sqlite+aiosqlite')
+    return parsed.render_as_string(hide_password=False)
+
+
+def _choice(key: str, value: str, allowed) -> Optional[str]:
+    if not value:
+        return None
+    if value.upper() not in allowed:
+        raise ValueError(
+            f"Invalid {key} [{value}], expected one of {', '.join(allowed)}."
+        )
+    return value.upper()
+
+
+def _optional_int(value: str) -> Optional[int]:
+    return int(value) if value else None
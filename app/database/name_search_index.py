@@ -0,0 +1,113 @@
+# Related third-party imports
+from sqlalchemy import Connection
+
+# Trigram full-text index of the distinct player names, for substring
+# search on names without scanning the scores. SQLite only.
+#
+# player_names is an append-only dictionary of the names ever written,
+# filled by the score triggers below. player_name_search is an FTS5 index
+# over it kept in step by the player_names triggers. Names whose scores
+# were all deleted stay until the next rebuild, searches join back to the
+# scores so they never show up.
+#
+# The index covers search_name, the name lowered by SQLite's lower(), with
+# a case sensitive tokenizer. Searches fold their words the same way, see
+# fold_name_case, rather than relying on the tokenizer's Unicode folding
+# which LIKE and Python would not reproduce.
+
+PLAYER_NAMES_TABLE = 'player_names'
+NAME_SEARCH_TABLE = 'player_name_search'
+SCORES_TABLE = 'baseball_player_scores'
+SCORE_TRIGGERS = ['name_search_after_insert', 'name_search_after_update']
+
+STATEMENTS = [
+    f"CREATE TABLE IF NOT EXISTS {PLAYER_NAMES_TABLE} ("
+    "id INTEGER PRIMARY KEY, "
+    "player_name VARCHAR NOT NULL UNIQUE, "
+    "search_name VARCHAR NOT NULL)",
+
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {NAME_SEARCH_TABLE} USING fts5("
+    f"player_name UNINDEXED, search_name, content='{PLAYER_NAMES_TABLE}', "
+    "content_rowid='id', tokenize='trigram case_sensitive 1')",
+
+    f"CREATE TRIGGER IF NOT EXISTS player_names_after_insert "
+    f"AFTER INSERT ON {PLAYER_NAMES_TABLE} BEGIN "
+    f"INSERT INTO {NAME_SEARCH_TABLE} (rowid, player_name, search_name) "
+    "VALUES (NEW.id, NEW.player_name, NEW.search_name); END",
+
+    f"CREATE TRIGGER IF NOT EXISTS player_names_after_delete "
+    f"AFTER DELETE ON {PLAYER_NAMES_TABLE} BEGIN "
+    f"INSERT INTO {NAME_SEARCH_TABLE} "
+    f"({NAME_SEARCH_TABLE}, rowid, player_name, search_name) "
+    "VALUES ('delete', OLD.id, OLD.player_name, OLD.search_name); END",
+
+    f"CREATE TRIGGER IF NOT EXISTS {SCORE_TRIGGERS[0]} "
+    f"AFTER INSERT ON {SCORES_TABLE} BEGIN "
+    f"INSERT OR IGNORE INTO {PLAYER_NAMES_TABLE} (player_name, search_name) "
+    "VALUES (NEW.player_name, lower(NEW.player_name)); END",
+
+    f"CREATE TRIGGER IF NOT EXISTS {SCORE_TRIGGERS[1]} "
+    f"AFTER UPDATE OF player_name ON {SCORES_TABLE} BEGIN "
+    f"INSERT OR IGNORE INTO {PLAYER_NAMES_TABLE} (player_name, search_name) "
+    "VALUES (NEW.player_name, lower(NEW.player_name)); END",
+]
+
+
+def _drop_outdated_name_search(connection: Connection) -> None:
+    # Dictionaries without search_name were indexed with the tokenizer's
+    # own case folding. Their tables and triggers are dropped to be
+    # created and filled again.
+    columns = {
+        row[1] for row in connection.exec_driver_sql(
+            f"PRAGMA table_info({PLAYER_NAMES_TABLE})"
+        )
+    }
+    if not columns or 'search_name' in columns:
+        return
+    print("MIGRATION: rebuilding the player name search index")
+    for trigger in SCORE_TRIGGERS:
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {NAME_SEARCH_TABLE}")
+    connection.exec_driver_sql(f"DROP TABLE {PLAYER_NAMES_TABLE}")
+
+
+def install_name_search(connection: Connection) -> None:
+    """
+    Create the name dictionary, its index and their triggers if missing,
+    filling them from the stored scores when they are new.
+    """
+    if connection.dialect.name != 'sqlite':
+        print("MIGRATION: player name search is only available on SQLite")
+        return
+
+    _drop_outdated_name_search(connection)
+    is_new = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE name = ?",
+        (PLAYER_NAMES_TABLE,)
+    ).first() is None
+    for statement in STATEMENTS:
+        connection.exec_driver_sql(statement)
+    if is_new:
+        rebuild_name_search(connection)
+
+
+def rebuild_name_search(connection: Connection) -> None:
+    """
+    Drop the names no score uses anymore, add missing ones and rebuild the
+    full-text index from the dictionary.
+    """
+    if connection.dialect.name != 'sqlite':
+        return
+    connection.exec_driver_sql(
+        f"DELETE FROM {PLAYER_NAMES_TABLE} WHERE player_name NOT IN "
+        f"(SELECT player_name FROM {SCORES_TABLE})"
+    )
+    connection.exec_driver_sql(
+        f"INSERT OR IGNORE INTO {PLAYER_NAMES_TABLE} "
+        "(player_name, search_name) "
+        f"SELECT DISTINCT player_name, lower(player_name) FROM {SCORES_TABLE}"
+    )
+    connection.exec_driver_sql(
+        f"INSERT INTO {NAME_SEARCH_TABLE} ({NAME_SEARCH_TABLE}) "
+        "VALUES ('rebuild')"
+    )
@@ -0,0 +1,153 @@
+# Standard library imports
+from datetime import date
+from typing import List, Tuple
+
+# Related third-party imports
+from sqlalchemy import Connection, Engine, delete, func, inspect, select
+
+# Local application/library specific imports
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.models.score_summaries import SUMMARY_TABLES
+from app.repositories.summary_queries import rebuild_statements
+
+PLAYER_DATE_COLUMNS = ['player_name', 'match_date']
+
+# Indexes replaced by wider ones of the model.
+SUPERSEDED_INDEXES = ['ix_match_date_id', 'ix_score_id']
+
+# Duplicate keys listed by DuplicateScoresError, the rest are counted.
+MAX_REPORTED_DUPLICATES = 20
+
+
+class DuplicateScoresError(Exception):
+    """
+    Raised by upgrade_schema when scores share a player and date, which
+    the unique index cannot be added over. Nothing is deleted on startup,
+    the operator removes them with
+    `python -m app.database.duplicate_score_remover`.
+    """
+
+    def __init__(self, duplicates: List[Tuple[str, date, int]]):
+        self.duplicates = duplicates
+        lines = [
+            f"  {player_name} on {match_date}: {count} scores"
+            for player_name, match_date, count
+            in duplicates[:MAX_REPORTED_DUPLICATES]
+        ]
+        if len(duplicates) > MAX_REPORTED_DUPLICATES:
+            lines.append(
+                f"  and {len(duplicates) - MAX_REPORTED_DUPLICATES} more"
+            )
+        super().__init__(
+            f"{len(duplicates)} player and date pairs have more than one "
+            "score, the unique index cannot be added:\n"
+            + "\n".join(lines)
+            + "\nReview them, then remove them keeping the oldest score "
+            "with `python -m app.database.duplicate_score_remover`."
+        )
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Create the missing tables and indexes, and bring databases created by
+    earlier versions up to date. Every step is idempotent, this runs on
+    each startup. Never deletes scores, raises DuplicateScoresError when
+    stored duplicates stand in the way of the unique index.
+    """
+    existing_tables = set(inspect(engine).get_table_names())
+    if BaseballPlayerScore.__tablename__ in existing_tables:
+        # Checked before anything is created, so that a failed upgrade
+        # leaves the summaries to be built by the next one.
+        with engine.connect() as connection:
+            _check_player_date_duplicates(connection)
+    # Also installs the summary triggers, see models/score_summaries.py.
+    BaseballPlayerScore.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        # create_all skips existing tables, so add indexes introduced later.
+        for index in BaseballPlayerScore.__table__.indexes:
+            index.create(bind=connection, checkfirst=True)
+        for index_name in SUPERSEDED_INDEXES:
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+        _add_player_date_unique_index(connection)
+        if any(
+            table.name not in existing_tables for table in SUMMARY_TABLES
+        ):
+            # Summaries only follow writes made once they exist.
+            for statement in rebuild_statements():
+                connection.execute(statement)
+
+
+def find_duplicate_player_dates(
+    connection: Connection
+) -> List[Tuple[str, date, int]]:
+    """
+    The (player_name, match_date, count) of every player and date with
+    more than one score.
+    """
+    table = BaseballPlayerScore.__table__
+    return [
+        tuple(row) for row in connection.execute(
+            select(table.c.player_name, table.c.match_date, func.count())
+            .group_by(table.c.player_name, table.c.match_date)
+            .having(func.count() > 1)
+            .order_by(table.c.player_name, table.c.match_date)
+        )
+    ]
+
+
+def remove_duplicate_scores(connection: Connection) -> int:
+    """
+    Delete the scores sharing a player and date with an older one, keeping
+    the oldest row of each, and return how many were deleted. Only run on
+    request, see duplicate_score_remover.
+    """
+    table = BaseballPlayerScore.__table__
+    oldest_ids = (
+        select(func.min(table.c.id))
+        .group_by(table.c.player_name, table.c.match_date)
+    )
+    return connection.execute(
+        delete(table).where(table.c.id.not_in(oldest_ids))
+    ).rowcount
+
+
+def _add_player_date_unique_index(connection: Connection) -> None:
+    """
+    Enforce one score per player and date on tables created while the
+    model lost its unique constraint, once upgrade_schema made sure no
+    duplicates are stored.
+    """
+    table = BaseballPlayerScore.__table__
+    if _has_unique_player_date_key(connection):
+        return
+
+    connection.exec_driver_sql(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uix_player_name_match_date "
+        f"ON {table.name} (player_name, match_date)"
+    )
+    # Superseded by the unique index, it only slowed writes down.
+    connection.exec_driver_sql(
+        "DROP INDEX IF EXISTS ix_player_name_match_date"
+    )
+
+
+def _check_player_date_duplicates(connection: Connection) -> None:
+    if _has_unique_player_date_key(connection):
+        return
+    duplicates = find_duplicate_player_dates(connection)
+    if duplicates:
+        raise DuplicateScoresError(duplicates)
+
+
+def _has_unique_player_date_key(connection: Connection) -> bool:
+    inspector = inspect(connection)
+    table_name = BaseballPlayerScore.__tablename__
+    unique_keys: List[List[str]] = [
+        constraint['column_names']
+        for constraint in inspector.get_unique_constraints(table_name)
+    ] + [
+        index['column_names']
+        for index in inspector.get_indexes(table_name)
+        if index['unique']
+    ]
+    return PLAYER_DATE_COLUMNS in unique_keys
@@ -0,0 +1,179 @@
+# Standard library imports
+import math
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+# Reproducible synthetic scores for load tests and capacity planning.
+#
+# A league of `teams` teams of `roster_size` players plays one season a
+# year, from April to September, going back from `last_season` as far as
+# needed to produce the requested rows. Each season some players retire
+# and are replaced by new ones, and some are traded between teams. A team
+# plays on most days of the season and each of its players takes part in
+# a share of its games, regulars more often than bench players. Per game
+# scores follow an exponential distribution around a per player skill, so
+# most games score little and a few players score a lot.
+
+SEASON_FIRST_DAY = (4, 1)
+SEASON_LAST_DAY = (9, 30)
+
+# About 162 games in a 183-day season.
+GAME_PROBABILITY = 0.885
+# Players replaced and players traded at the end of each season.
+RETIREMENT_RATE = 0.12
+TRADE_RATE = 0.08
+# Mean of betavariate(5, 2), the share of games a player takes part in.
+MEAN_PARTICIPATION = 5 / 7
+
+FIRST_NAMES = [
+    'Aaron', 'Alex', 'Andre', 'Ben', 'Carlos', 'Chris', 'Daniel', 'David',
+    'Diego', 'Eric', 'Felix', 'Frank', 'George', 'Hector', 'Ian', 'Jack',
+    'Jake', 'James', 'Jose', 'Juan', 'Kenji', 'Kevin', 'Luis', 'Marcus',
+    'Mark', 'Matt', 'Miguel', 'Mike', 'Nate', 'Nick', 'Omar', 'Pablo',
+    'Paul', 'Rafael', 'Ryan', 'Sam', 'Shohei', 'Tom', 'Tyler', 'Will',
+]
+LAST_NAMES = [
+    'Adams', 'Allen', 'Alvarez', 'Baker', 'Brown', 'Campbell', 'Carter',
+    'Castillo', 'Clark', 'Cruz', 'Davis', 'Diaz', 'Evans', 'Flores',
+    'Garcia', 'Gonzalez', 'Green', 'Hall', 'Harris', 'Hernandez', 'Hill',
+    'Jackson', 'Johnson', 'Jones', 'Kim', 'King', 'Lee', 'Lewis', 'Lopez',
+    'Martin', 'Martinez', 'Miller', 'Mitchell', 'Moore', 'Morales',
+    'Nelson', 'Ortiz', 'Perez', 'Ramirez', 'Reyes', 'Rivera', 'Roberts',
+    'Rodriguez', 'Sanchez', 'Scott', 'Smith', 'Suzuki', 'Taylor',
+    'Thompson', 'Torres', 'Walker', 'White', 'Williams', 'Wilson', 'Young',
+]
+CITIES = [
+    'Atlanta', 'Austin', 'Boston', 'Charlotte', 'Chicago', 'Cincinnati',
+    'Cleveland', 'Dallas', 'Denver', 'Detroit', 'Houston', 'Kansas City',
+    'Las Vegas', 'Los Angeles', 'Miami', 'Milwaukee', 'Minneapolis',
+    'Montreal', 'Nashville', 'New York', 'Oakland', 'Philadelphia',
+    'Phoenix', 'Pittsburgh', 'Portland', 'San Diego', 'San Francisco',
+    'Seattle', 'St. Louis', 'Toronto',
+]
+NICKNAMES = [
+    'Aces', 'Bears', 'Bison', 'Comets', 'Condors', 'Cougars', 'Dragons',
+    'Eagles', 'Falcons', 'Foxes', 'Giants', 'Hawks', 'Hornets', 'Jaguars',
+    'Knights', 'Lions', 'Lynx', 'Mustangs', 'Owls', 'Panthers', 'Pilots',
+    'Raptors', 'Ravens', 'Rockets', 'Sharks', 'Stallions', 'Storm',
+    'Thunder', 'Tigers', 'Wolves',
+]
+
+
+class GeneratorConfig(NamedTuple):
+    rows: int
+    teams: int = 30
+    roster_size: int = 26
+    last_season: int = 2023
+    seed: int = 42
+
+    @property
+    def expected_rows_per_season(self) -> float:
+        season_days = (
+            date(2000, *SEASON_LAST_DAY) - date(2000, *SEASON_FIRST_DAY)
+        ).days + 1
+        return (
+            self.teams * self.roster_size * season_days
+            * GAME_PROBABILITY * MEAN_PARTICIPATION
+        )
+
+    @property
+    def first_season(self) -> int:
+        seasons = math.ceil(self.rows / self.expected_rows_per_season)
+        return self.last_season - max(seasons, 1) + 1
+
+
+class _Player(NamedTuple):
+    name: str
+    # Probability of taking part in a game of the team.
+    participation: float
+    # Mean score per game.
+    skill: float
+
+
+def player_name(index: int) -> str:
+    """Unique name of the `index`-th player ever created."""
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    last = LAST_NAMES[index // len(FIRST_NAMES) % len(LAST_NAMES)]
+    generation = index // (len(FIRST_NAMES) * len(LAST_NAMES))
+    return f"{first} {last}" + (f" {generation + 1}" if generation else "")
+
+
+def team_name(index: int) -> str:
+    name = f"{CITIES[index % len(CITIES)]} {NICKNAMES[index % len(NICKNAMES)]}"
+    generation = index // len(CITIES)
+    return name + (f" {generation + 1}" if generation else "")
+
+
+def generate_scores(config: GeneratorConfig) -> Iterator[Dict[str, Any]]:
+    """
+    Yield `config.rows` score values in match date order. The same config
+    always yields the same scores, and every player has at most one score
+    per date.
+    """
+    generator = random.Random(config.seed)
+    player_count = 0
+
+    def new_player() -> _Player:
+        nonlocal player_count
+        player_count += 1
+        return _Player(
+            name=player_name(player_count - 1),
+            participation=generator.betavariate(5, 2),
+            skill=generator.lognormvariate(0.5, 0.5),
+        )
+
+    teams = [team_name(index) for index in range(config.teams)]
+    rosters = [
+        [new_player() for _ in range(config.roster_size)]
+        for _ in teams
+    ]
+    produced = 0
+    season = config.first_season
+    while produced < config.rows:
+        if season > config.first_season:
+            _turn_over(generator, rosters, new_player)
+
+        first_day = date(season, *SEASON_FIRST_DAY)
+        season_days = (date(season, *SEASON_LAST_DAY) - first_day).days + 1
+        for offset in range(season_days):
+            match_date = first_day + timedelta(days=offset)
+            for team, roster in zip(teams, rosters):
+                if generator.random() >= GAME_PROBABILITY:
+                    continue
+                for player in roster:
+                    if generator.random() >= player.participation:
+                        continue
+                    yield {
+                        'player_name': player.name,
+                        'player_team': team,
+                        'score': int(generator.expovariate(1 / player.skill)),
+                        'match_date': match_date,
+                    }
+                    produced += 1
+                    if produced == config.rows:
+                        return
+        season += 1
+
+
+def _turn_over(
+    generator: random.Random,
+    rosters: List[List[_Player]],
+    new_player
+) -> None:
+    """Retire and trade players between two seasons."""
+    for roster in rosters:
+        for position in range(len(roster)):
+            if generator.random() < RETIREMENT_RATE:
+                roster[position] = new_player()
+    if len(rosters) < 2:
+        return
+    for roster in rosters:
+        for position in range(len(roster)):
+            if generator.random() < TRADE_RATE:
+                other = generator.choice(rosters)
+                other_position = generator.randrange(len(other))
+                roster[position], other[other_position] = (
+                    other[other_position],
+                    roster[position],
+                )
@@ -0,0 +1,88 @@
+# Standard library imports
+import argparse
+import sys
+import time
+
+# Local application/library specific imports
+from app.database.database import SessionLocal, engine
+from app.database.schema_migrations import upgrade_schema
+from app.domain.score_file_format import ScoreFileFormat
+from app.helper.score_import_reader import read_import_rows
+from app.repositories.baseball_player_score_repository import (
+    BaseballPlayerScoreRepository,
+)
+from app.schemas.score_import_report import ScoreImportReport
+from app.services.score_service import ScoreService
+from app.settings import BULK_INSERT_BATCH_SIZE
+
+
+def import_file(
+    path: str,
+    file_format: ScoreFileFormat,
+    batch_size: int = BULK_INSERT_BATCH_SIZE
+):
+    upgrade_schema(engine)
+    started = time.perf_counter()
+
+    def print_progress(report: ScoreImportReport):
+        elapsed = time.perf_counter() - started
+        print(
+            f"{report.rows_read} rows read, {report.created} created, "
+            f"{report.conflicts} conflicts, {report.invalid} invalid, "
+            f"{report.errors} errors "
+            f"({report.rows_read / max(elapsed, 1e-9):.0f} rows/s)",
+            file=sys.stderr
+        )
+
+    db = SessionLocal()
+    try:
+        score_service = ScoreService(BaseballPlayerScoreRepository(db))
+        with open(path, encoding="utf-8-sig", newline="") as lines:
+            return score_service.import_scores(
+                read_import_rows(lines, file_format),
+                batch_size=batch_size,
+                on_progress=print_progress
+            )
+    finally:
+        db.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Stream scores from a CSV or NDJSON file into the "
+                    "database."
+    )
+    parser.add_argument("path", help="File to import")
+    parser.add_argument(
+        "--format",
+        choices=[file_format.value for file_format in ScoreFileFormat],
+        help="File format, guessed from the file name if omitted"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BULK_INSERT_BATCH_SIZE,
+        help="Rows written per transaction"
+    )
+    args = parser.parse_args(argv)
+
+    file_format = (
+        ScoreFileFormat(args.format) if args.format
+        else ScoreFileFormat.from_filename(args.path)
+    )
+    if file_format is None:
+        parser.error("cannot guess the file format, use --format")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    import_result = import_file(args.path, file_format, args.batch_size)
+    if not import_result.is_ok:
+        print(import_result.error_message, file=sys.stderr)
+        return 1
+
+    print(import_result.data.model_dump_json(indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
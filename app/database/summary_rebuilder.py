@@ -0,0 +1,42 @@
+# Standard library imports
+import argparse
+import sys
+import time
+
+# Local application/library specific imports
+from app.database.database import SessionLocal, engine
+from app.database.schema_migrations import upgrade_schema
+from app.repositories.score_summary_repository import ScoreSummaryRepository
+from app.services.score_summary_service import ScoreSummaryService
+
+
+def rebuild_summaries():
+    upgrade_schema(engine)
+    db = SessionLocal()
+    try:
+        return ScoreSummaryService(
+            ScoreSummaryRepository(db)
+        ).rebuild_summaries()
+    finally:
+        db.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Recompute the leaderboard and aggregate summaries "
+                    "from the stored scores."
+    )
+    parser.parse_args(argv)
+
+    started = time.perf_counter()
+    rebuild_result = rebuild_summaries()
+    if not rebuild_result.is_ok:
+        print(rebuild_result.error_message, file=sys.stderr)
+        return 1
+
+    print(f"Summaries rebuilt in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# Standard library imports
+from typing import Dict, List, NamedTuple, Optional
+
+# Related third-party imports
+from sqlalchemy import Connection
+
+# SQLite triggers keeping the summary tables of models/score_summaries.py
+# in step with baseball_player_scores. Each write applies a delta to the
+# totals of the keys it touches, in the transaction of the write itself,
+# whichever code path wrote the score.
+
+SCORES_TABLE = 'baseball_player_scores'
+
+SEASON = "CAST(strftime('%Y', {row}.match_date) AS INTEGER)"
+MONTH = "CAST(strftime('%Y%m', {row}.match_date) AS INTEGER)"
+
+
+class SummarySpec(NamedTuple):
+    table: str
+    # Summary key column to the expression computing it from a score row.
+    keys: Dict[str, str]
+    # Scores the summary ignores are those not matching this condition.
+    condition: Optional[str] = None
+
+
+SUMMARIES = [
+    SummarySpec(
+        'player_score_totals',
+        {'player_name': '{row}.player_name'}
+    ),
+    SummarySpec(
+        'player_season_totals',
+        {'season': SEASON, 'player_name': '{row}.player_name'}
+    ),
+    SummarySpec(
+        'player_month_totals',
+        {'month': MONTH, 'player_name': '{row}.player_name'}
+    ),
+    SummarySpec(
+        'team_daily_totals',
+        {'player_team': '{row}.player_team', 'match_date': '{row}.match_date'},
+        '{row}.player_team IS NOT NULL'
+    ),
+    SummarySpec(
+        'team_season_totals',
+        {'player_team': '{row}.player_team', 'season': SEASON},
+        '{row}.player_team IS NOT NULL'
+    ),
+]
+
+
+def install_summary_triggers(connection: Connection) -> None:
+    """
+    (Re)create the insert, update and delete triggers, so that databases
+    created by earlier versions also maintain summaries added since. Other
+    backends than SQLite get no triggers, their summaries have to be
+    refreshed with `python -m app.database.summary_rebuilder`.
+    """
+    if connection.dialect.name != 'sqlite':
+        print(
+            "MIGRATION: score summaries are only maintained on SQLite, "
+            "rebuild them after writes"
+        )
+        return
+
+    add_new = _add_statements('NEW')
+    remove_old = _remove_statements('OLD')
+    triggers = {
+        'score_summaries_after_insert': ('AFTER INSERT', add_new),
+        'score_summaries_after_delete': ('AFTER DELETE', remove_old),
+        'score_summaries_after_update': (
+            'AFTER UPDATE OF player_name, player_team, score, match_date',
+            remove_old + add_new
+        ),
+    }
+    for name, (event, statements) in triggers.items():
+        body = ''.join(f"    {statement};\n" for statement in statements)
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER {name} {event} ON {SCORES_TABLE}\n"
+            f"BEGIN\n{body}END"
+        )
+
+
+def _add_statements(row: str) -> List[str]:
+    statements = []
+    for summary in SUMMARIES:
+        keys = ', '.join(summary.keys)
+        values = ', '.join(
+            expression.format(row=row) for expression in summary.keys.values()
+        )
+        # The WHERE clause is required by SQLite before an upsert clause.
+        condition = (summary.condition or '1').format(row=row)
+        statements.append(
+            f"INSERT INTO {summary.table} ({keys}, matches, total_score) "
+            f"SELECT {values}, 1, {row}.score WHERE {condition} "
+            f"ON CONFLICT ({keys}) DO UPDATE SET "
+            "matches = matches + 1, "
+            "total_score = total_score + excluded.total_score"
+        )
+    return statements
+
+
+def _remove_statements(row: str) -> List[str]:
+    statements = []
+    for summary in SUMMARIES:
+        # A NULL key never compares equal, so ignored scores match nothing.
+        match = ' AND '.join(
+            f"{column} = {expression.format(row=row)}"
+            for column, expression in summary.keys.items()
+        )
+        statements.append(
+            f"UPDATE {summary.table} SET matches = matches - 1, "
+            f"total_score = total_score - {row}.score WHERE {match}"
+        )
+        statements.append(
+            f"DELETE FROM {summary.table} WHERE {match} AND matches = 0"
+        )
+    return statements
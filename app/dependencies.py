@@ -1,13 +1,148 @@
 # Related third-party imports
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # Local application/library specific imports
-from app.database.database import SessionLocal
+from app.cache.count_cache import CountCache
+from app.cache.score_entity_cache import ScoreEntityCache
+from app.cache.score_json_cache import ScoreJsonCache
+from app.cache.search_result_cache import SearchResultCache
+from app.database.database import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_engine,
+    engine,
+)
+from app.jobs.mass_write_jobs import MassWriteJob, MassWriteJobs
+from app.metrics.query_budget import QueryBudget, parse_route_budgets
+from app.metrics.request_metrics import RequestMetrics
+from app.metrics.sql_usage import install_sql_metrics
+from app.repositories.async_baseball_player_score_repository import (
+    AsyncBaseballPlayerScoreRepository,
+)
 from app.repositories.baseball_player_score_repository import (
     BaseballPlayerScoreRepository,
 )
+from app.repositories.score_summary_repository import ScoreSummaryRepository
+from app.services.async_score_service import AsyncScoreService
 from app.services.score_service import ScoreService
+from app.services.score_summary_service import ScoreSummaryService
+from app.settings import (
+    ANALYTICS_ENABLED,
+    COUNT_CACHE_MAX_ENTRIES,
+    COUNT_CACHE_TTL_SECONDS,
+    ENTITY_CACHE_ENABLED,
+    ENTITY_CACHE_MAX_ENTRIES,
+    ENTITY_CACHE_TTL_SECONDS,
+    MASS_WRITE_CHUNK_IDS,
+    MASS_WRITE_MAX_FINISHED_JOBS,
+    MASS_WRITE_PAUSE_MS,
+    METRICS_ENABLED,
+    QUERY_BUDGET_DEFAULT,
+    QUERY_BUDGET_STRICT,
+    QUERY_BUDGETS,
+    QUERY_REPEAT_LIMIT,
+    SCORE_JSON_CACHE_ENABLED,
+    SCORE_JSON_CACHE_MAX_ENTRIES,
+    SCORE_JSON_CACHE_TTL_SECONDS,
+    SEARCH_CACHE_ENABLED,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL_SECONDS,
+    SLOW_QUERY_MS,
+)
+
+# Caches are shared by every request so they survive between requests.
+score_count_cache = CountCache(
+    max_entries=COUNT_CACHE_MAX_ENTRIES,
+    ttl_seconds=COUNT_CACHE_TTL_SECONDS
+)
+score_entity_cache = (
+    ScoreEntityCache(
+        max_entries=ENTITY_CACHE_MAX_ENTRIES,
+        ttl_seconds=ENTITY_CACHE_TTL_SECONDS
+    )
+    if ENTITY_CACHE_ENABLED
+    else None
+)
+score_search_cache = (
+    SearchResultCache(
+        max_entries=SEARCH_CACHE_MAX_ENTRIES,
+        ttl_seconds=SEARCH_CACHE_TTL_SECONDS
+    )
+    if SEARCH_CACHE_ENABLED
+    else None
+)
+
+score_json_cache = (
+    ScoreJsonCache(
+        max_entries=SCORE_JSON_CACHE_MAX_ENTRIES,
+        ttl_seconds=SCORE_JSON_CACHE_TTL_SECONDS
+    )
+    if SCORE_JSON_CACHE_ENABLED
+    else None
+)
+
+# Filled by the metrics middleware, None unless metrics are enabled.
+request_metrics = None
+query_budget = None
+if METRICS_ENABLED:
+    request_metrics = RequestMetrics()
+    query_budget = QueryBudget(
+        route_budgets=parse_route_budgets(QUERY_BUDGETS),
+        default_budget=QUERY_BUDGET_DEFAULT,
+        repeat_limit=QUERY_REPEAT_LIMIT,
+        slow_query_seconds=(
+            SLOW_QUERY_MS / 1000 if SLOW_QUERY_MS is not None else None
+        ),
+        strict=QUERY_BUDGET_STRICT
+    )
+    install_sql_metrics(engine, query_budget)
+    if async_engine is not None:
+        install_sql_metrics(async_engine.sync_engine, query_budget)
+
+# Only created when enabled so numpy stays an optional dependency.
+score_column_store = None
+if ANALYTICS_ENABLED:
+    from app.analytics.score_column_store import ScoreColumnStore
+
+    score_column_store = ScoreColumnStore()
+
+# Notified after every committed score write.
+score_listeners = [
+    listener
+    for listener in (
+        score_entity_cache,
+        score_search_cache,
+        score_column_store,
+    )
+    if listener is not None
+]
+
+
+def run_mass_write_job(job: MassWriteJob) -> None:
+    # Runs on the job thread, with a session of its own.
+    db = SessionLocal()
+    try:
+        ScoreService(
+            BaseballPlayerScoreRepository(
+                db,
+                count_cache=score_count_cache,
+                listeners=score_listeners
+            )
+        ).run_mass_write(
+            job,
+            chunk_ids=MASS_WRITE_CHUNK_IDS,
+            pause_seconds=MASS_WRITE_PAUSE_MS / 1000
+        )
+    finally:
+        db.close()
+
+
+mass_write_jobs = MassWriteJobs(
+    run_mass_write_job,
+    max_finished_jobs=MASS_WRITE_MAX_FINISHED_JOBS
+)
 
 
 def get_db():
@@ -18,11 +153,62 @@ def get_db():
         db.close()
 
 
+def get_score_column_store():
+    return score_column_store
+
+
+def get_request_metrics():
+    return request_metrics
+
+
+def get_mass_write_jobs():
+    return mass_write_jobs
+
+
 def get_score_repository(db: Session = Depends(get_db)):
-    return BaseballPlayerScoreRepository(db)
+    return BaseballPlayerScoreRepository(
+        db,
+        count_cache=score_count_cache,
+        listeners=score_listeners
+    )
 
 
 def get_score_service(
     repository: BaseballPlayerScoreRepository = Depends(get_score_repository),
 ):
-    return ScoreService(repository)
+    return ScoreService(
+        repository,
+        entity_cache=score_entity_cache,
+        search_cache=score_search_cache,
+        json_cache=score_json_cache
+    )
+
+
+def get_score_summary_service(db: Session = Depends(get_db)):
+    return ScoreSummaryService(ScoreSummaryRepository(db))
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_async_score_repository(db: AsyncSession = Depends(get_async_db)):
+    return AsyncBaseballPlayerScoreRepository(
+        db,
+        count_cache=score_count_cache,
+        listeners=score_listeners
+    )
+
+
+def get_async_score_service(
+    repository: AsyncBaseballPlayerScoreRepository = Depends(
+        get_async_score_repository
+    ),
+):
+    return AsyncScoreService(
+        repository,
+        entity_cache=score_entity_cache,
+        search_cache=score_search_cache,
+        json_cache=score_json_cache
+    )
@@ -0,0 +1,9 @@
+# Standard library imports
+from enum import Enum
+
+
+class BatchWriteMode(Enum):
+    # Nothing is written unless every item succeeds.
+    ATOMIC = 'atomic'
+    # Items that succeed are written, the others are reported.
+    BEST_EFFORT = 'best_effort'
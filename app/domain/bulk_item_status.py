@@ -0,0 +1,14 @@
+# Standard library imports
+from enum import Enum
+
+
+class BulkItemStatus(Enum):
+    CREATED = 'created'
+    UPDATED = 'updated'
+    DELETED = 'deleted'
+    NOT_FOUND = 'not_found'
+    CONFLICT = 'conflict'
+    INVALID = 'invalid'
+    ERROR = 'error'
+    # Valid item of an atomic batch that another item made fail.
+    ROLLED_BACK = 'rolled_back'
@@ -0,0 +1,7 @@
+# Standard library imports
+from enum import Enum
+
+
+class MassWriteKind(Enum):
+    DELETE = 'delete'
+    UPDATE = 'update'
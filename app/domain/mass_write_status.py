@@ -0,0 +1,10 @@
+# Standard library imports
+from enum import Enum
+
+
+class MassWriteStatus(Enum):
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    # Stopped on request, the chunks already written stay written.
+    CANCELLED = 'cancelled'
+    FAILED = 'failed'
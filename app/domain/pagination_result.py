@@ -1,5 +1,5 @@
 # Standard library imports
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -8,7 +8,11 @@ class PaginationResult(Generic[T]):
     def __init__(
         self,
         items: List[T],
-        total_items: int
+        total_items: Optional[int],
+        has_more: bool = False,
+        total_is_estimate: bool = False
     ):
         self.items = items
         self.total_items = total_items
+        self.has_more = has_more
+        self.total_is_estimate = total_is_estimate
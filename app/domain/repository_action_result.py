@@ -32,6 +32,10 @@ class RepositoryActionResult(Generic[T]):
     def is_error(self):
         return self.status == RepositoryActionStatus.ERROR
 
+    @property
+    def is_conflict(self):
+        return self.status == RepositoryActionStatus.CONFLICT
+
     @classmethod
     def not_found(cls, message: str):
         return cls(
@@ -39,6 +43,13 @@ class RepositoryActionResult(Generic[T]):
             status=RepositoryActionStatus.NOT_FOUND
         )
 
+    @classmethod
+    def conflict(cls, message: str):
+        return cls(
+            error_message=message,
+            status=RepositoryActionStatus.CONFLICT
+        )
+
     @classmethod
     def ok(cls, entity: T):
         return cls(entity=entity, status=RepositoryActionStatus.OK)
@@ -6,3 +6,4 @@ class RepositoryActionStatus(Enum):
     OK = 'Ok'
     NOT_FOUND = 'NotFound'
     ERROR = 'Error'
+    CONFLICT = 'Conflict'
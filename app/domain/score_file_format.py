@@ -0,0 +1,28 @@
+# Standard library imports
+from enum import Enum
+from typing import Optional
+
+
+class ScoreFileFormat(Enum):
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+
+    @property
+    def media_type(self) -> str:
+        if self == ScoreFileFormat.CSV:
+            return 'text/csv'
+        return 'application/x-ndjson'
+
+    @classmethod
+    def from_filename(
+        cls,
+        filename: Optional[str]
+    ) -> Optional["ScoreFileFormat"]:
+        if not filename:
+            return None
+        extension = filename.rsplit('.', 1)[-1].lower()
+        if extension == 'csv':
+            return cls.CSV
+        if extension in ('ndjson', 'jsonl'):
+            return cls.NDJSON
+        return None
@@ -0,0 +1,62 @@
+# Standard library imports
+import string
+from datetime import date
+from typing import Any, Iterable, NamedTuple, Optional
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def fold_name_case(value: str) -> str:
+    """
+    Lower the ASCII letters of a player name or name query, leaving other
+    characters as they are. This is the folding of SQLite's lower() and
+    LIKE, so name searches match the same names in SQL and in Python.
+    """
+    return value.translate(_ASCII_LOWER)
+
+
+class ScoreSearchFilter(NamedTuple):
+    player_name: Optional[str] = None
+    player_team: Optional[str] = None
+    min_score: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    # Words that must all appear in the player name, in any ASCII case.
+    name_query: Optional[str] = None
+
+    def matches(self, score: Any, changed_fields: Iterable[str] = ()) -> bool:
+        """
+        Tell whether a score row could be part of the filtered set.
+
+        Fields listed in `changed_fields` are considered unknown (the row may
+        have held any value before an update), so they never exclude it.
+        """
+        changed_fields = set(changed_fields)
+
+        def unknown(field: str) -> bool:
+            return field in changed_fields
+
+        if self.player_name is not None and not unknown('player_name'):
+            if score.player_name != self.player_name:
+                return False
+        if self.name_query is not None and not unknown('player_name'):
+            player_name = fold_name_case(score.player_name)
+            if any(
+                term not in player_name
+                for term in fold_name_case(self.name_query).split()
+            ):
+                return False
+        if self.player_team is not None and not unknown('player_team'):
+            if score.player_team != self.player_team:
+                return False
+        if self.min_score is not None and not unknown('score'):
+            if score.score < self.min_score:
+                return False
+        if not unknown('match_date'):
+            if (self.start_date is not None
+                    and score.match_date < self.start_date):
+                return False
+            if (self.end_date is not None
+                    and score.match_date > self.end_date):
+                return False
+        return True
@@ -0,0 +1,17 @@
+# Standard library imports
+from enum import Enum
+
+
+class ScoreSortOrder(Enum):
+    MATCH_DATE_ASC = 'match_date'
+    MATCH_DATE_DESC = '-match_date'
+    SCORE_ASC = 'score'
+    SCORE_DESC = '-score'
+
+    @property
+    def field_name(self) -> str:
+        return self.value.lstrip('-')
+
+    @property
+    def is_descending(self) -> bool:
+        return self.value.startswith('-')
@@ -141,5 +141,10 @@ class ServiceResult(Generic[T]):
                 or repository_action_result.error_message
             )
             return cls.error(error_message=error_message)
+        elif (repository_action_result.status
+                == RepositoryActionStatus.CONFLICT):
+            return cls.conflict(
+                error_message=message or repository_action_result.error_message
+            )
         else:
             raise ValueError("Invalid RepositoryActionStatus")
@@ -0,0 +1,8 @@
+# Standard library imports
+from enum import Enum
+
+
+class TotalCountMode(Enum):
+    NONE = 'false'
+    EXACT = 'exact'
+    ESTIMATE = 'estimate'
@@ -0,0 +1,44 @@
+# Standard library imports
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any, Tuple
+
+# Local application/library specific imports
+from app.domain.score_sort_order import ScoreSortOrder
+
+
+def encode_cursor(sort_order: ScoreSortOrder, last_item: Any) -> str:
+    key = getattr(last_item, sort_order.field_name)
+    if isinstance(key, date):
+        key = key.isoformat()
+    payload = json.dumps(
+        [sort_order.value, key, last_item.id],
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_order: ScoreSortOrder) -> Tuple[Any, int]:
+    """
+    Decode a cursor produced by encode_cursor into the (sort key, id) pair
+    to seek after. Raises ValueError if the cursor is malformed or was
+    issued for another sort order.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, key, last_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode())
+        )
+        if sort_order.field_name == 'match_date':
+            key = date.fromisoformat(key)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Malformed cursor")
+
+    if sort_value != sort_order.value:
+        raise ValueError("Cursor does not match the requested sort order")
+    if not isinstance(last_id, int) or not isinstance(key, (date, int)):
+        raise ValueError("Malformed cursor")
+
+    return key, last_id
@@ -0,0 +1,59 @@
+# Standard library imports
+import hashlib
+from typing import Dict, Optional
+
+# Related third-party imports
+from fastapi import Response, status
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Strong ETag of a response body. It follows the data actually served,
+    whichever process or tool wrote it, without tracking writes.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Tell whether an If-None-Match header value matches `etag`, using the
+    weak comparison RFC 9110 prescribes for this header. "*" matches any
+    etag, only call this for a resource that exists.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def cache_headers(etag: str, cache_control: str) -> Dict[str, str]:
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def conditional_json_response(
+    body: bytes,
+    if_none_match: Optional[str],
+    cache_control: str
+) -> Response:
+    """
+    Response with already encoded JSON, skipping response_model
+    validation, or 304 without a body when the client holds it already.
+    """
+    headers = cache_headers(body_etag(body), cache_control)
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers
+        )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers
+    )
@@ -0,0 +1,71 @@
+# Standard library imports
+import csv
+import io
+import json
+from typing import Any, Iterable, Iterator
+
+# Local application/library specific imports
+from app.domain.score_file_format import ScoreFileFormat
+
+EXPORT_COLUMNS = ('id', 'player_name', 'player_team', 'score', 'match_date')
+
+
+def write_export_chunks(
+    rows: Iterable[Any],
+    file_format: ScoreFileFormat,
+    chunk_size: int
+) -> Iterator[bytes]:
+    """
+    Encode score rows lazily, yielding one bytes chunk per `chunk_size`
+    rows so only a chunk is held in memory at a time.
+    """
+    if file_format == ScoreFileFormat.CSV:
+        return _write_csv_chunks(rows, chunk_size)
+    return _write_ndjson_chunks(rows, chunk_size)
+
+
+def _write_csv_chunks(
+    rows: Iterable[Any],
+    chunk_size: int
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    pending = 0
+    for row in rows:
+        writer.writerow(
+            ['' if value is None else value for value in _values(row)]
+        )
+        pending += 1
+        if pending == chunk_size:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    # Always flush, an empty export still has its header.
+    yield buffer.getvalue().encode()
+
+
+def _write_ndjson_chunks(
+    rows: Iterable[Any],
+    chunk_size: int
+) -> Iterator[bytes]:
+    lines = []
+    for row in rows:
+        values = dict(zip(EXPORT_COLUMNS, _values(row)))
+        lines.append(json.dumps(values, separators=(',', ':')))
+        if len(lines) == chunk_size:
+            yield ('\n'.join(lines) + '\n').encode()
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode()
+
+
+def _values(row: Any) -> tuple:
+    return (
+        row.id,
+        row.player_name,
+        row.player_team,
+        row.score,
+        row.match_date.isoformat(),
+    )
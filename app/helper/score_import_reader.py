@@ -0,0 +1,59 @@
+# Standard library imports
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional
+
+# Local application/library specific imports
+from app.domain.score_file_format import ScoreFileFormat
+
+
+class ImportRow(NamedTuple):
+    line_number: int
+    values: Optional[Dict[str, Any]]
+    # Set instead of values when the line could not be parsed.
+    error_message: Optional[str] = None
+
+
+def read_import_rows(
+    lines: Iterable[str],
+    file_format: ScoreFileFormat
+) -> Iterator[ImportRow]:
+    """
+    Lazily parse score rows from an iterable of text lines, so files of any
+    size are read with constant memory.
+    """
+    if file_format == ScoreFileFormat.CSV:
+        return _read_csv_rows(lines)
+    return _read_ndjson_rows(lines)
+
+
+def _read_csv_rows(lines: Iterable[str]) -> Iterator[ImportRow]:
+    reader = csv.DictReader(lines)
+    for values in reader:
+        if None in values:
+            yield ImportRow(
+                reader.line_num,
+                None,
+                "Row has more fields than the header"
+            )
+            continue
+        # Empty cells mean "not provided" so optional fields stay optional.
+        yield ImportRow(
+            reader.line_num,
+            {key: value for key, value in values.items() if value != ''}
+        )
+
+
+def _read_ndjson_rows(lines: Iterable[str]) -> Iterator[ImportRow]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except ValueError as e:
+            yield ImportRow(line_number, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(values, dict):
+            yield ImportRow(line_number, None, "Line is not a JSON object")
+            continue
+        yield ImportRow(line_number, values)
@@ -0,0 +1,36 @@
+# Standard library imports
+from typing import Any, Iterable
+
+# Related third-party imports
+from pydantic import TypeAdapter
+
+# Local application/library specific imports
+from app.schemas.pagination_response import Pagination
+from app.schemas.score_dto import ScoreDTO
+
+_SCORE_DTO = TypeAdapter(ScoreDTO)
+
+
+def encode_score_json(score: Any) -> bytes:
+    """
+    Encode a score, DTO, ORM entity or Core row, as the JSON of ScoreDTO.
+    """
+    if not isinstance(score, ScoreDTO):
+        score = ScoreDTO.model_validate(score)
+    return _SCORE_DTO.dump_json(score)
+
+
+def join_score_page(
+    fragments: Iterable[bytes],
+    pagination: Pagination
+) -> bytes:
+    """
+    Assemble the JSON of a PaginationResponse from already encoded items.
+    """
+    return b"".join((
+        b'{"items":[',
+        b",".join(fragments),
+        b'],"pagination":',
+        pagination.model_dump_json().encode(),
+        b"}",
+    ))
@@ -0,0 +1,181 @@
+# Standard library imports
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+# Local application/library specific imports
+from app.domain.mass_write_kind import MassWriteKind
+from app.domain.mass_write_status import MassWriteStatus
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.schemas.mass_write_schema import MassWriteJobDTO, ScoreFilter
+
+
+class MassWriteJob:
+    """
+    Progress of a filter-based delete or update of many scores, written
+    by the thread running it and read by the requests polling it.
+    """
+
+    def __init__(
+        self,
+        kind: MassWriteKind,
+        score_filter: ScoreFilter,
+        updated_data: Optional[Dict[str, Any]] = None,
+        shift_days: int = 0
+    ):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.score_filter = score_filter
+        self.search_filter = ScoreSearchFilter(**score_filter.model_dump())
+        self.updated_data = updated_data or {}
+        self.shift_days = shift_days
+        self.created_at = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+        self._cancel_requested = threading.Event()
+        self._finished = threading.Event()
+        self._status = MassWriteStatus.RUNNING
+        self._first_id: Optional[int] = None
+        self._last_id: Optional[int] = None
+        self._ids_done = 0
+        self._chunks = 0
+        self._rows_written = 0
+        self._rows_skipped = 0
+        self._error_message: Optional[str] = None
+        self._finished_at: Optional[datetime] = None
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    @property
+    def is_finished(self) -> bool:
+        return self._finished.is_set()
+
+    def cancel(self) -> bool:
+        """
+        Ask the job to stop before its next chunk. Return False when it
+        already finished.
+        """
+        with self._lock:
+            if self.is_finished:
+                return False
+            self._cancel_requested.set()
+            return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def start(self, first_id: Optional[int], last_id: Optional[int]) -> None:
+        with self._lock:
+            self._first_id = first_id
+            self._last_id = last_id
+
+    def record_chunk(
+        self,
+        ids: int,
+        rows_written: int,
+        rows_skipped: int = 0
+    ) -> None:
+        """
+        Count a committed chunk covering `ids` score IDs.
+        """
+        with self._lock:
+            self._ids_done += ids
+            self._chunks += 1
+            self._rows_written += rows_written
+            self._rows_skipped += rows_skipped
+
+    def finish(
+        self,
+        status: MassWriteStatus,
+        error_message: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            self._status = status
+            self._error_message = error_message
+            self._finished_at = datetime.now(timezone.utc)
+            self._finished.set()
+
+    def snapshot(self) -> MassWriteJobDTO:
+        with self._lock:
+            if self._status == MassWriteStatus.COMPLETED:
+                progress = 1.0
+            elif self._first_id is None:
+                progress = 0.0
+            else:
+                progress = (
+                    self._ids_done / (self._last_id - self._first_id + 1)
+                )
+            return MassWriteJobDTO(
+                id=self.id,
+                kind=self.kind,
+                status=self._status,
+                filter=self.score_filter,
+                first_id=self._first_id,
+                last_id=self._last_id,
+                progress=progress,
+                chunks=self._chunks,
+                rows_written=self._rows_written,
+                rows_skipped=self._rows_skipped,
+                cancel_requested=self.cancel_requested,
+                error_message=self._error_message,
+                created_at=self.created_at,
+                finished_at=self._finished_at
+            )
+
+
+class MassWriteJobs:
+    """
+    Runs mass write jobs on background threads and keeps them for polling:
+    every running job, and the `max_finished_jobs` most recent finished
+    ones. Jobs live in memory, a restart interrupts the running ones after
+    their last committed chunk.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[MassWriteJob], None],
+        max_finished_jobs: int = 100
+    ):
+        self.run_job = run_job
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: "OrderedDict[str, MassWriteJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, job: MassWriteJob) -> MassWriteJob:
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        threading.Thread(
+            target=self._run,
+            args=(job,),
+            name=f"mass-write-{job.id}",
+            daemon=True
+        ).start()
+        return job
+
+    def get(self, job_id: str) -> Optional[MassWriteJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[MassWriteJob]:
+        # Most recent first.
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def _run(self, job: MassWriteJob) -> None:
+        try:
+            self.run_job(job)
+        except Exception as e:
+            # TODO - Log exception
+            job.finish(MassWriteStatus.FAILED, str(e))
+
+    def _prune(self) -> None:
+        finished = [
+            job_id for job_id, job in self._jobs.items() if job.is_finished
+        ]
+        excess = len(finished) - self.max_finished_jobs
+        for job_id in finished[:max(excess, 0)]:
+            del self._jobs[job_id]
@@ -7,35 +7,93 @@ from fastapi import FastAPI
 
 # Local application/library specific imports
 # Database configuration
-from app.database.database import SessionLocal, engine
+from app.database.database import SessionLocal, engine, engine_profile
+from app.database.engine_profile import describe_engine
+from app.database.schema_migrations import upgrade_schema
 
 # Database seeder
-from app.database.database_seeder import seed_data
+from app.database.database_seeder import (
+    seed_config_from_settings,
+    seed_data,
+    seed_synthetic_data,
+)
+
+# Column copy of the scores and request metrics, None unless enabled
+from app.dependencies import (
+    query_budget,
+    request_metrics,
+    score_column_store,
+)
+
+# Middlewares
+from app.metrics.metrics_middleware import MetricsMiddleware
 
 # ORM models
 from app.models.baseball_player_score import BaseballPlayerScore
 
 # API routers
-from app.routers import baseball_scores_router
+from app.routers import (
+    async_baseball_scores_router,
+    baseball_scores_router,
+    cache_router,
+    mass_write_router,
+    metrics_router,
+    score_summary_router,
+)
+from app.settings import ANALYTICS_ENABLED, DATABASE_ASYNC, SEED_ROWS
 
 load_dotenv()
 
 app = FastAPI()
 
+if request_metrics is not None:
+    # Outermost, so the time spent in other middlewares is measured too.
+    app.add_middleware(
+        MetricsMiddleware,
+        metrics=request_metrics,
+        query_budget=query_budget
+    )
+
 # Include routers.
+if DATABASE_ASYNC:
+    # Registered first so its handlers serve the routes both routers define.
+    app.include_router(async_baseball_scores_router.router)
+# Ahead of baseball_scores_router so "jobs" is not read as a score ID.
+app.include_router(mass_write_router.router)
 app.include_router(baseball_scores_router.router)
+app.include_router(score_summary_router.router)
+app.include_router(cache_router.router)
+if request_metrics is not None:
+    app.include_router(metrics_router.router)
+if ANALYTICS_ENABLED:
+    # Imported here, numpy is only required when analytics are enabled.
+    from app.routers import analytics_router
+
+    app.include_router(analytics_router.router)
 
 
 @app.on_event("startup")
 def on_startup():
-    # Create database tables
-    BaseballPlayerScore.metadata.create_all(bind=engine)
+    print("DATABASE:", describe_engine(engine, engine_profile))
+    # Create or upgrade database tables
+    upgrade_schema(engine)
     print("RUN_SEEDER:", os.getenv('RUN_SEEDER', 'false').lower())
     if os.getenv('RUN_SEEDER', 'false').lower() == 'true':
         db = SessionLocal()
         try:
             # Check if any data exists
-            if db.query(BaseballPlayerScore).first() is None:
-                seed_data(db)
+            is_empty = db.query(BaseballPlayerScore).first() is None
         finally:
             db.close()
+        if is_empty and SEED_ROWS > 0:
+            loaded = seed_synthetic_data(engine, seed_config_from_settings())
+            print("SEEDED:", loaded, "synthetic scores")
+        elif is_empty:
+            db = SessionLocal()
+            try:
+                seed_data(db)
+            finally:
+                db.close()
+    if score_column_store is not None:
+        score_column_store.load(engine)
+        print("ANALYTICS:", score_column_store.stats().model_dump_json())
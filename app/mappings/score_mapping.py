@@ -1,6 +1,20 @@
+# Standard library imports
+from typing import Iterable, List
+
+# Related third-party imports
+from pydantic import TypeAdapter
+
 # Local application/library specific imports
 from app.schemas.score_dto import ScoreDTO
 
+_SCORE_DTO_LIST = TypeAdapter(List[ScoreDTO])
+
 
 def convert_score_entity_to_dto(model_instance):
-    return ScoreDTO.model_validate(model_instance.__dict__)
+    # Reads attributes so ORM entities and Core result rows both map.
+    return ScoreDTO.model_validate(model_instance)
+
+
+def convert_score_rows_to_dtos(rows: Iterable) -> List[ScoreDTO]:
+    # One validator call for the whole page instead of one per row.
+    return _SCORE_DTO_LIST.validate_python(rows, from_attributes=True)
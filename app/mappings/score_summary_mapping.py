@@ -0,0 +1,10 @@
+# Local application/library specific imports
+from app.schemas.score_total_dto import PlayerTotalDTO, TeamTotalDTO
+
+
+def convert_player_total_to_dto(row):
+    return PlayerTotalDTO.model_validate(row)
+
+
+def convert_team_total_to_dto(row):
+    return TeamTotalDTO.model_validate(row)
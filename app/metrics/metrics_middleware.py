@@ -0,0 +1,66 @@
+# Standard library imports
+import time
+from typing import Optional
+
+# Local application/library specific imports
+from app.metrics.query_budget import QueryBudget
+from app.metrics.request_metrics import UNMATCHED_ROUTE, RequestMetrics
+from app.metrics.sql_usage import SqlUsage, current_sql_usage
+
+
+class MetricsMiddleware:
+    """
+    Plain ASGI middleware recording the latency, status code and SQL usage
+    of each HTTP request under its route template, e.g.
+    `/scores/{score_id}`. Streamed responses are timed until their last
+    chunk is sent.
+
+    With a `query_budget`, each request is checked against it once done.
+    """
+
+    def __init__(
+        self,
+        app,
+        metrics: RequestMetrics,
+        query_budget: Optional[QueryBudget] = None
+    ):
+        self.app = app
+        self.metrics = metrics
+        self.query_budget = query_budget
+        self._record_queries = (
+            query_budget is not None and query_budget.records_queries
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        # Reported when the application fails before sending a response.
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        sql_usage = SqlUsage(record_queries=self._record_queries)
+        token = current_sql_usage.set(sql_usage)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            seconds = time.perf_counter() - started
+            current_sql_usage.reset(token)
+            # Set by the router on the scope once a route matched.
+            route = getattr(scope.get('route'), 'path', UNMATCHED_ROUTE)
+            self.metrics.observe(
+                scope['method'],
+                route,
+                status,
+                seconds,
+                sql_usage
+            )
+        if self.query_budget is not None:
+            self.query_budget.check_request(scope['method'], route, sql_usage)
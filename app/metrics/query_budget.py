@@ -0,0 +1,181 @@
+# Standard library imports
+import logging
+from collections import Counter
+from itertools import groupby
+from typing import Any, Dict, List, Optional
+
+# Local application/library specific imports
+from app.metrics.sql_usage import SqlUsage
+
+logger = logging.getLogger(__name__)
+
+# Longer statements are cut in the logs, the bind shape is kept whole.
+MAX_LOGGED_SQL_LENGTH = 500
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request breaks its query budget."""
+
+
+class QueryBudget:
+    """
+    Limits on the SQL a request may run: a number of statements per route,
+    a number of runs of the same statement (a repeated statement is the
+    mark of an N+1 query pattern) and a duration per statement.
+
+    Violations are logged with the statements and the shape of their bind
+    parameters, never their values. In strict mode, meant for tests, the
+    request that broke the budget also raises QueryBudgetExceeded, as does
+    a slow statement run outside of a request.
+    """
+
+    def __init__(
+        self,
+        route_budgets: Optional[Dict[str, int]] = None,
+        default_budget: Optional[int] = None,
+        repeat_limit: Optional[int] = None,
+        slow_query_seconds: Optional[float] = None,
+        strict: bool = False
+    ):
+        # Keyed by "<METHOD> <route template>", e.g. "GET /scores/{score_id}".
+        self.route_budgets = dict(route_budgets or {})
+        self.default_budget = default_budget
+        self.repeat_limit = repeat_limit
+        self.slow_query_seconds = slow_query_seconds
+        self.strict = strict
+
+    @property
+    def records_queries(self) -> bool:
+        """Whether requests must keep their statements for the checks."""
+        return bool(
+            self.route_budgets
+            or self.default_budget is not None
+            or self.repeat_limit is not None
+        )
+
+    def budget_for(self, method: str, route: str) -> Optional[int]:
+        return self.route_budgets.get(f"{method} {route}", self.default_budget)
+
+    def check_statement(
+        self,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        seconds: float,
+        sql_usage: Optional[SqlUsage]
+    ) -> None:
+        if (
+            self.slow_query_seconds is None
+            or seconds <= self.slow_query_seconds
+        ):
+            return
+        message = (
+            f"Slow SQL statement: {seconds * 1000:.1f} ms, over "
+            f"{self.slow_query_seconds * 1000:.1f} ms\n"
+            f"{describe_query(statement, parameters, executemany)}"
+        )
+        logger.warning(message)
+        if sql_usage is not None:
+            sql_usage.slow_queries.append(message)
+        elif self.strict:
+            raise QueryBudgetExceeded(message)
+
+    def check_request(
+        self,
+        method: str,
+        route: str,
+        sql_usage: SqlUsage
+    ) -> None:
+        """
+        Log the budget violations of a finished request, and raise them in
+        strict mode along with its slow statements.
+        """
+        violations: List[str] = []
+        queries = sql_usage.queries or []
+
+        budget = self.budget_for(method, route)
+        if budget is not None and sql_usage.statements > budget:
+            violations.append(
+                f"{method} {route} ran {sql_usage.statements} SQL "
+                f"statements, over its budget of {budget}:\n" + '\n'.join(
+                    describe_query(*query) for query in queries
+                )
+            )
+
+        if self.repeat_limit is not None:
+            runs = Counter(statement for statement, _, _ in queries)
+            for statement, count in runs.items():
+                if count > self.repeat_limit:
+                    violations.append(
+                        f"{method} {route} ran the same SQL statement "
+                        f"{count} times, possible N+1 queries:\n"
+                        f"{statement}"
+                    )
+
+        for violation in violations:
+            logger.warning(violation)
+        if self.strict and (violations or sql_usage.slow_queries):
+            raise QueryBudgetExceeded(
+                '\n\n'.join(sql_usage.slow_queries + violations)
+            )
+
+
+def parse_route_budgets(value: str) -> Dict[str, int]:
+    """
+    Parse "GET /scores=2, POST /scores/bulk=10" into route budgets.
+
+    Raises ValueError for an entry without a method, route and count.
+    """
+    budgets = {}
+    for entry in filter(None, (part.strip() for part in value.split(','))):
+        route, separator, count = entry.rpartition('=')
+        method, _, path = route.strip().partition(' ')
+        if not separator or not path.strip() or not count.strip().isdigit():
+            raise ValueError(
+                f"Invalid query budget [{entry}], expected "
+                "'<METHOD> <route>=<statements>'."
+            )
+        budgets[f"{method.upper()} {path.strip()}"] = int(count)
+    return budgets
+
+
+def describe_query(statement: str, parameters: Any, executemany: bool) -> str:
+    """The statement with the shape of its bind parameters."""
+    sql = ' '.join(statement.split())
+    if len(sql) > MAX_LOGGED_SQL_LENGTH:
+        sql = sql[:MAX_LOGGED_SQL_LENGTH] + '...'
+    # Batches of "insertmanyvalues" are flagged executemany but bind a
+    # single flat row.
+    if (
+        executemany
+        and parameters
+        and isinstance(parameters[0], (dict, list, tuple))
+    ):
+        shape = f"{len(parameters)} x {bind_shape(parameters[0])}"
+    else:
+        shape = bind_shape(parameters)
+    return f"  {sql}\n    binds: {shape}"
+
+
+def bind_shape(parameters: Any) -> str:
+    """
+    Types of the bind parameters without their values, e.g.
+    `(str, int x 3)` for one string followed by three integers.
+    """
+    if isinstance(parameters, dict):
+        return '{' + ', '.join(
+            f"{name}: {type(value).__name__}"
+            for name, value in parameters.items()
+        ) + '}'
+    if isinstance(parameters, (list, tuple)):
+        runs = [
+            (name, len(list(group)))
+            for name, group in groupby(
+                type(value).__name__ for value in parameters
+            )
+        ]
+        return '(' + ', '.join(
+            name if count == 1 else f"{name} x {count}"
+            for name, count in runs
+        ) + ')'
+    return type(parameters).__name__
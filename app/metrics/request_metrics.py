@@ -0,0 +1,159 @@
+# Standard library imports
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+# Local application/library specific imports
+from app.metrics.sql_usage import SqlUsage
+
+# Upper bounds in seconds of the request latency histogram buckets.
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+    2.5, 5.0, 10.0,
+)
+
+# Route label of requests no route matched, so unknown paths cannot grow
+# the number of series.
+UNMATCHED_ROUTE = 'unmatched'
+
+RouteKey = Tuple[str, str]
+
+
+class _RouteSeries:
+    __slots__ = (
+        'bucket_counts',
+        'count',
+        'seconds',
+        'statuses',
+        'sql_statements',
+        'sql_seconds',
+    )
+
+    def __init__(self):
+        # One count per bucket plus the +Inf one, not cumulative.
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        # Requests by status code.
+        self.statuses: Dict[int, int] = {}
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+
+    def copy(self) -> '_RouteSeries':
+        copy = _RouteSeries()
+        copy.bucket_counts = list(self.bucket_counts)
+        copy.count = self.count
+        copy.seconds = self.seconds
+        copy.statuses = dict(self.statuses)
+        copy.sql_statements = self.sql_statements
+        copy.sql_seconds = self.sql_seconds
+        return copy
+
+
+class RequestMetrics:
+    """
+    Latency histogram, status counts and SQL usage per route, rendered in
+    the Prometheus text exposition format.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[RouteKey, _RouteSeries] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        sql_usage: SqlUsage
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            series = self._routes.get(key)
+            if series is None:
+                series = self._routes[key] = _RouteSeries()
+            series.bucket_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            series.count += 1
+            series.seconds += seconds
+            series.sql_statements += sql_usage.statements
+            series.sql_seconds += sql_usage.seconds
+            statuses = series.statuses
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def render(self) -> str:
+        with self._lock:
+            routes = sorted(
+                (key, series.copy()) for key, series in self._routes.items()
+            )
+
+        lines: List[str] = [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), series in routes:
+            cumulative = 0
+            for bound, bucket_count in zip(
+                LATENCY_BUCKETS + (None,),
+                series.bucket_counts
+            ):
+                cumulative += bucket_count
+                labels = _labels(
+                    method=method,
+                    route=route,
+                    le='+Inf' if bound is None else repr(bound)
+                )
+                lines.append(
+                    f"http_request_duration_seconds_bucket{labels} "
+                    f"{cumulative}"
+                )
+            labels = _labels(method=method, route=route)
+            lines += [
+                f"http_request_duration_seconds_sum{labels} {series.seconds}",
+                f"http_request_duration_seconds_count{labels} {series.count}",
+            ]
+
+        lines += [
+            "# HELP http_requests_total Requests by route and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route), series in routes:
+            for status, count in sorted(series.statuses.items()):
+                labels = _labels(
+                    method=method,
+                    route=route,
+                    status=str(status)
+                )
+                lines.append(f"http_requests_total{labels} {count}")
+
+        for name, description, field in (
+            (
+                'http_request_sql_statements_total',
+                "SQL statements run by requests.",
+                'sql_statements',
+            ),
+            (
+                'http_request_sql_seconds_total',
+                "Time spent running the SQL statements of requests.",
+                'sql_seconds',
+            ),
+        ):
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            for (method, route), series in routes:
+                labels = _labels(method=method, route=route)
+                lines.append(f"{name}{labels} {getattr(series, field)}")
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(**labels: str) -> str:
+    return '{' + ','.join(
+        f'{name}="{_escape(value)}"' for name, value in labels.items()
+    ) + '}'
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+    )
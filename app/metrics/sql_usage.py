@@ -0,0 +1,70 @@
+# Standard library imports
+import time
+from contextvars import ContextVar
+from typing import Any, List, Optional, Tuple
+
+# Related third-party imports
+from sqlalchemy import Engine, event
+
+# A statement as run on the cursor: SQL, parameters and executemany flag.
+RecordedQuery = Tuple[str, Any, bool]
+
+
+class SqlUsage:
+    """
+    SQL statements run on behalf of one request and their total time. The
+    statements themselves are only kept when `record_queries` is set.
+    """
+    __slots__ = ('statements', 'seconds', 'queries', 'slow_queries')
+
+    def __init__(self, record_queries: bool = False):
+        self.statements = 0
+        self.seconds = 0.0
+        self.queries: Optional[List[RecordedQuery]] = (
+            [] if record_queries else None
+        )
+        # Descriptions of the statements slower than the query budget allows.
+        self.slow_queries: List[str] = []
+
+
+# Set by the metrics middleware for the duration of a request. Handlers run
+# in the threadpool get a copy of the context that still points to the same
+# SqlUsage, so their statements are counted too.
+current_sql_usage: ContextVar[Optional[SqlUsage]] = ContextVar(
+    'current_sql_usage',
+    default=None
+)
+
+
+def install_sql_metrics(engine: Engine, query_budget=None) -> None:
+    """
+    Attribute the statements run by a sync engine, or the `sync_engine` of
+    an async one, to the request in progress. Statements run outside of a
+    request are not counted, but are still checked against the slow query
+    threshold of `query_budget` (a QueryBudget) when given.
+    """
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(
+        connection, cursor, statement, parameters, context, executemany
+    ):
+        connection.info['query_started'] = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(
+        connection, cursor, statement, parameters, context, executemany
+    ):
+        seconds = time.perf_counter() - connection.info['query_started']
+        usage = current_sql_usage.get()
+        if usage is not None:
+            usage.statements += 1
+            usage.seconds += seconds
+            if usage.queries is not None:
+                usage.queries.append((statement, parameters, executemany))
+        if query_budget is not None:
+            query_budget.check_statement(
+                statement,
+                parameters,
+                executemany,
+                seconds,
+                usage
+            )
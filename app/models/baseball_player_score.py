@@ -15,19 +15,32 @@ class BaseballPlayerScore(Base):
     score = Column(Integer, nullable=False)
     match_date = Column(Date, nullable=False)
 
-    # Add unique constraint on player_name and match_date
     __table_args__ = (
+        # One score per player and date. The constraint's index also
+        # serves lookups by player_name and by (player_name, match_date).
+        # Databases created before it existed get it from
+        # schema_migrations.upgrade_schema.
         UniqueConstraint(
             'player_name',
             'match_date',
             name='uix_player_name_match_date'
         ),
-    )
-
-    # Add a composite index for better query performance
-    __table_args__ = (
+        # Indexes matching the keyset pagination orderings. The trailing
+        # filter column lets counts over date and score filters read the
+        # index only.
+        Index('ix_match_date_id_score', 'match_date', 'id', 'score'),
+        Index('ix_score_id_match_date', 'score', 'id', 'match_date'),
+        # Team filters, alone or with date and score filters, in date
+        # order. See tests/repositories/test_score_query_plans.py.
         Index(
-            'ix_player_name_match_date',
-            'player_name',
-            'match_date'),
-        )
+            'ix_player_team_match_date_id_score',
+            'player_team',
+            'match_date',
+            'id',
+            'score'
+        ),
+        # Player and team filters in score order, so keyset pages of one
+        # player or team read page_size rows instead of sorting them all.
+        Index('ix_player_name_score_id', 'player_name', 'score', 'id'),
+        Index('ix_player_team_score_id', 'player_team', 'score', 'id'),
+    )
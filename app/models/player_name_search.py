@@ -0,0 +1,34 @@
+# Related third-party imports
+from sqlalchemy import Integer, String, column, event, table
+
+# Local application/library specific imports
+from app.database.database import Base
+from app.database.name_search_index import (
+    NAME_SEARCH_TABLE,
+    PLAYER_NAMES_TABLE,
+    install_name_search,
+)
+
+# Tables of name_search_index.py, created by their own DDL rather than
+# create_all since SQLAlchemy has no FTS5 support. Declared lightweight
+# for use in queries.
+player_names = table(
+    PLAYER_NAMES_TABLE,
+    column('id', Integer),
+    column('player_name', String),
+    column('search_name', String),
+)
+player_name_search = table(
+    NAME_SEARCH_TABLE,
+    column('rowid', Integer),
+    column('player_name', String),
+    column('search_name', String),
+    column('rank'),
+)
+
+# Created with the tables by every create_all, including upgrade_schema.
+event.listen(
+    Base.metadata,
+    'after_create',
+    lambda target, connection, **kw: install_name_search(connection)
+)
@@ -0,0 +1,101 @@
+# Related third-party imports
+from sqlalchemy import Column, Date, Integer, String, event
+from sqlalchemy.schema import Index
+
+# Local application/library specific imports
+from app.database.database import Base
+from app.database.summary_triggers import install_summary_triggers
+
+# Running totals of baseball_player_scores, kept up to date by the
+# triggers of summary_triggers.py in the transaction of each score write.
+# A season is the calendar year of the match date. Scores without a team
+# are left out of the team totals.
+
+
+class PlayerScoreTotal(Base):
+    __tablename__ = 'player_score_totals'
+
+    player_name = Column(String, primary_key=True)
+    matches = Column(Integer, nullable=False)
+    total_score = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Career leaderboard, read in index order.
+        Index(
+            'ix_player_score_totals_rank',
+            total_score.desc(),
+            'player_name'
+        ),
+    )
+
+
+class PlayerSeasonTotal(Base):
+    __tablename__ = 'player_season_totals'
+
+    season = Column(Integer, primary_key=True)
+    player_name = Column(String, primary_key=True)
+    matches = Column(Integer, nullable=False)
+    total_score = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Season leaderboard, read in index order.
+        Index(
+            'ix_player_season_totals_rank',
+            'season',
+            total_score.desc(),
+            'player_name'
+        ),
+    )
+
+
+class PlayerMonthTotal(Base):
+    __tablename__ = 'player_month_totals'
+
+    # year * 100 + month of the match date, e.g. 202406.
+    month = Column(Integer, primary_key=True)
+    player_name = Column(String, primary_key=True)
+    matches = Column(Integer, nullable=False)
+    total_score = Column(Integer, nullable=False)
+
+
+class TeamDailyTotal(Base):
+    __tablename__ = 'team_daily_totals'
+
+    player_team = Column(String, primary_key=True)
+    match_date = Column(Date, primary_key=True)
+    matches = Column(Integer, nullable=False)
+    total_score = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Totals of every team over a date range.
+        Index('ix_team_daily_totals_match_date', 'match_date', 'player_team'),
+    )
+
+
+class TeamSeasonTotal(Base):
+    __tablename__ = 'team_season_totals'
+
+    player_team = Column(String, primary_key=True)
+    season = Column(Integer, primary_key=True)
+    matches = Column(Integer, nullable=False)
+    total_score = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_team_season_totals_season', 'season', 'player_team'),
+    )
+
+
+SUMMARY_TABLES = [
+    PlayerScoreTotal.__table__,
+    PlayerSeasonTotal.__table__,
+    PlayerMonthTotal.__table__,
+    TeamDailyTotal.__table__,
+    TeamSeasonTotal.__table__,
+]
+
+# Created with the tables by every create_all, including upgrade_schema.
+event.listen(
+    Base.metadata,
+    'after_create',
+    lambda target, connection, **kw: install_summary_triggers(connection)
+)
@@ -0,0 +1,162 @@
+# Standard library imports
+from datetime import date
+from typing import Any, Iterable, Optional, Tuple
+
+# Related third-party imports
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Local application/library specific imports
+from app.cache.count_cache import CountCache
+from app.domain.pagination_result import PaginationResult
+from app.domain.repository_action_result import RepositoryActionResult
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.async_repository_base import AsyncRepositoryBase
+from app.repositories.repository_listener import RepositoryListener
+from app.repositories.score_queries import (
+    capped_count_statement,
+    count_statement,
+    estimate_sampling,
+    extrapolate_count,
+    id_bounds_statement,
+    page_statement,
+    sampled_count_statement,
+)
+from app.settings import COUNT_ESTIMATE_SAMPLE_SIZE
+
+
+class AsyncBaseballPlayerScoreRepository(
+    AsyncRepositoryBase[BaseballPlayerScore]
+):
+    def __init__(
+        self,
+        db: AsyncSession,
+        count_cache: Optional[CountCache] = None,
+        listeners: Optional[Iterable[RepositoryListener]] = None
+    ):
+        listeners = list(listeners or [])
+        if count_cache is not None and count_cache not in listeners:
+            listeners.append(count_cache)
+        super().__init__(db, BaseballPlayerScore, listeners)
+        self.count_cache = count_cache
+
+    async def search_scores(
+        self,
+        player_name: Optional[str],
+        player_team: Optional[str],
+        min_score: Optional[int],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        page: int,
+        page_size: int,
+        sort_order: ScoreSortOrder = ScoreSortOrder.MATCH_DATE_ASC,
+        after: Optional[Tuple[Any, int]] = None,
+        include_total: TotalCountMode = TotalCountMode.EXACT,
+        name_query: Optional[str] = None
+    ) -> RepositoryActionResult[PaginationResult]:
+        """
+        Async counterpart of BaseballPlayerScoreRepository.search_scores.
+        """
+        try:
+            search_filter = ScoreSearchFilter(
+                player_name,
+                player_team,
+                min_score,
+                start_date,
+                end_date,
+                name_query
+            )
+
+            total_items = None
+            total_is_estimate = False
+            if include_total == TotalCountMode.EXACT:
+                total_items = await self._count(search_filter)
+            elif include_total == TotalCountMode.ESTIMATE:
+                total_items, total_is_estimate = await self._estimate_count(
+                    search_filter
+                )
+
+            scores = (
+                await self.db.execute(
+                    page_statement(
+                        search_filter,
+                        self.dialect_name,
+                        sort_order,
+                        page,
+                        page_size,
+                        after
+                    )
+                )
+            ).all()
+
+            result = PaginationResult(
+                items=scores[:page_size],
+                total_items=total_items,
+                has_more=len(scores) > page_size,
+                total_is_estimate=total_is_estimate,
+            )
+            return RepositoryActionResult.ok(result)
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    async def _count(self, search_filter: ScoreSearchFilter) -> int:
+        if self.count_cache is None:
+            return await self.db.scalar(
+                count_statement(search_filter, self.dialect_name)
+            )
+
+        total_items = self.count_cache.get(search_filter)
+        if total_items is None:
+            generation = self.count_cache.generation
+            total_items = await self.db.scalar(
+                count_statement(search_filter, self.dialect_name)
+            )
+            self.count_cache.set(search_filter, total_items, generation)
+        return total_items
+
+    async def _estimate_count(
+        self,
+        search_filter: ScoreSearchFilter
+    ) -> Tuple[int, bool]:
+        if self.count_cache is not None:
+            cached = self.count_cache.get(search_filter)
+            if cached is not None:
+                return cached, False
+
+        sample_size = COUNT_ESTIMATE_SAMPLE_SIZE
+        capped_count = await self.db.scalar(
+            capped_count_statement(
+                search_filter,
+                self.dialect_name,
+                sample_size + 1
+            )
+        )
+        if capped_count <= sample_size:
+            return capped_count, False
+
+        min_id, max_id = (await self.db.execute(id_bounds_statement())).one()
+        sampling = estimate_sampling(min_id, max_id, sample_size)
+        if sampling is None:
+            total_items = await self.db.scalar(
+                count_statement(search_filter, self.dialect_name)
+            )
+            return total_items, False
+
+        stride, window = sampling
+        sampled = await self.db.scalar(
+            sampled_count_statement(
+                search_filter,
+                self.dialect_name,
+                min_id,
+                stride,
+                window
+            )
+        )
+        estimate = extrapolate_count(sampled, min_id, max_id, window)
+        return max(estimate, capped_count), True
@@ -0,0 +1,156 @@
+# Standard library imports
+from typing import Generic, Iterable, List, Optional, Type, TypeVar
+
+# Related third-party imports
+from sqlalchemy import Row, delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Local application/library specific imports
+from app.domain.repository_action_result import RepositoryActionResult
+from app.repositories.repository_base import (
+    entity_values,
+    insert_ignoring_conflicts,
+)
+from app.repositories.repository_listener import RepositoryListener
+
+T = TypeVar('T')
+
+
+class AsyncRepositoryBase(Generic[T]):
+    def __init__(
+        self,
+        db: AsyncSession,
+        model: Type[T],
+        listeners: Optional[Iterable[RepositoryListener]] = None
+    ):
+        self.db = db
+        self.model = model
+        self.listeners: List[RepositoryListener] = list(listeners or [])
+
+    @property
+    def dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    async def create(self, entity: T) -> RepositoryActionResult[Row]:
+        """
+        Insert the entity with a single INSERT ... ON CONFLICT DO NOTHING
+        RETURNING, see RepositoryBase.create.
+        """
+        try:
+            table = self.model.__table__
+            row = (await self.db.execute(
+                insert_ignoring_conflicts(table, self.dialect_name)
+                .values(entity_values(table, entity))
+                .returning(*table.columns)
+            )).first()
+            if row is None:
+                await self.db.rollback()
+                return RepositoryActionResult.conflict(
+                    "Entity conflicts with an existing one"
+                )
+            await self.db.commit()
+            for listener in self.listeners:
+                listener.after_create(row)
+            return RepositoryActionResult.ok(row)
+        except Exception as e:
+            await self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    async def get_by_id(self, id: int) -> RepositoryActionResult[Row]:
+        """
+        Select the columns of the entity with Core, see
+        RepositoryBase.get_by_id.
+        """
+        try:
+            table = self.model.__table__
+            row = (await self.db.execute(
+                select(*table.columns).where(table.c.id == id)
+            )).first()
+            if row is not None:
+                return RepositoryActionResult.ok(row)
+            else:
+                return (
+                    RepositoryActionResult
+                    .not_found(f"Entity with id {id} not found")
+                )
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    async def delete(self, id: int) -> RepositoryActionResult[None]:
+        """
+        Delete the entity with a single DELETE ... RETURNING, see
+        RepositoryBase.delete.
+        """
+        try:
+            table = self.model.__table__
+            row = (await self.db.execute(
+                delete(table)
+                .where(table.c.id == id)
+                .returning(*table.columns)
+            )).first()
+            if row is None:
+                await self.db.rollback()
+                return (
+                    RepositoryActionResult
+                    .not_found(f"Entity with id {id} not found")
+                )
+            await self.db.commit()
+            for listener in self.listeners:
+                listener.after_delete(row)
+            return RepositoryActionResult.ok(None)
+        except Exception as e:
+            await self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    async def update(
+        self,
+        id: int,
+        updated_data: dict
+    ) -> RepositoryActionResult[Row]:
+        """
+        Apply `updated_data` with a single UPDATE ... RETURNING, see
+        RepositoryBase.update.
+        """
+        if not updated_data:
+            return await self.get_by_id(id)
+        try:
+            table = self.model.__table__
+            row = (await self.db.execute(
+                update(table)
+                .where(table.c.id == id)
+                .values(updated_data)
+                .returning(*table.columns)
+            )).first()
+            if row is None:
+                await self.db.rollback()
+                return (
+                    RepositoryActionResult
+                    .not_found(f"Entity with id {id} not found")
+                )
+            await self.db.commit()
+            for listener in self.listeners:
+                listener.after_update(row, updated_data.keys())
+            return RepositoryActionResult.ok(row)
+        except IntegrityError as e:
+            await self.db.rollback()
+            return RepositoryActionResult.conflict(str(e.orig))
+        except Exception as e:
+            await self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
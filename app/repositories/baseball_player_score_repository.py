@@ -1,20 +1,60 @@
 # Standard library imports
 from datetime import date
-from typing import Optional
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 # Related third-party imports
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 # Local application/library specific imports
+from app.cache.count_cache import CountCache
 from app.domain.pagination_result import PaginationResult
 from app.domain.repository_action_result import RepositoryActionResult
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
 from app.models.baseball_player_score import BaseballPlayerScore
 from app.repositories.repository_base import RepositoryBase
+from app.repositories.repository_listener import RepositoryListener
+from app.repositories.score_queries import (
+    capped_count_statement,
+    count_statement,
+    estimate_sampling,
+    extrapolate_count,
+    id_bounds_statement,
+    page_statement,
+    player_date_lookup_chunks,
+    player_date_lookup_statement,
+    id_update_statement,
+    range_delete_statement,
+    range_ids_statement,
+    sampled_count_statement,
+    stream_statement,
+)
+from app.settings import COUNT_ESTIMATE_SAMPLE_SIZE
 
 
 class BaseballPlayerScoreRepository(RepositoryBase[BaseballPlayerScore]):
-    def __init__(self, db: Session):
-        super().__init__(db, BaseballPlayerScore)
+    def __init__(
+        self,
+        db: Session,
+        count_cache: Optional[CountCache] = None,
+        listeners: Optional[Iterable[RepositoryListener]] = None
+    ):
+        listeners = list(listeners or [])
+        if count_cache is not None and count_cache not in listeners:
+            listeners.append(count_cache)
+        super().__init__(db, BaseballPlayerScore, listeners)
+        self.count_cache = count_cache
 
     def get_score_from_player_and_date(
         self,
@@ -45,6 +85,49 @@ class BaseballPlayerScoreRepository(RepositoryBase[BaseballPlayerScore]):
                 .error(exception=e, error_message=str(e))
             )
 
+    def get_existing_player_dates(
+        self,
+        keys: Iterable[Tuple[str, date]]
+    ) -> RepositoryActionResult[Set[Tuple[str, date]]]:
+        """
+        Return the subset of (player_name, match_date) keys that already
+        have a score, using one query per chunk of keys.
+        """
+        try:
+            existing = set()
+            statement = player_date_lookup_statement()
+            for params in player_date_lookup_chunks(list(keys)):
+                rows = self.db.execute(statement, params)
+                existing.update(tuple(row) for row in rows)
+            return RepositoryActionResult.ok(existing)
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def get_scores_by_player_dates(
+        self,
+        keys: Iterable[Tuple[str, date]]
+    ) -> RepositoryActionResult[List[Row]]:
+        """
+        Return the scores of the (player_name, match_date) keys that have
+        one, in no particular order, using one query per chunk of keys.
+        """
+        try:
+            rows = []
+            statement = player_date_lookup_statement(full_rows=True)
+            for params in player_date_lookup_chunks(list(keys)):
+                rows.extend(self.db.execute(statement, params))
+            return RepositoryActionResult.ok(rows)
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
     def search_scores(
         self,
         player_name: Optional[str],
@@ -53,44 +136,60 @@ class BaseballPlayerScoreRepository(RepositoryBase[BaseballPlayerScore]):
         start_date: Optional[date],
         end_date: Optional[date],
         page: int,
-        page_size: int
+        page_size: int,
+        sort_order: ScoreSortOrder = ScoreSortOrder.MATCH_DATE_ASC,
+        after: Optional[Tuple[Any, int]] = None,
+        include_total: TotalCountMode = TotalCountMode.EXACT,
+        name_query: Optional[str] = None
     ) -> RepositoryActionResult[PaginationResult]:
-        try:
-            query = self.db.query(BaseballPlayerScore)
+        """
+        Return one page of scores ordered by (sort field, id).
 
-            if player_name is not None:
-                query = query.filter(
-                    BaseballPlayerScore.player_name == player_name
-                )
-            if player_team is not None:
-                query = query.filter(
-                    BaseballPlayerScore.player_team == player_team
-                )
-            if min_score is not None:
-                query = query.filter(
-                    BaseballPlayerScore.score >= min_score
-                )
-            if start_date is not None:
-                query = query.filter(
-                    BaseballPlayerScore.match_date >= start_date
-                )
-            if end_date is not None:
-                query = query.filter(
-                    BaseballPlayerScore.match_date <= end_date
-                )
+        When `after` holds the (sort key, id) of the last row of the previous
+        page the page is fetched by seeking past it (keyset pagination) and
+        `page` is ignored, otherwise `page` is used as an offset.
 
-            total_items = query.count()
+        `include_total` selects whether the number of matching rows is
+        skipped, counted exactly (cached per filter) or estimated.
 
-            scores = (
-                query
-                .offset((page - 1) * page_size)
-                .limit(page_size)
-                .all()
+        `name_query` keeps the players whose name contains each of its
+        words, in any ASCII case, looked up in the player name search index.
+        """
+        try:
+            search_filter = ScoreSearchFilter(
+                player_name,
+                player_team,
+                min_score,
+                start_date,
+                end_date,
+                name_query
             )
 
+            total_items = None
+            total_is_estimate = False
+            if include_total == TotalCountMode.EXACT:
+                total_items = self._count(search_filter)
+            elif include_total == TotalCountMode.ESTIMATE:
+                total_items, total_is_estimate = self._estimate_count(
+                    search_filter
+                )
+
+            scores = self.db.execute(
+                page_statement(
+                    search_filter,
+                    self.dialect_name,
+                    sort_order,
+                    page,
+                    page_size,
+                    after
+                )
+            ).all()
+
             result = PaginationResult(
-                items=scores,
+                items=scores[:page_size],
                 total_items=total_items,
+                has_more=len(scores) > page_size,
+                total_is_estimate=total_is_estimate,
             )
             return RepositoryActionResult.ok(result)
         except Exception as e:
@@ -99,3 +198,215 @@ class BaseballPlayerScoreRepository(RepositoryBase[BaseballPlayerScore]):
                 RepositoryActionResult
                 .error(exception=e, error_message=str(e))
             )
+
+    def _count(self, search_filter: ScoreSearchFilter) -> int:
+        if self.count_cache is None:
+            return self.db.scalar(
+                count_statement(search_filter, self.dialect_name)
+            )
+
+        total_items = self.count_cache.get(search_filter)
+        if total_items is None:
+            generation = self.count_cache.generation
+            total_items = self.db.scalar(
+                count_statement(search_filter, self.dialect_name)
+            )
+            self.count_cache.set(search_filter, total_items, generation)
+        return total_items
+
+    def _estimate_count(
+        self,
+        search_filter: ScoreSearchFilter
+    ) -> Tuple[int, bool]:
+        """
+        Return (count, is_estimate). Small results and cached counts are
+        exact, otherwise the match ratio of a few id ranges spread over the
+        table is extrapolated to the whole id range.
+        """
+        if self.count_cache is not None:
+            cached = self.count_cache.get(search_filter)
+            if cached is not None:
+                return cached, False
+
+        sample_size = COUNT_ESTIMATE_SAMPLE_SIZE
+        capped_count = self.db.scalar(
+            capped_count_statement(
+                search_filter,
+                self.dialect_name,
+                sample_size + 1
+            )
+        )
+        if capped_count <= sample_size:
+            return capped_count, False
+
+        min_id, max_id = self.db.execute(id_bounds_statement()).one()
+        sampling = estimate_sampling(min_id, max_id, sample_size)
+        if sampling is None:
+            total_items = self.db.scalar(
+                count_statement(search_filter, self.dialect_name)
+            )
+            return total_items, False
+
+        stride, window = sampling
+        sampled = self.db.scalar(
+            sampled_count_statement(
+                search_filter,
+                self.dialect_name,
+                min_id,
+                stride,
+                window
+            )
+        )
+        estimate = extrapolate_count(sampled, min_id, max_id, window)
+        # The capped count proved there are more rows than the sample size.
+        return max(estimate, capped_count), True
+
+    def stream_scores(
+        self,
+        player_name: Optional[str],
+        player_team: Optional[str],
+        min_score: Optional[int],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        chunk_size: int
+    ) -> RepositoryActionResult[Iterator[Row]]:
+        """
+        Return an iterator over every matching score ordered by id. Rows
+        are fetched `chunk_size` at a time from a server-side cursor, the
+        session must stay open until the iterator is exhausted.
+        """
+        try:
+            search_filter = ScoreSearchFilter(
+                player_name,
+                player_team,
+                min_score,
+                start_date,
+                end_date
+            )
+            result = self.db.execute(
+                stream_statement(
+                    search_filter,
+                    self.dialect_name,
+                    chunk_size
+                )
+            )
+            rows = (
+                row for partition in result.partitions() for row in partition
+            )
+            return RepositoryActionResult.ok(rows)
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def get_id_bounds(
+        self
+    ) -> RepositoryActionResult[Tuple[Optional[int], Optional[int]]]:
+        """
+        Return the lowest and highest score ids, both None on an empty
+        table.
+        """
+        try:
+            min_id, max_id = self.db.execute(id_bounds_statement()).one()
+            return RepositoryActionResult.ok((min_id, max_id))
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def delete_matching_in_range(
+        self,
+        search_filter: ScoreSearchFilter,
+        start_id: int,
+        end_id: int
+    ) -> RepositoryActionResult[int]:
+        """
+        Delete the scores matching `search_filter` with an id in
+        [start_id, end_id) with a single statement in its own transaction,
+        and return how many were deleted.
+        """
+        try:
+            rows = self.db.execute(
+                range_delete_statement(
+                    search_filter,
+                    self.dialect_name,
+                    start_id,
+                    end_id
+                )
+            ).all()
+            self.db.commit()
+            if rows:
+                for listener in self.listeners:
+                    listener.after_delete_many(rows)
+            return RepositoryActionResult.ok(len(rows))
+        except Exception as e:
+            self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def update_matching_in_range(
+        self,
+        search_filter: ScoreSearchFilter,
+        start_id: int,
+        end_id: int,
+        updated_data: Dict[str, Any],
+        shift_days: int = 0
+    ) -> RepositoryActionResult[Tuple[int, int]]:
+        """
+        Apply `updated_data` and move match_date by `shift_days` days on the
+        scores matching `search_filter` with an id in [start_id, end_id),
+        in one short transaction. Return (updated, skipped), skipped scores
+        would have had the same player and date as another one.
+
+        Scores are updated one by one with an executemany, in the order of
+        range_ids_statement, so shifted dates make room for each other.
+        """
+        try:
+            table = self.model.__table__
+            ids = self.db.scalars(
+                range_ids_statement(
+                    search_filter,
+                    self.dialect_name,
+                    start_id,
+                    end_id,
+                    shift_days
+                )
+            ).all()
+            if not ids:
+                self.db.rollback()
+                return RepositoryActionResult.ok((0, 0))
+
+            updated = self.db.execute(
+                id_update_statement(
+                    search_filter,
+                    self.dialect_name,
+                    updated_data,
+                    shift_days
+                ),
+                [{'score_id': id} for id in ids]
+            ).rowcount
+            # Skipped scores are read too, only to invalidate caches.
+            rows = self.db.execute(
+                select(*table.columns).where(table.c.id.in_(ids))
+            ).all()
+            self.db.commit()
+            changed_fields = list(updated_data)
+            if shift_days:
+                changed_fields.append('match_date')
+            for listener in self.listeners:
+                listener.after_update_many(rows, changed_fields)
+            return RepositoryActionResult.ok((updated, len(ids) - updated))
+        except Exception as e:
+            self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
@@ -1,26 +1,108 @@
 # Standard library imports
-from typing import Generic, Type, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 # Related third-party imports
+from sqlalchemy import (
+    Insert,
+    Row,
+    Table,
+    UniqueConstraint,
+    bindparam,
+    delete,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # Local application/library specific imports
 from app.domain.repository_action_result import RepositoryActionResult
+from app.repositories.repository_listener import RepositoryListener
 
 T = TypeVar('T')
 
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING.
+_CONFLICT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def insert_ignoring_conflicts(table: Table, dialect_name: str) -> Insert:
+    """
+    INSERT ... ON CONFLICT DO NOTHING for `table`: a row violating a
+    unique constraint is skipped, and returns nothing, instead of failing.
+    """
+    return _CONFLICT_INSERTS[dialect_name](table).on_conflict_do_nothing()
+
+
+def unique_key_columns(table: Table) -> Tuple[str, ...]:
+    # Columns of the table's unique constraint, which identify a row
+    # without its autoincrement key.
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            return tuple(column.key for column in constraint.columns)
+    raise ValueError(f"Table {table.name} has no unique constraint")
+
+
+def entity_values(table: Table, entity: Any) -> Dict[str, Any]:
+    # An unset autoincrement key is left for the database to assign.
+    return {
+        column.key: getattr(entity, column.key)
+        for column in table.columns
+        if not (column.primary_key and getattr(entity, column.key) is None)
+    }
+
 
 class RepositoryBase(Generic[T]):
-    def __init__(self, db: Session, model: Type[T]):
+    def __init__(
+        self,
+        db: Session,
+        model: Type[T],
+        listeners: Optional[Iterable[RepositoryListener]] = None
+    ):
         self.db = db
         self.model = model
+        self.listeners: List[RepositoryListener] = list(listeners or [])
 
-    def create(self, entity: T) -> RepositoryActionResult[T]:
+    @property
+    def dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    def create(self, entity: T) -> RepositoryActionResult[Row]:
+        """
+        Insert the entity with a single INSERT ... ON CONFLICT DO NOTHING
+        RETURNING and return the created row. A row that would violate a
+        unique constraint is reported as a conflict, no lookup is needed
+        beforehand and concurrent creates cannot both succeed.
+        """
         try:
-            self.db.add(entity)
+            table = self.model.__table__
+            row = self.db.execute(
+                insert_ignoring_conflicts(table, self.dialect_name)
+                .values(entity_values(table, entity))
+                .returning(*table.columns)
+            ).first()
+            if row is None:
+                self.db.rollback()
+                return RepositoryActionResult.conflict(
+                    "Entity conflicts with an existing one"
+                )
             self.db.commit()
-            self.db.refresh(entity)
-            return RepositoryActionResult.ok(entity)
+            for listener in self.listeners:
+                listener.after_create(row)
+            return RepositoryActionResult.ok(row)
         except Exception as e:
             self.db.rollback()
             # TODO - Log exception
@@ -29,15 +111,74 @@ class RepositoryBase(Generic[T]):
                 .error(exception=e, error_message=str(e))
             )
 
-    def get_by_id(self, id: int) -> RepositoryActionResult[T]:
+    def create_many(
+        self,
+        values: List[Dict[str, Any]]
+    ) -> RepositoryActionResult[List[RepositoryActionResult[Row]]]:
+        """
+        Insert all rows in one transaction and return one result per row,
+        in the order of `values`: the created row or conflict.
+
+        The rows go out as multi-row INSERT ... ON CONFLICT DO NOTHING
+        RETURNING statements. Returned rows come in no particular order,
+        they are matched back to `values` on the table's unique
+        constraint. A row skipped by the conflict clause, e.g. one
+        inserted concurrently, returns nothing and is reported as a
+        conflict without failing the others.
+        """
         try:
-            entity = (
-                self.db.query(self.model)
-                .filter(self.model.id == id)
-                .first()
+            table = self.model.__table__
+            key_columns = unique_key_columns(table)
+            rows = {
+                tuple(getattr(row, key) for key in key_columns): row
+                for row in self.db.execute(
+                    insert_ignoring_conflicts(
+                        table,
+                        self.dialect_name
+                    ).returning(*table.columns),
+                    values
+                )
+            }
+            self.db.commit()
+            # A key repeated within the batch was created once, for its
+            # first occurrence.
+            results = []
+            for value in values:
+                row = rows.pop(
+                    tuple(value[key] for key in key_columns),
+                    None
+                )
+                results.append(
+                    RepositoryActionResult.ok(row) if row is not None
+                    else RepositoryActionResult.conflict(
+                        "Entity conflicts with an existing one"
+                    )
+                )
+            created = [result.entity for result in results if result.is_ok]
+            if created:
+                for listener in self.listeners:
+                    listener.after_create_many(created)
+            return RepositoryActionResult.ok(results)
+        except Exception as e:
+            self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
             )
-            if entity:
-                return RepositoryActionResult.ok(entity)
+
+    def get_by_id(self, id: int) -> RepositoryActionResult[Row]:
+        """
+        Select the columns of the entity with Core, the row is returned
+        without ORM hydration or session tracking.
+        """
+        try:
+            table = self.model.__table__
+            row = self.db.execute(
+                select(*table.columns).where(table.c.id == id)
+            ).first()
+            if row is not None:
+                return RepositoryActionResult.ok(row)
             else:
                 return (
                     RepositoryActionResult
@@ -50,22 +191,49 @@ class RepositoryBase(Generic[T]):
                 .error(exception=e, error_message=str(e))
             )
 
-    def delete(self, id: int) -> RepositoryActionResult[None]:
+    def get_many(
+        self,
+        ids: Iterable[int]
+    ) -> RepositoryActionResult[List[Row]]:
+        """
+        Select the entities of `ids` with a single IN query. Rows come in
+        no particular order and ids without an entity are left out.
+        """
         try:
-            entity = (
-                self.db.query(self.model)
-                .filter(self.model.id == id)
-                .first()
+            table = self.model.__table__
+            rows = self.db.execute(
+                select(*table.columns).where(table.c.id.in_(set(ids)))
+            ).all()
+            return RepositoryActionResult.ok(rows)
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
             )
-            if entity:
-                self.db.delete(entity)
-                self.db.commit()
-                return RepositoryActionResult.ok(None)
-            else:
+
+    def delete(self, id: int) -> RepositoryActionResult[None]:
+        """
+        Delete the entity with a single DELETE ... RETURNING, the returned
+        row tells whether it existed and is handed to the listeners.
+        """
+        try:
+            table = self.model.__table__
+            row = self.db.execute(
+                delete(table)
+                .where(table.c.id == id)
+                .returning(*table.columns)
+            ).first()
+            if row is None:
+                self.db.rollback()
                 return (
                     RepositoryActionResult
                     .not_found(f"Entity with id {id} not found")
                 )
+            self.db.commit()
+            for listener in self.listeners:
+                listener.after_delete(row)
+            return RepositoryActionResult.ok(None)
         except Exception as e:
             self.db.rollback()
             # TODO - Log exception
@@ -74,24 +242,208 @@ class RepositoryBase(Generic[T]):
                 .error(exception=e, error_message=str(e))
             )
 
-    def update(self, id: int, updated_data: dict) -> RepositoryActionResult[T]:
+    def update(
+        self,
+        id: int,
+        updated_data: dict
+    ) -> RepositoryActionResult[Row]:
+        """
+        Apply `updated_data` with a single UPDATE ... RETURNING and return
+        the updated row. No returned row means the entity does not exist,
+        a unique constraint violation is reported as a conflict.
+        """
+        if not updated_data:
+            return self.get_by_id(id)
         try:
-            entity = (
-                self.db.query(self.model)
-                .filter(self.model.id == id)
-                .first()
-            )
-            if entity:
-                for key, value in updated_data.items():
-                    setattr(entity, key, value)
-                self.db.commit()
-                self.db.refresh(entity)
-                return RepositoryActionResult.ok(entity)
-            else:
+            table = self.model.__table__
+            row = self.db.execute(
+                update(table)
+                .where(table.c.id == id)
+                .values(updated_data)
+                .returning(*table.columns)
+            ).first()
+            if row is None:
+                self.db.rollback()
                 return (
                     RepositoryActionResult
                     .not_found(f"Entity with id {id} not found")
                 )
+            self.db.commit()
+            for listener in self.listeners:
+                listener.after_update(row, updated_data.keys())
+            return RepositoryActionResult.ok(row)
+        except IntegrityError as e:
+            self.db.rollback()
+            return RepositoryActionResult.conflict(str(e.orig))
+        except Exception as e:
+            self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def update_many(
+        self,
+        patches: List[Tuple[int, Dict[str, Any]]],
+        atomic: bool = True
+    ) -> RepositoryActionResult[List[RepositoryActionResult[Row]]]:
+        """
+        Apply (id, updated_data) patches in one transaction and return one
+        result per patch, in order: the updated row, not found or conflict.
+
+        Patches setting the same fields share one executemany UPDATE, the
+        updated rows are then read back with a single IN query. When a
+        unique constraint fails the batch is replayed patch by patch, each
+        in a savepoint, to tell the conflicting patches apart.
+
+        With `atomic`, nothing is committed unless every patch succeeds,
+        the successful patches of a failed batch are then ok without a row.
+        Ids must be unique within the batch.
+        """
+        try:
+            table = self.model.__table__
+            try:
+                results = self._update_many_at_once(table, patches)
+            except IntegrityError:
+                self.db.rollback()
+                results = self._update_many_one_by_one(
+                    table,
+                    patches,
+                    atomic
+                )
+
+            if atomic and not all(result.is_ok for result in results):
+                self.db.rollback()
+                return RepositoryActionResult.ok([
+                    RepositoryActionResult.ok(None) if result.is_ok
+                    else result
+                    for result in results
+                ])
+            self.db.commit()
+            for (_, updated_data), result in zip(patches, results):
+                if result.is_ok:
+                    for listener in self.listeners:
+                        listener.after_update(
+                            result.entity,
+                            updated_data.keys()
+                        )
+            return RepositoryActionResult.ok(results)
+        except Exception as e:
+            self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def _update_many_at_once(
+        self,
+        table: Table,
+        patches: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[RepositoryActionResult[Row]]:
+        # The SET clause of an executemany comes from the keys of its
+        # parameters, which must then be the same for every patch.
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for id, updated_data in patches:
+            groups.setdefault(tuple(sorted(updated_data)), []).append(
+                {'_id': id, **updated_data}
+            )
+        statement = update(table).where(table.c.id == bindparam('_id'))
+        for parameters in groups.values():
+            self.db.execute(statement, parameters)
+
+        rows = {
+            row.id: row for row in self.db.execute(
+                select(*table.columns)
+                .where(table.c.id.in_([id for id, _ in patches]))
+            )
+        }
+        return [
+            RepositoryActionResult.ok(rows[id]) if id in rows
+            else RepositoryActionResult.not_found(
+                f"Entity with id {id} not found"
+            )
+            for id, _ in patches
+        ]
+
+    def _update_many_one_by_one(
+        self,
+        table: Table,
+        patches: List[Tuple[int, Dict[str, Any]]],
+        atomic: bool
+    ) -> List[RepositoryActionResult[Row]]:
+        results = []
+        # pysqlite does not begin a transaction before a SAVEPOINT, the
+        # outermost one then stands for it: releasing it commits. Patches
+        # get savepoints nested in one for the batch, which an atomic
+        # batch rolls back before leaving.
+        with self.db.begin_nested() as batch:
+            for id, updated_data in patches:
+                try:
+                    with self.db.begin_nested():
+                        row = self.db.execute(
+                            update(table)
+                            .where(table.c.id == id)
+                            .values(updated_data)
+                            .returning(*table.columns)
+                        ).first()
+                except IntegrityError as e:
+                    results.append(
+                        RepositoryActionResult.conflict(str(e.orig))
+                    )
+                    continue
+                results.append(
+                    RepositoryActionResult.ok(row) if row is not None
+                    else RepositoryActionResult.not_found(
+                        f"Entity with id {id} not found"
+                    )
+                )
+            if atomic and not all(result.is_ok for result in results):
+                batch.rollback()
+        return results
+
+    def delete_many(
+        self,
+        ids: List[int],
+        atomic: bool = True
+    ) -> RepositoryActionResult[List[RepositoryActionResult[Row]]]:
+        """
+        Delete the entities of `ids` with a single DELETE ... RETURNING and
+        return one result per id, in order: the deleted row or not found.
+
+        With `atomic`, nothing is committed unless every id exists, the
+        existing ids of a failed batch are then ok without a row. Ids must
+        be unique within the batch.
+        """
+        try:
+            table = self.model.__table__
+            rows = {
+                row.id: row for row in self.db.execute(
+                    delete(table)
+                    .where(table.c.id.in_(ids))
+                    .returning(*table.columns)
+                )
+            }
+            results = [
+                RepositoryActionResult.ok(rows[id]) if id in rows
+                else RepositoryActionResult.not_found(
+                    f"Entity with id {id} not found"
+                )
+                for id in ids
+            ]
+
+            if atomic and len(rows) < len(ids):
+                self.db.rollback()
+                return RepositoryActionResult.ok([
+                    RepositoryActionResult.ok(None) if result.is_ok
+                    else result
+                    for result in results
+                ])
+            self.db.commit()
+            for listener in self.listeners:
+                listener.after_delete_many(list(rows.values()))
+            return RepositoryActionResult.ok(results)
         except Exception as e:
             self.db.rollback()
             # TODO - Log exception
@@ -0,0 +1,48 @@
+# Standard library imports
+from typing import Any, Iterable, Sequence
+
+
+class RepositoryListener:
+    """
+    Receives notifications after a repository committed a write.
+
+    Subclasses override the hooks they need, every hook is a no-op by
+    default. Hooks must not raise, the write is already committed.
+    """
+
+    def after_create(self, entity: Any) -> None:
+        pass
+
+    def after_update(self, entity: Any, changed_fields: Iterable[str]) -> None:
+        pass
+
+    def after_delete(self, entity: Any) -> None:
+        pass
+
+    def after_create_many(self, entities: Sequence[Any]) -> None:
+        """
+        Rows created together by one statement. Calls after_create for each
+        row unless overridden by a listener with a cheaper way.
+        """
+        for entity in entities:
+            self.after_create(entity)
+
+    def after_update_many(
+        self,
+        entities: Sequence[Any],
+        changed_fields: Iterable[str]
+    ) -> None:
+        """
+        Rows updated together by one statement. Calls after_update for each
+        row unless overridden by a listener with a cheaper way.
+        """
+        changed_fields = tuple(changed_fields)
+        for entity in entities:
+            self.after_update(entity, changed_fields)
+
+    def after_delete_many(self, entities: Sequence[Any]) -> None:
+        """
+        Rows deleted together by one statement, see after_update_many.
+        """
+        for entity in entities:
+            self.after_delete(entity)
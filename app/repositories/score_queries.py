@@ -0,0 +1,385 @@
+# Standard library imports
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Related third-party imports
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Select,
+    Update,
+    and_,
+    bindparam,
+    delete,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+
+# Local application/library specific imports
+from app.domain.score_search_filter import ScoreSearchFilter, fold_name_case
+from app.domain.score_sort_order import ScoreSortOrder
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.models.player_name_search import player_name_search, player_names
+
+# Statements shared by the sync and async score repositories.
+
+# Number of id ranges spread over the table that an estimate samples.
+ESTIMATE_SAMPLE_WINDOWS = 8
+
+# Keeps lookups well below SQLite's bound parameter limit.
+KEY_LOOKUP_CHUNK_SIZE = 400
+
+# Shortest term the trigram index can look up.
+TRIGRAM_LENGTH = 3
+
+
+def filter_conditions(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str
+) -> List[ColumnElement[bool]]:
+    conditions = []
+
+    if search_filter.player_name is not None:
+        conditions.append(
+            BaseballPlayerScore.player_name == search_filter.player_name
+        )
+    if search_filter.name_query and search_filter.name_query.split():
+        names = matching_names_statement(
+            search_filter.name_query,
+            dialect_name
+        )
+        conditions.append(
+            BaseballPlayerScore.player_name.in_(
+                names.with_only_columns(names.selected_columns.player_name)
+            )
+        )
+    if search_filter.player_team is not None:
+        conditions.append(
+            BaseballPlayerScore.player_team == search_filter.player_team
+        )
+    if search_filter.min_score is not None:
+        conditions.append(
+            BaseballPlayerScore.score >= search_filter.min_score
+        )
+    if search_filter.start_date is not None:
+        conditions.append(
+            BaseballPlayerScore.match_date >= search_filter.start_date
+        )
+    if search_filter.end_date is not None:
+        conditions.append(
+            BaseballPlayerScore.match_date <= search_filter.end_date
+        )
+
+    return conditions
+
+
+def matching_names_statement(name_query: str, dialect_name: str) -> Select:
+    """
+    Select the player names containing every word of `name_query`, with
+    a `name_rank` column that is lowest for the best matches. Words are
+    looked up in the trigram index, words too short for it fall back to
+    LIKE on the name dictionary, which is far smaller than the scores.
+    Both compare names and words folded by fold_name_case.
+
+    The index is SQLite only, other dialects run LIKE on the scores, with
+    their own lower() folding.
+    """
+    terms = fold_name_case(name_query).split()
+    if dialect_name != 'sqlite':
+        player_name = BaseballPlayerScore.player_name
+        return select(
+            player_name,
+            func.length(player_name).label('name_rank')
+        ).where(*(
+            func.lower(player_name).contains(term, autoescape=True)
+            for term in terms
+        )).distinct()
+    if all(len(term) >= TRIGRAM_LENGTH for term in terms):
+        match_expression = ' AND '.join(
+            '"' + term.replace('"', '""') + '"' for term in terms
+        )
+        return select(
+            player_name_search.c.player_name,
+            player_name_search.c.rank.label('name_rank')
+        ).where(
+            literal_column(player_name_search.name)
+            .op('MATCH')(match_expression)
+        )
+    return select(
+        player_names.c.player_name,
+        # Without a relevance score, the closest names are the shortest.
+        func.length(player_names.c.player_name).label('name_rank')
+    ).where(*(
+        player_names.c.search_name.contains(term, autoescape=True)
+        for term in terms
+    ))
+
+
+def page_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    sort_order: ScoreSortOrder,
+    page: int,
+    page_size: int,
+    after: Optional[Tuple[Any, int]] = None
+) -> Select:
+    """
+    Select one page ordered by (sort field, id), seeking past `after` when
+    set and using `page` as an offset otherwise. One extra row is fetched
+    to tell whether another page follows.
+
+    Only the table columns are selected, rows are returned as plain Core
+    rows without ORM hydration or session tracking.
+    """
+    statement = select(*BaseballPlayerScore.__table__.columns).where(
+        *filter_conditions(search_filter, dialect_name)
+    )
+
+    sort_column = getattr(BaseballPlayerScore, sort_order.field_name)
+    sort_key = tuple_(sort_column, BaseballPlayerScore.id)
+    if after is not None:
+        statement = statement.where(
+            sort_key < tuple_(*after)
+            if sort_order.is_descending
+            else sort_key > tuple_(*after)
+        )
+
+    if sort_order.is_descending:
+        statement = statement.order_by(
+            sort_column.desc(),
+            BaseballPlayerScore.id.desc()
+        )
+    else:
+        statement = statement.order_by(sort_column, BaseballPlayerScore.id)
+
+    if after is None:
+        statement = statement.offset((page - 1) * page_size)
+
+    return statement.limit(page_size + 1)
+
+
+def count_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str
+) -> Select:
+    return (
+        select(func.count())
+        .select_from(BaseballPlayerScore)
+        .where(*filter_conditions(search_filter, dialect_name))
+    )
+
+
+def capped_count_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    cap: int
+) -> Select:
+    capped = (
+        select(BaseballPlayerScore.id)
+        .where(*filter_conditions(search_filter, dialect_name))
+        .limit(cap)
+        .subquery()
+    )
+    return select(func.count()).select_from(capped)
+
+
+def id_bounds_statement() -> Select:
+    return select(
+        func.min(BaseballPlayerScore.id),
+        func.max(BaseballPlayerScore.id)
+    )
+
+
+def sampled_count_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    min_id: int,
+    stride: int,
+    window: int
+) -> Select:
+    ranges = [
+        and_(
+            BaseballPlayerScore.id >= min_id + i * stride,
+            BaseballPlayerScore.id < min_id + i * stride + window
+        )
+        for i in range(ESTIMATE_SAMPLE_WINDOWS)
+    ]
+    return count_statement(search_filter, dialect_name).where(
+        or_(*ranges)
+    )
+
+
+def estimate_sampling(
+    min_id: int,
+    max_id: int,
+    sample_size: int
+) -> Optional[Tuple[int, int]]:
+    """
+    Return the (stride, window) of the id ranges to sample, or None when
+    the ranges would cover the whole table and an exact count is as cheap.
+    """
+    window = max(sample_size // ESTIMATE_SAMPLE_WINDOWS, 1)
+    stride = (max_id - min_id + 1) // ESTIMATE_SAMPLE_WINDOWS
+    if stride <= window:
+        return None
+    return stride, window
+
+
+def extrapolate_count(
+    sampled: int,
+    min_id: int,
+    max_id: int,
+    window: int
+) -> int:
+    return round(
+        sampled * (max_id - min_id + 1) / (window * ESTIMATE_SAMPLE_WINDOWS)
+    )
+
+
+@lru_cache(maxsize=None)
+def player_date_lookup_statement(full_rows: bool = False) -> Select:
+    """
+    Select the (player_name, match_date) pairs matching the bound
+    name_<n>/date_<n> parameters, for n below KEY_LOOKUP_CHUNK_SIZE, or
+    all the columns of the matching scores with `full_rows`.
+    """
+    # SQLite scans the whole index for a long row-value IN list but runs
+    # one index search per term of an OR. Building the OR once keeps the
+    # per-call cost to binding parameters.
+    columns = (
+        BaseballPlayerScore.__table__.columns if full_rows
+        else (BaseballPlayerScore.player_name, BaseballPlayerScore.match_date)
+    )
+    return select(*columns).where(
+        or_(*(
+            and_(
+                BaseballPlayerScore.player_name == bindparam(f"name_{index}"),
+                BaseballPlayerScore.match_date == bindparam(f"date_{index}")
+            )
+            for index in range(KEY_LOOKUP_CHUNK_SIZE)
+        ))
+    )
+
+
+def player_date_lookup_chunks(keys: List[Tuple[str, Any]]):
+    """
+    Yield bind parameters for player_date_lookup_statement, one dict per
+    chunk of keys. The last chunk is padded by repeating a key.
+    """
+    for start in range(0, len(keys), KEY_LOOKUP_CHUNK_SIZE):
+        chunk = keys[start:start + KEY_LOOKUP_CHUNK_SIZE]
+        chunk += chunk[-1:] * (KEY_LOOKUP_CHUNK_SIZE - len(chunk))
+        params = {}
+        for index, (name, match_date) in enumerate(chunk):
+            params[f"name_{index}"] = name
+            params[f"date_{index}"] = match_date
+        yield params
+
+
+def stream_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    chunk_size: int
+) -> Select:
+    table = BaseballPlayerScore.__table__
+    return (
+        select(*table.columns)
+        .where(*filter_conditions(search_filter, dialect_name))
+        .order_by(table.c.id)
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def id_range_conditions(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    start_id: int,
+    end_id: int
+) -> List[ColumnElement[bool]]:
+    # Bounding the rowid keeps each statement to a primary key range scan.
+    return filter_conditions(search_filter, dialect_name) + [
+        BaseballPlayerScore.id >= start_id,
+        BaseballPlayerScore.id < end_id,
+    ]
+
+
+def range_ids_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    start_id: int,
+    end_id: int,
+    shift_days: int = 0
+) -> Select:
+    """
+    Select the ids of the matching scores with an id in [start_id, end_id),
+    ordered so that moving their match_date by `shift_days` one after the
+    other never runs into a score of the same range still to be moved.
+    """
+    match_date = BaseballPlayerScore.match_date
+    return (
+        select(BaseballPlayerScore.id)
+        .where(*id_range_conditions(
+            search_filter, dialect_name, start_id, end_id
+        ))
+        .order_by(
+            match_date.desc() if shift_days > 0 else match_date,
+            BaseballPlayerScore.id
+        )
+    )
+
+
+def range_delete_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    start_id: int,
+    end_id: int
+) -> Delete:
+    table = BaseballPlayerScore.__table__
+    return (
+        delete(table)
+        .where(*id_range_conditions(
+            search_filter, dialect_name, start_id, end_id
+        ))
+        .returning(*table.columns)
+    )
+
+
+def id_update_statement(
+    search_filter: ScoreSearchFilter,
+    dialect_name: str,
+    values: Dict[str, Any],
+    shift_days: int = 0
+) -> Update:
+    """
+    Update the score of the bound `score_id` if it still matches
+    `search_filter`, moving its match_date by `shift_days`. On SQLite, a
+    score that would break the player and date uniqueness is skipped
+    instead of failing the update.
+
+    Date shifts use SQLite's date(), ScoreService.check_mass_update
+    refuses them, and player changes, on other dialects.
+    """
+    table = BaseballPlayerScore.__table__
+    if shift_days and dialect_name != 'sqlite':
+        raise ValueError("Shifting match dates is only supported on SQLite")
+    if shift_days:
+        values = {
+            **values,
+            'match_date': func.date(
+                table.c.match_date,
+                f"{shift_days:+d} days"
+            ),
+        }
+    return (
+        update(table)
+        .where(
+            table.c.id == bindparam('score_id'),
+            *filter_conditions(search_filter, dialect_name)
+        )
+        .values(values)
+        .prefix_with('OR IGNORE', dialect='sqlite')
+    )
@@ -0,0 +1,133 @@
+# Standard library imports
+from datetime import date
+from typing import List, Optional
+
+# Related third-party imports
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+# Local application/library specific imports
+from app.database.name_search_index import rebuild_name_search
+from app.domain.repository_action_result import RepositoryActionResult
+from app.repositories.summary_queries import (
+    player_leaderboard_statement,
+    player_range_leaderboard_statement,
+    player_search_statement,
+    player_total_statement,
+    rebuild_statements,
+    team_daily_statement,
+    team_season_statement,
+)
+
+
+class ScoreSummaryRepository:
+    """
+    Reads the score summary tables. They are written by database triggers
+    only, apart from `rebuild`.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_player_total(
+        self,
+        player_name: str
+    ) -> RepositoryActionResult[Row]:
+        try:
+            row = self.db.execute(player_total_statement(player_name)).first()
+            if row is None:
+                return RepositoryActionResult.not_found(
+                    f"No score found for player ['{player_name}']"
+                )
+            return RepositoryActionResult.ok(row)
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def search_players(
+        self,
+        name_query: str,
+        limit: int
+    ) -> RepositoryActionResult[List[Row]]:
+        return self._all(
+            player_search_statement(
+                name_query,
+                self.db.get_bind().dialect.name,
+                limit
+            )
+        )
+
+    def get_player_leaderboard(
+        self,
+        limit: int,
+        season: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> RepositoryActionResult[List[Row]]:
+        """
+        Top `limit` players by total score, over their career, a season or
+        a date range. Career and season leaderboards read `limit` summary
+        rows, date ranges add up monthly summaries and the scores of their
+        partial months.
+        """
+        if start_date is not None or end_date is not None:
+            statement = player_range_leaderboard_statement(
+                limit,
+                start_date,
+                end_date
+            )
+        else:
+            statement = player_leaderboard_statement(limit, season)
+        return self._all(statement)
+
+    def get_team_daily_totals(
+        self,
+        player_team: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        limit: int
+    ) -> RepositoryActionResult[List[Row]]:
+        return self._all(
+            team_daily_statement(player_team, start_date, end_date, limit)
+        )
+
+    def get_team_season_totals(
+        self,
+        player_team: Optional[str],
+        season: Optional[int],
+        limit: int
+    ) -> RepositoryActionResult[List[Row]]:
+        return self._all(team_season_statement(player_team, season, limit))
+
+    def rebuild(self) -> RepositoryActionResult[None]:
+        """
+        Recompute every summary and the player name search index from the
+        scores in one transaction, to recover from drift such as writes
+        made with the triggers missing.
+        """
+        try:
+            for statement in rebuild_statements():
+                self.db.execute(statement)
+            rebuild_name_search(self.db.connection())
+            self.db.commit()
+            return RepositoryActionResult.ok(None)
+        except Exception as e:
+            self.db.rollback()
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
+
+    def _all(self, statement) -> RepositoryActionResult[List[Row]]:
+        try:
+            return RepositoryActionResult.ok(self.db.execute(statement).all())
+        except Exception as e:
+            # TODO - Log exception
+            return (
+                RepositoryActionResult
+                .error(exception=e, error_message=str(e))
+            )
@@ -0,0 +1,285 @@
+# Standard library imports
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+# Related third-party imports
+from sqlalchemy import (
+    Executable,
+    Select,
+    delete,
+    extract,
+    func,
+    insert,
+    select,
+    union_all,
+)
+
+# Local application/library specific imports
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.models.score_summaries import (
+    PlayerMonthTotal,
+    PlayerScoreTotal,
+    PlayerSeasonTotal,
+    TeamDailyTotal,
+    TeamSeasonTotal,
+)
+from app.repositories.score_queries import matching_names_statement
+
+# Statements reading and rebuilding the score summary tables.
+
+
+def _season(column):
+    # Same value as the SEASON expression of the summary triggers.
+    return extract('year', column)
+
+
+def _month(column):
+    # Same value as the MONTH expression of the summary triggers.
+    return extract('year', column) * 100 + extract('month', column)
+
+
+def _month_key(day: date) -> int:
+    return day.year * 100 + day.month
+
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=31)).replace(day=1)
+
+
+def rebuild_statements() -> List[Executable]:
+    """
+    Empty the summary tables and recompute them from the scores, to run in
+    a single transaction.
+    """
+    scores = BaseballPlayerScore.__table__
+    matches = func.count().label('matches')
+    total_score = func.sum(scores.c.score).label('total_score')
+    season = _season(scores.c.match_date).label('season')
+    month = _month(scores.c.match_date).label('month')
+    has_team = scores.c.player_team.is_not(None)
+
+    rebuilds = [
+        (
+            PlayerScoreTotal,
+            select(scores.c.player_name, matches, total_score)
+            .group_by(scores.c.player_name)
+        ),
+        (
+            PlayerSeasonTotal,
+            select(season, scores.c.player_name, matches, total_score)
+            .group_by(season, scores.c.player_name)
+        ),
+        (
+            PlayerMonthTotal,
+            select(month, scores.c.player_name, matches, total_score)
+            .group_by(month, scores.c.player_name)
+        ),
+        (
+            TeamDailyTotal,
+            select(scores.c.player_team, scores.c.match_date, matches,
+                   total_score)
+            .where(has_team)
+            .group_by(scores.c.player_team, scores.c.match_date)
+        ),
+        (
+            TeamSeasonTotal,
+            select(scores.c.player_team, season, matches, total_score)
+            .where(has_team)
+            .group_by(scores.c.player_team, season)
+        ),
+    ]
+    statements: List[Executable] = []
+    for model, totals in rebuilds:
+        statements.append(delete(model))
+        statements.append(
+            insert(model).from_select(
+                [column.name for column in totals.selected_columns],
+                totals
+            )
+        )
+    return statements
+
+
+def player_total_statement(player_name: str) -> Select:
+    return select(*PlayerScoreTotal.__table__.columns).where(
+        PlayerScoreTotal.player_name == player_name
+    )
+
+
+def player_search_statement(
+    name_query: str,
+    dialect_name: str,
+    limit: int
+) -> Select:
+    """
+    Career totals of the players whose name contains every word of
+    `name_query`, best matches first. Names without scores are left out.
+    """
+    names = matching_names_statement(name_query, dialect_name).subquery()
+    return (
+        select(*PlayerScoreTotal.__table__.columns)
+        .join(names, names.c.player_name == PlayerScoreTotal.player_name)
+        .order_by(names.c.name_rank, PlayerScoreTotal.player_name)
+        .limit(limit)
+    )
+
+
+def player_leaderboard_statement(
+    limit: int,
+    season: Optional[int] = None
+) -> Select:
+    """
+    Top players by total score, of their career or of one season. Both
+    are read in the order of a summary index, only `limit` rows are read.
+    """
+    if season is None:
+        return (
+            select(*PlayerScoreTotal.__table__.columns)
+            .order_by(
+                PlayerScoreTotal.total_score.desc(),
+                PlayerScoreTotal.player_name
+            )
+            .limit(limit)
+        )
+    return (
+        select(*PlayerSeasonTotal.__table__.columns)
+        .where(PlayerSeasonTotal.season == season)
+        .order_by(
+            PlayerSeasonTotal.total_score.desc(),
+            PlayerSeasonTotal.player_name
+        )
+        .limit(limit)
+    )
+
+
+def _whole_months(
+    start_date: Optional[date],
+    end_date: Optional[date]
+) -> Tuple[Optional[date], Optional[date]]:
+    # First days [first, end) of the months entirely within the range,
+    # None for an open bound.
+    first = (
+        None if start_date is None
+        else start_date if start_date.day == 1
+        else _next_month(start_date)
+    )
+    end = None
+    if end_date is not None:
+        end = _next_month(end_date)
+        if end_date + timedelta(days=1) != end:
+            end = end_date.replace(day=1)
+    return first, end
+
+
+def _score_totals(*conditions) -> Select:
+    scores = BaseballPlayerScore.__table__
+    return (
+        select(
+            scores.c.player_name,
+            func.count().label('matches'),
+            func.sum(scores.c.score).label('total_score')
+        )
+        .where(*conditions)
+        .group_by(scores.c.player_name)
+    )
+
+
+def player_range_leaderboard_statement(
+    limit: int,
+    start_date: Optional[date],
+    end_date: Optional[date]
+) -> Select:
+    """
+    Top players by total score over an arbitrary date range. The months
+    entirely within the range are read from the monthly player totals,
+    only the scores of the partial months at its edges are aggregated: a
+    range reads at most two months of scores, whatever its length.
+    """
+    match_date = BaseballPlayerScore.__table__.c.match_date
+    months = PlayerMonthTotal.__table__
+    first_month, end_month = _whole_months(start_date, end_date)
+
+    if (
+        first_month is not None and end_month is not None
+        and first_month >= end_month
+    ):
+        # Within one or two partial months.
+        parts = [_score_totals(
+            match_date >= start_date,
+            match_date <= end_date
+        )]
+    else:
+        month_conditions = []
+        parts = []
+        if first_month is not None:
+            month_conditions.append(months.c.month >= _month_key(first_month))
+            if start_date < first_month:
+                parts.append(_score_totals(
+                    match_date >= start_date,
+                    match_date < first_month
+                ))
+        if end_month is not None:
+            month_conditions.append(months.c.month < _month_key(end_month))
+            if end_month <= end_date:
+                parts.append(_score_totals(
+                    match_date >= end_month,
+                    match_date <= end_date
+                ))
+        parts.append(
+            select(
+                months.c.player_name,
+                months.c.matches,
+                months.c.total_score
+            )
+            .where(*month_conditions)
+        )
+
+    totals = union_all(*parts).subquery()
+    total_score = func.sum(totals.c.total_score).label('total_score')
+    return (
+        select(
+            totals.c.player_name,
+            func.sum(totals.c.matches).label('matches'),
+            total_score
+        )
+        .group_by(totals.c.player_name)
+        .order_by(total_score.desc(), totals.c.player_name)
+        .limit(limit)
+    )
+
+
+def team_daily_statement(
+    player_team: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    limit: int
+) -> Select:
+    statement = select(*TeamDailyTotal.__table__.columns)
+    if player_team is not None:
+        statement = statement.where(TeamDailyTotal.player_team == player_team)
+    if start_date is not None:
+        statement = statement.where(TeamDailyTotal.match_date >= start_date)
+    if end_date is not None:
+        statement = statement.where(TeamDailyTotal.match_date <= end_date)
+    return statement.order_by(
+        TeamDailyTotal.match_date,
+        TeamDailyTotal.player_team
+    ).limit(limit)
+
+
+def team_season_statement(
+    player_team: Optional[str],
+    season: Optional[int],
+    limit: int
+) -> Select:
+    statement = select(*TeamSeasonTotal.__table__.columns)
+    if player_team is not None:
+        statement = statement.where(
+            TeamSeasonTotal.player_team == player_team
+        )
+    if season is not None:
+        statement = statement.where(TeamSeasonTotal.season == season)
+    return statement.order_by(
+        TeamSeasonTotal.season,
+        TeamSeasonTotal.player_team
+    ).limit(limit)
@@ -0,0 +1,151 @@
+# Standard library imports
+from datetime import date
+from typing import List, Optional
+
+# Third-party imports
+from fastapi import APIRouter, Depends, Query, status
+
+# Local application imports
+from app.analytics.score_column_store import ScoreColumnStore
+from app.database.database import engine
+from app.dependencies import get_score_column_store
+from app.routers.baseball_scores_router import raise_bad_request_exception
+from app.schemas.score_statistics import (
+    ColumnStoreStats,
+    RollingAveragePoint,
+    ScoreStatistics,
+)
+
+# Statistics computed in memory from the NumPy column copy of the scores,
+# only included when ANALYTICS_ENABLED is set.
+router = APIRouter()
+
+
+@router.get(
+    "/analytics/scores/statistics",
+    response_model=ScoreStatistics,
+    summary="Get score statistics",
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"description": "Percentile outside 0-100"},
+    },
+)
+def get_score_statistics(
+    player_name: Optional[str] = Query(
+        None, description="Filter by player's name"
+    ),
+    player_team: Optional[str] = Query(
+        None, description="Filter by player's team"
+    ),
+    start_date: Optional[date] = Query(
+        None, description="Start date of the range"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="End date of the range"
+    ),
+    percentiles: List[float] = Query(
+        [50, 90, 99], description="Percentiles to compute, 0 to 100"
+    ),
+    bins: int = Query(
+        10, ge=1, le=100, description="Number of histogram bins"
+    ),
+    column_store: ScoreColumnStore = Depends(get_score_column_store)
+):
+    """
+    Describe the distribution of the matching scores.
+
+    - **player_name** / **player_team**: Only use the scores of this
+      player or team.
+    - **start_date** / **end_date**: Only use the scores of this range.
+    - **percentiles**: Repeat the parameter for several percentiles.
+    - **bins**: Number of equal width histogram bins.
+    - **returns**: Count, mean, standard deviation, bounds, percentiles
+      and histogram, all empty when no score matches.
+    """
+    if any(not 0 <= percentile <= 100 for percentile in percentiles):
+        raise_bad_request_exception("Percentiles must be within 0 and 100.")
+
+    return column_store.statistics(
+        player_name=player_name,
+        player_team=player_team,
+        start_date=start_date,
+        end_date=end_date,
+        percentiles=percentiles,
+        bins=bins
+    )
+
+
+@router.get(
+    "/analytics/scores/rolling-average",
+    response_model=List[RollingAveragePoint],
+    summary="Get the rolling average score",
+    status_code=status.HTTP_200_OK,
+)
+def get_rolling_average(
+    window_days: int = Query(
+        7, ge=1, le=3660, description="Window length in days"
+    ),
+    player_name: Optional[str] = Query(
+        None, description="Filter by player's name"
+    ),
+    player_team: Optional[str] = Query(
+        None, description="Filter by player's team"
+    ),
+    start_date: Optional[date] = Query(
+        None, description="Start date of the range"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="End date of the range"
+    ),
+    column_store: ScoreColumnStore = Depends(get_score_column_store)
+):
+    """
+    Average score over the days preceding each match date.
+
+    - **window_days**: Number of days averaged, the match date included.
+    - **player_name** / **player_team**: Only use the scores of this
+      player or team.
+    - **start_date** / **end_date**: Only use the scores of this range.
+    - **returns**: One point per date with a matching score, in date
+      order.
+    """
+    return column_store.rolling_average(
+        window_days,
+        player_name=player_name,
+        player_team=player_team,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+
+@router.get(
+    "/analytics/stats",
+    response_model=ColumnStoreStats,
+    summary="Get column store statistics",
+    status_code=status.HTTP_200_OK,
+)
+def get_column_store_stats(
+    column_store: ScoreColumnStore = Depends(get_score_column_store)
+):
+    """
+    Report the size, memory use, load time and write cost of the column
+    copy of the scores.
+    """
+    return column_store.stats()
+
+
+@router.post(
+    "/analytics/refresh",
+    response_model=ColumnStoreStats,
+    summary="Reload the column store",
+    status_code=status.HTTP_200_OK,
+)
+def refresh_column_store(
+    column_store: ScoreColumnStore = Depends(get_score_column_store)
+):
+    """
+    Reload the column copy from the database, to pick up writes made by
+    other processes such as the command line importer.
+    """
+    column_store.load(engine)
+    return column_store.stats()
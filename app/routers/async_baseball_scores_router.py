@@ -0,0 +1,269 @@
+# Standard library imports
+from datetime import date
+from typing import Optional
+
+# Third-party imports
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+
+# Local application imports
+from app.dependencies import get_async_score_service
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.helper.etag_helper import conditional_json_response
+from app.routers.baseball_scores_router import (
+    raise_bad_request_exception,
+    raise_conflict_exception,
+    raise_not_found_exception,
+)
+from app.schemas.pagination_response import PaginationResponse
+from app.schemas.score_create_schema import ScoreCreate
+from app.schemas.score_dto import ScoreDTO
+from app.schemas.score_update_schema import ScoreUpdate
+from app.services.async_score_service import AsyncScoreService
+from app.settings import GET_SCORE_CACHE_CONTROL, SEARCH_SCORES_CACHE_CONTROL
+
+# Async handlers for the score CRUD and search routes, included ahead of
+# baseball_scores_router when DATABASE_ASYNC is enabled so they take over
+# these paths while the bulk, batch, import and export routes stay
+# synchronous.
+# The ":int" convertor lets "/scores/export" fall through to the sync router.
+router = APIRouter()
+
+
+@router.get(
+    "/scores/{score_id:int}",
+    response_model=ScoreDTO,
+    summary="Get a score by ID",
+    status_code=status.HTTP_200_OK,
+    responses={
+        304: {"description": "Score unchanged since the given ETag"},
+        404: {"description": "Score not found"},
+    },
+)
+async def get_score(
+    score_id: int,
+    if_none_match: Optional[str] = Header(None),
+    score_service: AsyncScoreService = Depends(
+        get_async_score_service
+    )
+):
+    """
+    Retrieve a specific baseball score by its ID.
+
+    - **score_id**: The unique identifier of the score.
+    - **If-None-Match**: ETag of a previous response, answered with 304
+      and no body while the score is unchanged.
+    - **returns**: The created score details.
+    """
+    get_result = await score_service.get_score_json(score_id)
+
+    if get_result.is_ok:
+        # The ETag is that of the body, a missing score is never a 304.
+        return conditional_json_response(
+            get_result.data,
+            if_none_match,
+            GET_SCORE_CACHE_CONTROL
+        )
+    elif get_result.is_not_found:
+        raise_not_found_exception(f"No score for ID [{score_id}] not found.")
+    else:
+        raise Exception(get_result.error_message)
+
+
+@router.post(
+    "/scores",
+    response_model=ScoreDTO,
+    status_code=status.HTTP_201_CREATED,
+    responses={422: {"description": "Validation Error"}},
+)
+async def create_score(
+    score_to_create: ScoreCreate,
+    score_service: AsyncScoreService = Depends(
+        get_async_score_service
+    )
+):
+    """
+    Create a new baseball score.
+
+    - **score**: The score to be created.
+    - **returns**: The created score details.
+    """
+    create_result = await score_service.create_score(score_to_create)
+
+    if create_result.is_ok:
+        return create_result.data
+    elif create_result.is_conflict:
+        raise_conflict_exception(
+            f"A score for PLAYER NAME [{score_to_create.player_name}] "
+            f"and date [{score_to_create.match_date}] already exist."
+        )
+    else:
+        raise Exception(create_result.error_message)
+
+
+@router.patch(
+    "/scores/{score_id:int}",
+    summary="Update a score by ID",
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"description": "Score not found"},
+        409: {"description": "Score already exists for player and date"},
+        422: {"description": "Validation Error"},
+    },
+)
+async def patch_score(
+    score_id: int,
+    score: ScoreUpdate,
+    score_service: AsyncScoreService = Depends(
+        get_async_score_service
+    )
+):
+    """
+    Update an existing baseball score by its ID.
+
+    - **score_id**: The unique identifier of the score to be updated.
+    - **score**: The score data to update.
+    - **returns**: Updated score details.
+    """
+    update_result = await score_service.update_score(score_id, score)
+
+    if update_result.is_ok:
+        return update_result.data
+    elif update_result.is_not_found:
+        raise_not_found_exception(f"No score for ID [{score_id}] not found.")
+    elif update_result.is_conflict:
+        raise_conflict_exception(
+            f"Another score already exists for the PLAYER NAME and date "
+            f"of score ID [{score_id}]."
+        )
+    else:
+        raise Exception(update_result.error_message)
+
+
+@router.delete(
+    "/scores/{score_id:int}",
+    summary="Delete a score by ID",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={404: {"description": "Score not found"}},
+)
+async def delete_score(
+    score_id: int,
+    score_service: AsyncScoreService = Depends(
+        get_async_score_service
+    )
+):
+    """
+    Delete a specific baseball score by its ID.
+
+    - **score_id**: The unique identifier of the score to be deleted.
+    - **returns**: A message indicating successful deletion.
+    """
+    delete_result = await score_service.delete_score(score_id)
+
+    if delete_result.is_ok:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    elif delete_result.is_not_found:
+        raise_not_found_exception(f"No score for ID [{score_id}] not found.")
+    else:
+        raise Exception(delete_result.error_message)
+
+
+@router.get(
+    "/scores",
+    response_model=PaginationResponse,
+    summary="Search scores",
+    status_code=status.HTTP_200_OK,
+    responses={
+        304: {"description": "No score changed since the given ETag"},
+    },
+)
+async def search_scores(
+    player_name: Optional[str] = Query(
+        None, description="Filter by player's name"
+    ),
+    name_query: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=100,
+        description="Words the player's name contains, in any ASCII case"
+    ),
+    player_team: Optional[str] = Query(
+        None, description="Filter by player's team"
+    ),
+    min_score: Optional[int] = Query(
+        None, ge=0, description="Minimum score filter"
+    ),
+    start_date: Optional[date] = Query(
+        None, description="Start date of the range"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="End date of the range"
+    ),
+    page: int = Query(
+        1, ge=1, description="Page number of the results"
+    ),
+    page_size: int = Query(
+        10, ge=5, le=100, description="Number of results per page"
+    ),
+    sort: ScoreSortOrder = Query(
+        ScoreSortOrder.MATCH_DATE_ASC,
+        description="Result ordering, prefix with '-' for descending"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by previous page"
+    ),
+    include_total: TotalCountMode = Query(
+        TotalCountMode.EXACT,
+        description="Skip ('false'), count ('exact') or estimate the total"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    score_service: AsyncScoreService = Depends(
+        get_async_score_service
+    )
+):
+    """
+    Search for baseball scores based on various criteria.
+
+    - **player_name**: Filter scores by player's name.
+    - **name_query**: Filter scores by players whose name contains every
+      word of the query, e.g. `smi` finds `Jane Smith`.
+    - **player_team**: Filter scores by player's team.
+    - **min_score**: Filter scores with a minimum value.
+    - **start_date**: Start date for score range filter.
+    - **end_date**: End date for score range filter.
+    - **sort**: Ordering of the results (ties are broken by ID).
+    - **cursor**: Continue after the page that returned this cursor, the
+      cost of a page does not depend on how deep it is. Takes precedence
+      over **page**.
+    - **include_total**: `exact` counts the matching scores, `estimate`
+      returns a cheap approximation for large results and `false` skips
+      the count entirely.
+    - **If-None-Match**: ETag of a previous response, answered with 304
+      and no body while the page is unchanged.
+    - **returns**: A list of scores matching the criteria.
+    """
+    # Responses are cached per filter and page, see SearchResultCache.
+    search_result = await score_service.search_scores_json(
+        player_name=player_name,
+        player_team=player_team,
+        min_score=min_score,
+        start_date=start_date,
+        end_date=end_date,
+        page=page,
+        page_size=page_size,
+        sort_order=sort,
+        cursor=cursor,
+        include_total=include_total,
+        name_query=name_query
+    )
+
+    if search_result.is_ok:
+        return conditional_json_response(
+            search_result.data,
+            if_none_match,
+            SEARCH_SCORES_CACHE_CONTROL
+        )
+    elif search_result.is_bad_request:
+        raise_bad_request_exception(search_result.error_message)
+    else:
+        raise Exception(search_result.error_message)
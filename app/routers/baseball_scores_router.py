@@ -1,42 +1,284 @@
 # Standard library imports
+import io
 from datetime import date
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 # Third-party imports
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 # Local application imports
 from app.dependencies import get_score_service
+from app.domain.batch_write_mode import BatchWriteMode
+from app.domain.score_file_format import ScoreFileFormat
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.helper.etag_helper import conditional_json_response
+from app.helper.score_import_reader import read_import_rows
+from app.schemas.bulk_score_create_response import BulkScoreCreateResponse
+from app.schemas.bulk_score_write_response import BulkScoreWriteResponse
 from app.schemas.pagination_response import PaginationResponse
+from app.schemas.score_batch_schema import (
+    ScoreBatchRequest,
+    ScoreBatchResponse,
+    ScoreKey,
+)
 from app.schemas.score_create_schema import ScoreCreate
 from app.schemas.score_dto import ScoreDTO
+from app.schemas.score_import_report import ScoreImportReport
 from app.schemas.score_update_schema import ScoreUpdate
 from app.services.score_service import ScoreService
+from app.settings import (
+    BATCH_WRITE_MAX_ITEMS,
+    BULK_CREATE_MAX_ITEMS,
+    BULK_INSERT_BATCH_SIZE,
+    EXPORT_CHUNK_SIZE,
+    GET_SCORE_CACHE_CONTROL,
+    SEARCH_SCORES_CACHE_CONTROL,
+)
 
 router = APIRouter()
 
 
+# Declared before "/scores/{score_id}" so "export" is not read as an ID.
+@router.get(
+    "/scores/export",
+    summary="Export scores",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "Matching scores ordered by ID",
+        },
+    },
+)
+def export_scores(
+    player_name: Optional[str] = Query(
+        None, description="Filter by player's name"
+    ),
+    player_team: Optional[str] = Query(
+        None, description="Filter by player's team"
+    ),
+    min_score: Optional[int] = Query(
+        None, ge=0, description="Minimum score filter"
+    ),
+    start_date: Optional[date] = Query(
+        None, description="Start date of the range"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="End date of the range"
+    ),
+    file_format: ScoreFileFormat = Query(
+        ScoreFileFormat.NDJSON, description="Output format"
+    ),
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Stream every baseball score matching the criteria, without pagination.
+
+    Rows are read from the database and written to the response in chunks
+    so memory use stays flat however large the export is.
+
+    - **player_name**: Filter scores by player's name.
+    - **player_team**: Filter scores by player's team.
+    - **min_score**: Filter scores with a minimum value.
+    - **start_date**: Start date for score range filter.
+    - **end_date**: End date for score range filter.
+    - **file_format**: `ndjson` (default) or `csv`.
+    - **returns**: The matching scores ordered by ID.
+    """
+    export_result = score_service.export_scores(
+        player_name=player_name,
+        player_team=player_team,
+        min_score=min_score,
+        start_date=start_date,
+        end_date=end_date,
+        file_format=file_format,
+        chunk_size=EXPORT_CHUNK_SIZE
+    )
+
+    if export_result.is_ok:
+        return StreamingResponse(
+            export_result.data,
+            media_type=file_format.media_type,
+            headers={
+                "Content-Disposition":
+                    f'attachment; filename="scores.{file_format.value}"'
+            }
+        )
+    else:
+        raise Exception(export_result.error_message)
+
+
+# Declared before "/scores/{score_id}" so "batch" is not read as an ID.
+@router.get(
+    "/scores/batch",
+    response_model=ScoreBatchResponse,
+    summary="Get many scores by ID",
+    status_code=status.HTTP_200_OK,
+    responses={400: {"description": "Invalid or too many IDs"}},
+)
+def get_scores_by_ids(
+    ids: List[str] = Query(
+        ..., description="Score IDs, repeated or comma separated"
+    ),
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Retrieve many baseball scores by ID with a single query.
+
+    - **ids**: The IDs, as `ids=1&ids=2` or `ids=1,2`.
+    - **returns**: The scores found in request order, and the IDs that
+      have no score.
+    """
+    try:
+        score_ids = [
+            int(score_id)
+            for value in ids
+            for score_id in value.split(",")
+            if score_id.strip()
+        ]
+    except ValueError:
+        raise_bad_request_exception("IDs must be integers.")
+
+    return read_score_batch(score_service, score_ids, [])
+
+
+@router.post(
+    "/scores/batch",
+    response_model=ScoreBatchResponse,
+    summary="Get many scores by ID or by player and date",
+    status_code=status.HTTP_200_OK,
+    responses={400: {"description": "Too many IDs and keys"}},
+)
+def get_scores_by_ids_and_keys(
+    batch: ScoreBatchRequest,
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Retrieve many baseball scores, for lists too long for a query string
+    or to look scores up by player and date.
+
+    - **ids**: Score IDs.
+    - **keys**: `player_name` and `match_date` pairs.
+    - **returns**: The scores found in request order, IDs first then keys,
+      and the IDs and keys that have no score.
+    """
+    return read_score_batch(score_service, batch.ids, batch.keys)
+
+
+# Declared before "/scores/{score_id}", see get_scores_by_ids.
+@router.patch(
+    "/scores/batch",
+    response_model=BulkScoreWriteResponse,
+    summary="Update many scores",
+    status_code=status.HTTP_200_OK,
+    responses={422: {"description": "Validation Error"}},
+)
+def patch_scores(
+    patches: List[Dict[str, Any]] = Body(
+        ..., max_length=BATCH_WRITE_MAX_ITEMS
+    ),
+    mode: BatchWriteMode = Query(
+        BatchWriteMode.ATOMIC, description="atomic or best_effort"
+    ),
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Update many baseball scores in a single transaction.
+
+    - **patches**: The updates, each shaped like the body of
+      PATCH /scores/{score_id} with the `id` of the score added.
+    - **mode**: `atomic` (default) writes nothing unless every patch
+      succeeds, `best_effort` keeps the patches that succeed.
+    - **returns**: Per-item outcome (`updated`, `not_found`, `conflict`,
+      `invalid` or `rolled_back`) in request order, plus counts and
+      whether the batch was committed.
+    """
+    update_result = score_service.update_scores(patches, mode)
+
+    if update_result.is_ok:
+        return update_result.data
+    else:
+        raise Exception(update_result.error_message)
+
+
+@router.delete(
+    "/scores/batch",
+    response_model=BulkScoreWriteResponse,
+    summary="Delete many scores",
+    status_code=status.HTTP_200_OK,
+    responses={422: {"description": "Validation Error"}},
+)
+def delete_scores(
+    ids: List[int] = Body(..., max_length=BATCH_WRITE_MAX_ITEMS),
+    mode: BatchWriteMode = Query(
+        BatchWriteMode.ATOMIC, description="atomic or best_effort"
+    ),
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Delete many baseball scores in a single transaction.
+
+    - **ids**: The IDs of the scores to delete.
+    - **mode**: `atomic` (default) deletes nothing unless every score
+      exists, `best_effort` deletes the ones that do.
+    - **returns**: Per-item outcome (`deleted`, `not_found`, `invalid` or
+      `rolled_back`) in request order, plus counts and whether the batch
+      was committed.
+    """
+    delete_result = score_service.delete_scores(ids, mode)
+
+    if delete_result.is_ok:
+        return delete_result.data
+    else:
+        raise Exception(delete_result.error_message)
+
+
 @router.get(
     "/scores/{score_id}",
     response_model=ScoreDTO,
     summary="Get a score by ID",
     status_code=status.HTTP_200_OK,
-    responses={404: {"description": "Score not found"}},
+    responses={
+        304: {"description": "Score unchanged since the given ETag"},
+        404: {"description": "Score not found"},
+    },
 )
 def get_score(
     score_id: int,
+    if_none_match: Optional[str] = Header(None),
     score_service: ScoreService = Depends(get_score_service)
 ):
     """
     Retrieve a specific baseball score by its ID.
 
     - **score_id**: The unique identifier of the score.
+    - **If-None-Match**: ETag of a previous response, answered with 304
+      and no body while the score is unchanged.
     - **returns**: The created score details.
     """
-    get_result = score_service.get_score(score_id)
+    get_result = score_service.get_score_json(score_id)
 
     if get_result.is_ok:
-        return get_result.data
+        # The ETag is that of the body, a missing score is never a 304.
+        return conditional_json_response(
+            get_result.data,
+            if_none_match,
+            GET_SCORE_CACHE_CONTROL
+        )
     elif get_result.is_not_found:
         raise_not_found_exception(f"No score for ID [{score_id}] not found.")
     else:
@@ -72,12 +314,104 @@ def create_score(
         raise Exception(create_result.error_message)
 
 
+@router.post(
+    "/scores/bulk",
+    response_model=BulkScoreCreateResponse,
+    summary="Create many scores",
+    status_code=status.HTTP_200_OK,
+    responses={422: {"description": "Validation Error"}},
+)
+def create_scores(
+    scores_to_create: List[Dict[str, Any]] = Body(
+        ..., max_length=BULK_CREATE_MAX_ITEMS
+    ),
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Create many baseball scores in a few transactions.
+
+    - **scores_to_create**: The scores to be created, each one shaped like
+      the body of POST /scores.
+    - **returns**: Per-item outcome (`created`, `conflict`, `invalid` or
+      `error`) in request order, plus a count for each outcome.
+    """
+    create_result = score_service.create_scores(scores_to_create)
+
+    if create_result.is_ok:
+        return create_result.data
+    else:
+        raise Exception(create_result.error_message)
+
+
+@router.post(
+    "/scores/import",
+    response_model=ScoreImportReport,
+    summary="Import scores from a CSV or NDJSON file",
+    status_code=status.HTTP_200_OK,
+    responses={400: {"description": "Unknown file format"}},
+)
+def import_scores(
+    file: UploadFile = File(
+        ..., description="CSV with a header row, or one JSON object per line"
+    ),
+    file_format: Optional[ScoreFileFormat] = Query(
+        None, description="File format, guessed from the file name if unset"
+    ),
+    batch_size: int = Query(
+        BULK_INSERT_BATCH_SIZE,
+        ge=1,
+        le=BULK_CREATE_MAX_ITEMS,
+        description="Number of rows written per transaction"
+    ),
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Import baseball scores from an uploaded file.
+
+    The file is read line by line and written in batches, so its size is
+    not limited by memory. Batches are committed as they go: rows imported
+    before a failure stay imported.
+
+    - **file**: CSV or NDJSON file with the fields of POST /scores.
+    - **file_format**: `csv` or `ndjson`.
+    - **batch_size**: Number of rows written per transaction.
+    - **returns**: Counts per outcome and the first rejected lines.
+    """
+    file_format = file_format or ScoreFileFormat.from_filename(file.filename)
+    if file_format is None:
+        raise_bad_request_exception(
+            "Unknown file format, use a .csv or .ndjson file or set "
+            "file_format."
+        )
+
+    lines = io.TextIOWrapper(
+        file.file,
+        encoding="utf-8-sig",
+        errors="replace",
+        newline=""
+    )
+    try:
+        import_result = score_service.import_scores(
+            read_import_rows(lines, file_format),
+            batch_size=batch_size
+        )
+    finally:
+        # Leave closing the upload to FastAPI.
+        lines.detach()
+
+    if import_result.is_ok:
+        return import_result.data
+    else:
+        raise Exception(import_result.error_message)
+
+
 @router.patch(
     "/scores/{score_id}",
     summary="Update a score by ID",
     status_code=status.HTTP_200_OK,
     responses={
         404: {"description": "Score not found"},
+        409: {"description": "Score already exists for player and date"},
         422: {"description": "Validation Error"},
     },
 )
@@ -99,6 +433,11 @@ def patch_score(
         return update_result.data
     elif update_result.is_not_found:
         raise_not_found_exception(f"No score for ID [{score_id}] not found.")
+    elif update_result.is_conflict:
+        raise_conflict_exception(
+            f"Another score already exists for the PLAYER NAME and date "
+            f"of score ID [{score_id}]."
+        )
     else:
         raise Exception(update_result.error_message)
 
@@ -134,11 +473,20 @@ def delete_score(
     response_model=PaginationResponse,
     summary="Search scores",
     status_code=status.HTTP_200_OK,
+    responses={
+        304: {"description": "No score changed since the given ETag"},
+    },
 )
 def search_scores(
     player_name: Optional[str] = Query(
         None, description="Filter by player's name"
     ),
+    name_query: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=100,
+        description="Words the player's name contains, in any ASCII case"
+    ),
     player_team: Optional[str] = Query(
         None, description="Filter by player's team"
     ),
@@ -157,37 +505,83 @@ def search_scores(
     page_size: int = Query(
         10, ge=5, le=100, description="Number of results per page"
     ),
+    sort: ScoreSortOrder = Query(
+        ScoreSortOrder.MATCH_DATE_ASC,
+        description="Result ordering, prefix with '-' for descending"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by previous page"
+    ),
+    include_total: TotalCountMode = Query(
+        TotalCountMode.EXACT,
+        description="Skip ('false'), count ('exact') or estimate the total"
+    ),
+    if_none_match: Optional[str] = Header(None),
     score_service: ScoreService = Depends(get_score_service)
 ):
     """
     Search for baseball scores based on various criteria.
 
     - **player_name**: Filter scores by player's name.
+    - **name_query**: Filter scores by players whose name contains every
+      word of the query, e.g. `smi` finds `Jane Smith`.
     - **player_team**: Filter scores by player's team.
     - **min_score**: Filter scores with a minimum value.
     - **start_date**: Start date for score range filter.
     - **end_date**: End date for score range filter.
+    - **sort**: Ordering of the results (ties are broken by ID).
+    - **cursor**: Continue after the page that returned this cursor, the
+      cost of a page does not depend on how deep it is. Takes precedence
+      over **page**.
+    - **include_total**: `exact` counts the matching scores, `estimate`
+      returns a cheap approximation for large results and `false` skips
+      the count entirely.
+    - **If-None-Match**: ETag of a previous response, answered with 304
+      and no body while the page is unchanged.
     - **returns**: A list of scores matching the criteria.
     """
-    # TODO: this is ok for this small api but for bigger one
-    # we would need to implement some caching and restriction
-    # to query a large amount of data
-    search_result = score_service.search_scores(
+    # Responses are cached per filter and page, see SearchResultCache.
+    search_result = score_service.search_scores_json(
         player_name=player_name,
         player_team=player_team,
         min_score=min_score,
         start_date=start_date,
         end_date=end_date,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        sort_order=sort,
+        cursor=cursor,
+        include_total=include_total,
+        name_query=name_query
     )
 
     if search_result.is_ok:
-        return search_result.data
+        return conditional_json_response(
+            search_result.data,
+            if_none_match,
+            SEARCH_SCORES_CACHE_CONTROL
+        )
+    elif search_result.is_bad_request:
+        raise_bad_request_exception(search_result.error_message)
     else:
         raise Exception(search_result.error_message)
 
 
+def read_score_batch(
+    score_service: ScoreService,
+    ids: List[int],
+    keys: List[ScoreKey]
+) -> ScoreBatchResponse:
+    get_result = score_service.get_scores(ids, keys)
+
+    if get_result.is_ok:
+        return get_result.data
+    elif get_result.is_bad_request:
+        raise_bad_request_exception(get_result.error_message)
+    else:
+        raise Exception(get_result.error_message)
+
+
 def raise_not_found_exception(detail: str):
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -195,6 +589,13 @@ def raise_not_found_exception(detail: str):
     )
 
 
+def raise_bad_request_exception(detail: str):
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=detail
+    )
+
+
 def raise_conflict_exception(detail: str):
     raise HTTPException(
         status_code=status.HTTP_409_CONFLICT,
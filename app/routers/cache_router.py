@@ -0,0 +1,42 @@
+# Standard library imports
+from typing import Dict
+
+# Third-party imports
+from fastapi import APIRouter, status
+
+# Local application imports
+from app.dependencies import (
+    score_count_cache,
+    score_entity_cache,
+    score_json_cache,
+    score_search_cache,
+)
+from app.schemas.cache_stats import CacheStats
+
+router = APIRouter()
+
+
+@router.get(
+    "/cache/stats",
+    response_model=Dict[str, CacheStats],
+    summary="Get cache statistics",
+    status_code=status.HTTP_200_OK,
+)
+def get_cache_stats():
+    """
+    Report size, hit/miss, eviction and invalidation counters of the
+    in-process caches.
+
+    - **returns**: Statistics keyed by cache name, disabled caches are
+      omitted.
+    """
+    caches = {
+        "score_entities": score_entity_cache,
+        "score_searches": score_search_cache,
+        "score_json": score_json_cache,
+        "search_counts": score_count_cache,
+    }
+    return {
+        name: cache.stats() for name, cache in caches.items()
+        if cache is not None
+    }
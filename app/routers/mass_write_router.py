@@ -0,0 +1,171 @@
+# Standard library imports
+from typing import List
+
+# Third-party imports
+from fastapi import APIRouter, Depends, HTTPException, status
+
+# Local application imports
+from app.dependencies import get_mass_write_jobs, get_score_service
+from app.domain.mass_write_kind import MassWriteKind
+from app.jobs.mass_write_jobs import MassWriteJob, MassWriteJobs
+from app.schemas.mass_write_schema import (
+    MassWriteJobDTO,
+    ScoreFilter,
+    ScoreMassUpdate,
+)
+from app.services.score_service import ScoreService
+
+router = APIRouter()
+
+
+@router.post(
+    "/scores/jobs/delete",
+    response_model=MassWriteJobDTO,
+    summary="Start deleting the scores matching a filter",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={422: {"description": "Validation Error"}},
+)
+def start_mass_delete(
+    score_filter: ScoreFilter,
+    jobs: MassWriteJobs = Depends(get_mass_write_jobs)
+):
+    """
+    Delete every score matching the filter in the background, in short
+    transactions over ranges of score IDs so other requests keep going.
+
+    - **score_filter**: Same filters as GET /scores, at least one is
+      required.
+    - **returns**: The job, to poll with GET /scores/jobs/{job_id}.
+    """
+    job = jobs.submit(MassWriteJob(MassWriteKind.DELETE, score_filter))
+    return job.snapshot()
+
+
+@router.post(
+    "/scores/jobs/update",
+    response_model=MassWriteJobDTO,
+    summary="Start updating the scores matching a filter",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        400: {"description": "Player or date change off SQLite"},
+        422: {"description": "Validation Error"},
+    },
+)
+def start_mass_update(
+    mass_update: ScoreMassUpdate,
+    jobs: MassWriteJobs = Depends(get_mass_write_jobs),
+    score_service: ScoreService = Depends(get_score_service)
+):
+    """
+    Update every score matching the filter in the background, in short
+    transactions over ranges of score IDs so other requests keep going.
+
+    Scores whose new player and date would already be taken are left
+    unchanged and counted in `rows_skipped`.
+
+    - **filter**: Same filters as GET /scores, at least one is required.
+    - **player_name**, **player_team**, **score**: New values, optional.
+    - **shift_days**: Days added to the match date, optional.
+    - **returns**: The job, to poll with GET /scores/jobs/{job_id}.
+
+    Changing player_name or shift_days is refused with a 400 off SQLite.
+    """
+    updated_data = mass_update.model_dump(
+        include={'player_name', 'player_team', 'score'},
+        exclude_unset=True
+    )
+    check_result = score_service.check_mass_update(
+        updated_data,
+        mass_update.shift_days
+    )
+    if check_result.is_bad_request:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=check_result.error_message
+        )
+    job = jobs.submit(
+        MassWriteJob(
+            MassWriteKind.UPDATE,
+            mass_update.filter,
+            updated_data=updated_data,
+            shift_days=mass_update.shift_days
+        )
+    )
+    return job.snapshot()
+
+
+@router.get(
+    "/scores/jobs",
+    response_model=List[MassWriteJobDTO],
+    summary="List mass delete and update jobs",
+    status_code=status.HTTP_200_OK,
+)
+def list_mass_write_jobs(
+    jobs: MassWriteJobs = Depends(get_mass_write_jobs)
+):
+    """
+    List the running jobs and the most recent finished ones.
+
+    - **returns**: The jobs, most recent first.
+    """
+    return [job.snapshot() for job in jobs.list_jobs()]
+
+
+@router.get(
+    "/scores/jobs/{job_id}",
+    response_model=MassWriteJobDTO,
+    summary="Get a mass delete or update job",
+    status_code=status.HTTP_200_OK,
+    responses={404: {"description": "Job not found"}},
+)
+def get_mass_write_job(
+    job_id: str,
+    jobs: MassWriteJobs = Depends(get_mass_write_jobs)
+):
+    """
+    Report the progress of a job.
+
+    - **job_id**: The ID returned when the job was started.
+    - **returns**: Status, ID range covered and rows written so far.
+    """
+    return find_job(jobs, job_id).snapshot()
+
+
+@router.post(
+    "/scores/jobs/{job_id}/cancel",
+    response_model=MassWriteJobDTO,
+    summary="Cancel a mass delete or update job",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        404: {"description": "Job not found"},
+        409: {"description": "Job already finished"},
+    },
+)
+def cancel_mass_write_job(
+    job_id: str,
+    jobs: MassWriteJobs = Depends(get_mass_write_jobs)
+):
+    """
+    Stop a job before its next chunk. Chunks already written stay
+    written.
+
+    - **job_id**: The ID returned when the job was started.
+    - **returns**: The job, `cancelled` once its current chunk is done.
+    """
+    job = find_job(jobs, job_id)
+    if not job.cancel():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job [{job_id}] already finished."
+        )
+    return job.snapshot()
+
+
+def find_job(jobs: MassWriteJobs, job_id: str) -> MassWriteJob:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No job for ID [{job_id}] found."
+        )
+    return job
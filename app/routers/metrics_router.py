@@ -0,0 +1,33 @@
+# Third-party imports
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
+
+# Local application imports
+from app.dependencies import get_request_metrics
+from app.metrics.request_metrics import RequestMetrics
+
+router = APIRouter()
+
+# Content type of the Prometheus text exposition format.
+PROMETHEUS_MEDIA_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Get request metrics",
+    status_code=status.HTTP_200_OK,
+)
+def get_metrics(
+    request_metrics: RequestMetrics = Depends(get_request_metrics)
+):
+    """
+    Report per route latency histograms, status code counts and the SQL
+    statements run by requests, in the Prometheus text format.
+
+    - **returns**: The metrics as `text/plain; version=0.0.4`.
+    """
+    return PlainTextResponse(
+        request_metrics.render(),
+        media_type=PROMETHEUS_MEDIA_TYPE
+    )
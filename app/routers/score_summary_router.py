@@ -0,0 +1,220 @@
+# Standard library imports
+from datetime import date
+from typing import List, Optional
+
+# Third-party imports
+from fastapi import APIRouter, Depends, Query, status
+
+# Local application imports
+from app.dependencies import get_score_summary_service
+from app.routers.baseball_scores_router import (
+    raise_bad_request_exception,
+    raise_not_found_exception,
+)
+from app.schemas.score_total_dto import PlayerTotalDTO, TeamTotalDTO
+from app.services.score_summary_service import ScoreSummaryService
+from app.settings import SUMMARY_MAX_ITEMS
+
+# Aggregates read from the summary tables maintained by database triggers,
+# see models/score_summaries.py.
+router = APIRouter()
+
+
+@router.get(
+    "/leaderboards/players",
+    response_model=List[PlayerTotalDTO],
+    summary="Get the top players",
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"description": "Both a season and a date range were given"},
+    },
+)
+def get_player_leaderboard(
+    limit: int = Query(
+        10, ge=1, le=SUMMARY_MAX_ITEMS, description="Number of players"
+    ),
+    season: Optional[int] = Query(
+        None, description="Rank on the totals of this year only"
+    ),
+    start_date: Optional[date] = Query(
+        None, description="Start date of the range"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="End date of the range"
+    ),
+    summary_service: ScoreSummaryService = Depends(get_score_summary_service)
+):
+    """
+    Rank players by total score, highest first, ties by name.
+
+    - **limit**: Number of players returned.
+    - **season**: Rank on one calendar year instead of whole careers.
+    - **start_date** / **end_date**: Rank on an arbitrary date range.
+      Career and season rankings read only `limit` precomputed totals,
+      date ranges add up the scores of the range and cost more.
+    - **returns**: The top players with their number of matches, total
+      and average score.
+    """
+    leaderboard_result = summary_service.get_player_leaderboard(
+        limit,
+        season=season,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+    if leaderboard_result.is_ok:
+        return leaderboard_result.data
+    elif leaderboard_result.is_bad_request:
+        raise_bad_request_exception(leaderboard_result.error_message)
+    else:
+        raise Exception(leaderboard_result.error_message)
+
+
+@router.get(
+    "/summaries/players",
+    response_model=List[PlayerTotalDTO],
+    summary="Search players by name",
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"description": "Blank name query"},
+    },
+)
+def search_players(
+    name_query: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Words the player's name contains, in any ASCII case"
+    ),
+    limit: int = Query(
+        10, ge=1, le=SUMMARY_MAX_ITEMS, description="Number of players"
+    ),
+    summary_service: ScoreSummaryService = Depends(get_score_summary_service)
+):
+    """
+    Find players from part of their name, e.g. `smi` finds `Jane Smith`.
+
+    - **name_query**: Words that must all appear in the name.
+    - **limit**: Number of players returned.
+    - **returns**: Career totals of the matching players, best matches
+      first.
+    """
+    search_result = summary_service.search_players(name_query, limit)
+
+    if search_result.is_ok:
+        return search_result.data
+    elif search_result.is_bad_request:
+        raise_bad_request_exception(search_result.error_message)
+    else:
+        raise Exception(search_result.error_message)
+
+
+@router.get(
+    "/summaries/players/{player_name}",
+    response_model=PlayerTotalDTO,
+    summary="Get the career totals of a player",
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"description": "Player has no score"},
+    },
+)
+def get_player_total(
+    player_name: str,
+    summary_service: ScoreSummaryService = Depends(get_score_summary_service)
+):
+    """
+    Retrieve the number of matches, total and average score of a player.
+
+    - **player_name**: Name of the player.
+    - **returns**: The career totals of the player.
+    """
+    total_result = summary_service.get_player_total(player_name)
+
+    if total_result.is_ok:
+        return total_result.data
+    elif total_result.is_not_found:
+        raise_not_found_exception(
+            f"No score found for player [{player_name}]."
+        )
+    else:
+        raise Exception(total_result.error_message)
+
+
+@router.get(
+    "/summaries/teams/daily",
+    response_model=List[TeamTotalDTO],
+    summary="Get team totals per day",
+    status_code=status.HTTP_200_OK,
+)
+def get_team_daily_totals(
+    player_team: Optional[str] = Query(
+        None, description="Filter by team"
+    ),
+    start_date: Optional[date] = Query(
+        None, description="Start date of the range"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="End date of the range"
+    ),
+    limit: int = Query(
+        100, ge=1, le=SUMMARY_MAX_ITEMS, description="Number of totals"
+    ),
+    summary_service: ScoreSummaryService = Depends(get_score_summary_service)
+):
+    """
+    Retrieve the totals of each team for each day it played.
+
+    - **player_team**: Only return the totals of this team.
+    - **start_date** / **end_date**: Only return the days of this range.
+    - **limit**: Maximum number of totals returned.
+    - **returns**: Totals ordered by date, then team.
+    """
+    totals_result = summary_service.get_team_daily_totals(
+        player_team,
+        start_date,
+        end_date,
+        limit
+    )
+
+    if totals_result.is_ok:
+        return totals_result.data
+    else:
+        raise Exception(totals_result.error_message)
+
+
+@router.get(
+    "/summaries/teams/seasons",
+    response_model=List[TeamTotalDTO],
+    summary="Get team totals per season",
+    status_code=status.HTTP_200_OK,
+)
+def get_team_season_totals(
+    player_team: Optional[str] = Query(
+        None, description="Filter by team"
+    ),
+    season: Optional[int] = Query(
+        None, description="Filter by calendar year"
+    ),
+    limit: int = Query(
+        100, ge=1, le=SUMMARY_MAX_ITEMS, description="Number of totals"
+    ),
+    summary_service: ScoreSummaryService = Depends(get_score_summary_service)
+):
+    """
+    Retrieve the totals of each team for each calendar year it played.
+
+    - **player_team**: Only return the totals of this team.
+    - **season**: Only return the totals of this year.
+    - **limit**: Maximum number of totals returned.
+    - **returns**: Totals ordered by season, then team.
+    """
+    totals_result = summary_service.get_team_season_totals(
+        player_team,
+        season,
+        limit
+    )
+
+    if totals_result.is_ok:
+        return totals_result.data
+    else:
+        raise Exception(totals_result.error_message)
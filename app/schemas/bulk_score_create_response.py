@@ -0,0 +1,25 @@
+# Standard library imports
+from typing import List, Optional
+
+# Related third-party imports
+from pydantic import BaseModel
+
+# Local application/library specific imports
+from app.domain.bulk_item_status import BulkItemStatus
+from app.schemas.score_dto import ScoreDTO
+
+
+class BulkScoreItemResult(BaseModel):
+    # Position of the item in the request body.
+    index: int
+    status: BulkItemStatus
+    score: Optional[ScoreDTO] = None
+    error_message: Optional[str] = None
+
+
+class BulkScoreCreateResponse(BaseModel):
+    created: int
+    conflicts: int
+    invalid: int
+    errors: int
+    results: List[BulkScoreItemResult]
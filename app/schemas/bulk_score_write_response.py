@@ -0,0 +1,19 @@
+# Standard library imports
+from typing import List
+
+# Related third-party imports
+from pydantic import BaseModel
+
+# Local application/library specific imports
+from app.schemas.bulk_score_create_response import BulkScoreItemResult
+
+
+class BulkScoreWriteResponse(BaseModel):
+    # False when an atomic batch failed and nothing was written.
+    committed: bool
+    # Items updated or deleted.
+    applied: int
+    not_found: int
+    conflicts: int
+    invalid: int
+    results: List[BulkScoreItemResult]
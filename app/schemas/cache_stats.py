@@ -0,0 +1,17 @@
+# Related third-party imports
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    # Entries dropped to stay within max_entries.
+    evictions: int
+    # Entries dropped because they outlived ttl_seconds.
+    expirations: int
+    # Entries dropped because a write changed the data they hold.
+    invalidations: int
@@ -0,0 +1,71 @@
+# Standard library imports
+from datetime import date, datetime
+from typing import Optional
+
+# Related third-party imports
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+# Local application/library specific imports
+from app.domain.mass_write_kind import MassWriteKind
+from app.domain.mass_write_status import MassWriteStatus
+
+
+class ScoreFilter(BaseModel):
+    player_name: Optional[str] = None
+    name_query: Optional[str] = Field(None, min_length=1, max_length=100)
+    player_team: Optional[str] = None
+    min_score: Optional[int] = Field(None, ge=0)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    # An empty filter would write every score, that has to be explicit.
+    @model_validator(mode='after')
+    def check_at_least_one_filter(self):
+        if all(value is None for value in self.model_dump().values()):
+            raise ValueError("At least one filter must be provided")
+        return self
+
+
+class ScoreMassUpdate(BaseModel):
+    filter: ScoreFilter
+    player_name: Optional[str] = Field(None, min_length=1)
+    player_team: Optional[str] = None
+    score: Optional[int] = Field(None, ge=0)
+    # Days added to match_date, negative to move scores earlier.
+    shift_days: int = 0
+
+    @model_validator(mode='after')
+    def check_at_least_one_change(self):
+        if not self.shift_days and not (
+            self.model_fields_set & {'player_name', 'player_team', 'score'}
+        ):
+            raise ValueError("At least one field must be provided for update")
+        return self
+
+    @field_validator('player_name', mode='before')
+    def validate_player_name(cls, value):
+        if value is not None and not value.strip():
+            raise ValueError("Player name must not be empty or blank")
+        return value
+
+
+class MassWriteJobDTO(BaseModel):
+    id: str
+    kind: MassWriteKind
+    status: MassWriteStatus
+    filter: ScoreFilter
+    # Score IDs covered by the job, None until it started or on an empty
+    # table. Scores created after it started are left out.
+    first_id: Optional[int] = None
+    last_id: Optional[int] = None
+    # Share of the ID range done, from 0 to 1.
+    progress: float
+    chunks: int
+    rows_written: int
+    # Updated scores that would have had the same player and date as
+    # another score, left unchanged.
+    rows_skipped: int
+    cancel_requested: bool
+    error_message: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
@@ -1,5 +1,5 @@
 # Standard library imports
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 # Related third-party imports
 from pydantic import BaseModel
@@ -8,10 +8,15 @@ T = TypeVar("T")
 
 
 class Pagination(BaseModel):
-    total_items: int
-    total_pages: int
-    current_page: int
+    # None when the total was not requested.
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
+    total_is_estimate: bool = False
+    # None when the page was requested with a cursor.
+    current_page: Optional[int] = None
     page_size: int
+    # Opaque cursor to fetch the following page, None on the last page.
+    next_cursor: Optional[str] = None
 
 
 class PaginationResponse(BaseModel, Generic[T]):
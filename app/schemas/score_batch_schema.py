@@ -0,0 +1,29 @@
+# Standard library imports
+from datetime import date
+from typing import List
+
+# Related third-party imports
+from pydantic import BaseModel, ConfigDict
+
+# Local application/library specific imports
+from app.schemas.score_dto import ScoreDTO
+
+
+class ScoreKey(BaseModel):
+    player_name: str
+    match_date: date
+
+    # Hashable, so keys can be deduplicated and looked up.
+    model_config = ConfigDict(frozen=True)
+
+
+class ScoreBatchRequest(BaseModel):
+    ids: List[int] = []
+    keys: List[ScoreKey] = []
+
+
+class ScoreBatchResponse(BaseModel):
+    # Found scores in request order, IDs first then keys, each score once.
+    items: List[ScoreDTO]
+    missing_ids: List[int]
+    missing_keys: List[ScoreKey]
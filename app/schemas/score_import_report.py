@@ -0,0 +1,25 @@
+# Standard library imports
+from typing import List
+
+# Related third-party imports
+from pydantic import BaseModel
+
+# Local application/library specific imports
+from app.domain.bulk_item_status import BulkItemStatus
+
+
+class ImportRejectedRow(BaseModel):
+    line_number: int
+    status: BulkItemStatus
+    error_message: str
+
+
+class ScoreImportReport(BaseModel):
+    rows_read: int = 0
+    created: int = 0
+    conflicts: int = 0
+    invalid: int = 0
+    errors: int = 0
+    # Only the first rejections are listed to keep the report small.
+    rejected: List[ImportRejectedRow] = []
+    rejected_truncated: bool = False
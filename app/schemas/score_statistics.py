@@ -0,0 +1,46 @@
+# Standard library imports
+from datetime import date
+from typing import Dict, List, Optional
+
+# Related third-party imports
+from pydantic import BaseModel
+
+
+class HistogramBin(BaseModel):
+    # Scores in [lower, upper), the last bin also includes upper.
+    lower: float
+    upper: float
+    count: int
+
+
+class ScoreStatistics(BaseModel):
+    count: int
+    # None when no score matches.
+    mean: Optional[float] = None
+    stddev: Optional[float] = None
+    min: Optional[int] = None
+    max: Optional[int] = None
+    # Keyed by the requested percentile, e.g. "90".
+    percentiles: Dict[str, float] = {}
+    histogram: List[HistogramBin] = []
+
+
+class RollingAveragePoint(BaseModel):
+    match_date: date
+    # Mean score of the matches played in the window ending on match_date.
+    average_score: float
+    matches: int
+
+
+class ColumnStoreStats(BaseModel):
+    rows: int
+    # Rows deleted but not compacted away yet.
+    deleted_rows: int
+    capacity: int
+    players: int
+    teams: int
+    memory_bytes: int
+    build_seconds: float
+    writes_applied: int
+    # Mean cost of applying one repository write to the arrays.
+    mean_write_microseconds: float
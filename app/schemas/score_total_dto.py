@@ -0,0 +1,33 @@
+# Standard library imports
+from datetime import date
+from typing import Optional
+
+# Related third-party imports
+from pydantic import BaseModel, ConfigDict, computed_field
+
+
+class ScoreTotalDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    @computed_field
+    @property
+    def average_score(self) -> float:
+        return self.total_score / self.matches if self.matches else 0.0
+
+
+class PlayerTotalDTO(ScoreTotalDTO):
+    player_name: str
+    # None for career and date range totals.
+    season: Optional[int] = None
+    matches: int
+    total_score: int
+
+
+class TeamTotalDTO(ScoreTotalDTO):
+    player_team: str
+    # Set for daily totals.
+    match_date: Optional[date] = None
+    # Set for season totals.
+    season: Optional[int] = None
+    matches: int
+    total_score: int
@@ -30,3 +30,8 @@ class ScoreUpdate(BaseModel):
         if value is not None and not value.strip():
             raise ValueError("Player name must not be empty or blank")
         return value
+
+
+class ScoreBatchUpdate(ScoreUpdate):
+    # Score the patch applies to.
+    id: int
@@ -0,0 +1,243 @@
+# Standard library imports
+from datetime import date
+from typing import Optional
+
+# Local application/library specific imports
+from app.cache.score_entity_cache import ScoreEntityCache
+from app.cache.score_json_cache import ScoreJsonCache
+from app.cache.search_result_cache import SearchCacheKey, SearchResultCache
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.service_result import ServiceResult
+from app.domain.total_count_mode import TotalCountMode
+from app.helper.cursor_helper import decode_cursor
+from app.helper.score_json_writer import encode_score_json
+from app.mappings.score_mapping import convert_score_entity_to_dto
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.async_baseball_player_score_repository import (
+    AsyncBaseballPlayerScoreRepository,
+)
+from app.schemas.pagination_response import PaginationResponse
+from app.schemas.score_create_schema import ScoreCreate
+from app.schemas.score_dto import ScoreDTO
+from app.schemas.score_update_schema import ScoreUpdate
+from app.services.score_service import (
+    build_search_json,
+    build_search_response,
+    encode_score_rows,
+)
+
+
+class AsyncScoreService:
+    def __init__(
+        self,
+        repository: AsyncBaseballPlayerScoreRepository,
+        entity_cache: Optional[ScoreEntityCache] = None,
+        search_cache: Optional[SearchResultCache] = None,
+        json_cache: Optional[ScoreJsonCache] = None
+    ):
+        self.repository = repository
+        self.entity_cache = entity_cache
+        self.search_cache = search_cache
+        self.json_cache = json_cache
+
+    async def create_score(
+        self,
+        score: ScoreCreate
+    ) -> ServiceResult[ScoreDTO]:
+        # map score DTO to model.
+        score_model = BaseballPlayerScore(**score.model_dump())
+
+        # A duplicate player and date is rejected by the unique constraint
+        # within the insert itself.
+        create_result = await self.repository.create(score_model)
+        if create_result.is_conflict:
+            return ServiceResult.conflict(
+                error_message="Score already exists for player and date"
+            )
+        return ServiceResult.from_repository_action_result(
+            create_result,
+            convert_score_entity_to_dto
+        )
+
+    async def get_score(self, score_id: int) -> ServiceResult[ScoreDTO]:
+        if self.entity_cache is not None:
+            cached = self.entity_cache.get(score_id)
+            if cached is not None:
+                return ServiceResult.ok(cached)
+            generation = self.entity_cache.generation
+
+        get_result = await self.repository.get_by_id(score_id)
+        service_result = ServiceResult.from_repository_action_result(
+            get_result,
+            convert_score_entity_to_dto
+        )
+        if self.entity_cache is not None and service_result.is_ok:
+            self.entity_cache.set(score_id, service_result.data, generation)
+        return service_result
+
+    async def get_score_json(self, score_id: int) -> ServiceResult[bytes]:
+        """
+        Same as get_score, returned as the encoded JSON of the ScoreDTO,
+        reused from the JSON cache while the score is unchanged.
+        """
+        get_result = await self.get_score(score_id)
+        if not get_result.is_ok:
+            return get_result
+        if self.json_cache is None:
+            return ServiceResult.ok(encode_score_json(get_result.data))
+        return ServiceResult.ok(self.json_cache.encode_row(get_result.data))
+
+    async def update_score(
+        self,
+        score_id: int,
+        score: ScoreUpdate
+    ) -> ServiceResult[ScoreDTO]:
+        # Convert Pydantic model to dictionary, excluding unset fields
+        score_data = score.model_dump(exclude_unset=True)
+
+        update_result = await self.repository.update(score_id, score_data)
+        return ServiceResult.from_repository_action_result(
+            update_result,
+            convert_score_entity_to_dto
+        )
+
+    async def delete_score(self, score_id: int) -> ServiceResult[None]:
+        delete_result = await self.repository.delete(score_id)
+        return ServiceResult.from_repository_action_result(
+            delete_result,
+            convert_score_entity_to_dto
+        )
+
+    async def search_scores(
+        self,
+        player_name: Optional[str],
+        player_team: Optional[str],
+        min_score: Optional[int],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        page: int,
+        page_size: int,
+        sort_order: ScoreSortOrder = ScoreSortOrder.MATCH_DATE_ASC,
+        cursor: Optional[str] = None,
+        include_total: TotalCountMode = TotalCountMode.EXACT,
+        name_query: Optional[str] = None
+    ) -> ServiceResult[PaginationResponse]:
+        return await self._search(
+            ScoreSearchFilter(
+                player_name,
+                player_team,
+                min_score,
+                start_date,
+                end_date,
+                name_query
+            ),
+            page,
+            page_size,
+            sort_order,
+            cursor,
+            include_total,
+            as_json=False
+        )
+
+    async def search_scores_json(
+        self,
+        player_name: Optional[str],
+        player_team: Optional[str],
+        min_score: Optional[int],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        page: int,
+        page_size: int,
+        sort_order: ScoreSortOrder = ScoreSortOrder.MATCH_DATE_ASC,
+        cursor: Optional[str] = None,
+        include_total: TotalCountMode = TotalCountMode.EXACT,
+        name_query: Optional[str] = None
+    ) -> ServiceResult[bytes]:
+        """
+        Same search as search_scores, returned as the encoded JSON of the
+        PaginationResponse. Items are joined from cached score fragments,
+        no DTO is built for them.
+        """
+        return await self._search(
+            ScoreSearchFilter(
+                player_name,
+                player_team,
+                min_score,
+                start_date,
+                end_date,
+                name_query
+            ),
+            page,
+            page_size,
+            sort_order,
+            cursor,
+            include_total,
+            as_json=True
+        )
+
+    async def _search(
+        self,
+        search_filter: ScoreSearchFilter,
+        page: int,
+        page_size: int,
+        sort_order: ScoreSortOrder,
+        cursor: Optional[str],
+        include_total: TotalCountMode,
+        as_json: bool
+    ):
+        if self.search_cache is not None:
+            cache_key = SearchCacheKey(
+                search_filter,
+                page,
+                page_size,
+                sort_order,
+                cursor,
+                include_total,
+                as_json
+            )
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                return ServiceResult.ok(cached)
+            generation = self.search_cache.generation
+
+        after = None
+        if cursor is not None:
+            try:
+                after = decode_cursor(cursor, sort_order)
+            except ValueError as e:
+                return ServiceResult.bad_request(error_message=str(e))
+
+        search_result = await self.repository.search_scores(
+            player_name=search_filter.player_name,
+            player_team=search_filter.player_team,
+            min_score=search_filter.min_score,
+            start_date=search_filter.start_date,
+            end_date=search_filter.end_date,
+            page=page,
+            page_size=page_size,
+            sort_order=sort_order,
+            after=after,
+            include_total=include_total,
+            name_query=search_filter.name_query
+        )
+        if as_json:
+            service_result = build_search_json(
+                search_result,
+                page,
+                page_size,
+                sort_order,
+                cursor,
+                lambda rows: encode_score_rows(rows, self.json_cache)
+            )
+        else:
+            service_result = build_search_response(
+                search_result,
+                page,
+                page_size,
+                sort_order,
+                cursor
+            )
+        if self.search_cache is not None and service_result.is_ok:
+            self.search_cache.set(cache_key, service_result.data, generation)
+        return service_result
@@ -1,60 +1,377 @@
 # Standard library imports
+import time
 from datetime import date
-from typing import Optional
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Related third-party imports
+from pydantic import ValidationError
 
 # Local application/library specific imports
+from app.cache.score_entity_cache import ScoreEntityCache
+from app.cache.score_json_cache import ScoreJsonCache
+from app.cache.search_result_cache import SearchCacheKey, SearchResultCache
+from app.domain.batch_write_mode import BatchWriteMode
+from app.domain.bulk_item_status import BulkItemStatus
+from app.domain.mass_write_kind import MassWriteKind
+from app.domain.mass_write_status import MassWriteStatus
+from app.domain.pagination_result import PaginationResult
+from app.domain.repository_action_result import RepositoryActionResult
+from app.domain.score_file_format import ScoreFileFormat
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
 from app.domain.service_result import ServiceResult
+from app.domain.total_count_mode import TotalCountMode
+from app.helper.cursor_helper import decode_cursor, encode_cursor
 from app.helper.pagination_helper import calculate_total_pages
-from app.mappings.score_mapping import convert_score_entity_to_dto
+from app.helper.score_export_writer import write_export_chunks
+from app.helper.score_import_reader import ImportRow
+from app.helper.score_json_writer import encode_score_json, join_score_page
+from app.jobs.mass_write_jobs import MassWriteJob
+from app.mappings.score_mapping import (
+    convert_score_entity_to_dto,
+    convert_score_rows_to_dtos,
+)
 from app.models.baseball_player_score import BaseballPlayerScore
 from app.repositories.baseball_player_score_repository import (
     BaseballPlayerScoreRepository,
 )
+from app.schemas.bulk_score_create_response import (
+    BulkScoreCreateResponse,
+    BulkScoreItemResult,
+)
+from app.schemas.bulk_score_write_response import BulkScoreWriteResponse
 from app.schemas.pagination_response import Pagination, PaginationResponse
+from app.schemas.score_batch_schema import ScoreBatchResponse, ScoreKey
 from app.schemas.score_create_schema import ScoreCreate
 from app.schemas.score_dto import ScoreDTO
-from app.schemas.score_update_schema import ScoreUpdate
+from app.schemas.score_import_report import (
+    ImportRejectedRow,
+    ScoreImportReport,
+)
+from app.schemas.score_update_schema import ScoreBatchUpdate, ScoreUpdate
+from app.settings import (
+    BATCH_GET_MAX_ITEMS,
+    BULK_INSERT_BATCH_SIZE,
+    EXPORT_CHUNK_SIZE,
+    IMPORT_MAX_REPORTED_REJECTIONS,
+    MASS_WRITE_CHUNK_IDS,
+    MASS_WRITE_PAUSE_MS,
+)
 
 
 class ScoreService:
-    def __init__(self, repository: BaseballPlayerScoreRepository):
+    def __init__(
+        self,
+        repository: BaseballPlayerScoreRepository,
+        entity_cache: Optional[ScoreEntityCache] = None,
+        search_cache: Optional[SearchResultCache] = None,
+        json_cache: Optional[ScoreJsonCache] = None
+    ):
         self.repository = repository
+        self.entity_cache = entity_cache
+        self.search_cache = search_cache
+        self.json_cache = json_cache
 
     def create_score(
         self,
         score: ScoreCreate
     ) -> ServiceResult[ScoreDTO]:
-        # check for duplicate
-        check_result = self.repository.get_score_from_player_and_date(
-            score.player_name,
-            score.match_date
-        )
-        if check_result.is_ok:
-            return ServiceResult.conflict(
-                data=convert_score_entity_to_dto(check_result.entity),
-                error_message="Score already exists for player and date"
-            )
-        elif check_result.is_error:
-            return ServiceResult.error(
-                exception=check_result.exception,
-                error_message=check_result.error_message
-            )
-
         # map score DTO to model.
         score_model = BaseballPlayerScore(**score.model_dump())
 
+        # A duplicate player and date is rejected by the unique constraint
+        # within the insert itself.
         create_result = self.repository.create(score_model)
+        if create_result.is_conflict:
+            return ServiceResult.conflict(
+                error_message="Score already exists for player and date"
+            )
         return ServiceResult.from_repository_action_result(
             create_result,
             convert_score_entity_to_dto
         )
 
+    def create_scores(
+        self,
+        items: List[Dict[str, Any]],
+        batch_size: int = BULK_INSERT_BATCH_SIZE
+    ) -> ServiceResult[BulkScoreCreateResponse]:
+        """
+        Create many scores at once. Items are validated one by one, checked
+        for duplicates with a single set-based lookup and inserted in
+        batches of `batch_size` rows, one transaction per batch.
+        """
+        results: List[Optional[BulkScoreItemResult]] = [None] * len(items)
+        valid_items = []
+        for index, item in enumerate(items):
+            try:
+                valid_items.append((index, ScoreCreate.model_validate(item)))
+            except ValidationError as e:
+                results[index] = BulkScoreItemResult(
+                    index=index,
+                    status=BulkItemStatus.INVALID,
+                    error_message=format_validation_error(e)
+                )
+
+        existing_result = self.repository.get_existing_player_dates(
+            (score.player_name, score.match_date) for _, score in valid_items
+        )
+        if existing_result.is_error:
+            return ServiceResult.error(
+                exception=existing_result.exception,
+                error_message=existing_result.error_message
+            )
+        # Keys added while scanning also catch duplicates within the batch.
+        seen_keys = set(existing_result.entity)
+
+        to_create = []
+        for index, score in valid_items:
+            key = (score.player_name, score.match_date)
+            if key in seen_keys:
+                results[index] = BulkScoreItemResult(
+                    index=index,
+                    status=BulkItemStatus.CONFLICT,
+                    error_message="Score already exists for player and date"
+                )
+            else:
+                seen_keys.add(key)
+                to_create.append((index, score.model_dump()))
+
+        for start in range(0, len(to_create), batch_size):
+            batch = to_create[start:start + batch_size]
+            create_result = self.repository.create_many(
+                [values for _, values in batch]
+            )
+            for position, (index, _) in enumerate(batch):
+                if create_result.is_error:
+                    results[index] = BulkScoreItemResult(
+                        index=index,
+                        status=BulkItemStatus.ERROR,
+                        error_message=create_result.error_message
+                    )
+                elif create_result.entity[position].is_ok:
+                    results[index] = BulkScoreItemResult(
+                        index=index,
+                        status=BulkItemStatus.CREATED,
+                        score=convert_score_entity_to_dto(
+                            create_result.entity[position].entity
+                        )
+                    )
+                else:
+                    # Created concurrently since the lookup above.
+                    results[index] = BulkScoreItemResult(
+                        index=index,
+                        status=BulkItemStatus.CONFLICT,
+                        error_message=(
+                            "Score already exists for player and date"
+                        )
+                    )
+
+        def count(status: BulkItemStatus) -> int:
+            return sum(1 for result in results if result.status == status)
+
+        return ServiceResult.ok(
+            BulkScoreCreateResponse(
+                created=count(BulkItemStatus.CREATED),
+                conflicts=count(BulkItemStatus.CONFLICT),
+                invalid=count(BulkItemStatus.INVALID),
+                errors=count(BulkItemStatus.ERROR),
+                results=results
+            )
+        )
+
+    def import_scores(
+        self,
+        rows: Iterable[ImportRow],
+        batch_size: int = BULK_INSERT_BATCH_SIZE,
+        on_progress: Optional[Callable[[ScoreImportReport], None]] = None
+    ) -> ServiceResult[ScoreImportReport]:
+        """
+        Import a stream of parsed rows `batch_size` rows at a time, each
+        batch going through create_scores and committed on its own. Only
+        one batch is held in memory, `on_progress` is called after each.
+        """
+        report = ScoreImportReport()
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            report.rows_read += len(batch)
+
+            parsed_rows = []
+            for row in batch:
+                if row.values is None:
+                    self._reject_import_row(
+                        report,
+                        row.line_number,
+                        BulkItemStatus.INVALID,
+                        row.error_message
+                    )
+                else:
+                    parsed_rows.append(row)
+
+            create_result = self.create_scores(
+                [row.values for row in parsed_rows],
+                batch_size=batch_size
+            )
+            if not create_result.is_ok:
+                return create_result
+
+            report.created += create_result.data.created
+            for row, item in zip(parsed_rows, create_result.data.results):
+                if item.status != BulkItemStatus.CREATED:
+                    self._reject_import_row(
+                        report,
+                        row.line_number,
+                        item.status,
+                        item.error_message
+                    )
+
+            if on_progress is not None:
+                on_progress(report)
+
+        return ServiceResult.ok(report)
+
+    @staticmethod
+    def _reject_import_row(
+        report: ScoreImportReport,
+        line_number: int,
+        status: BulkItemStatus,
+        error_message: str
+    ) -> None:
+        if status == BulkItemStatus.CONFLICT:
+            report.conflicts += 1
+        elif status == BulkItemStatus.INVALID:
+            report.invalid += 1
+        else:
+            report.errors += 1
+
+        if len(report.rejected) < IMPORT_MAX_REPORTED_REJECTIONS:
+            report.rejected.append(
+                ImportRejectedRow(
+                    line_number=line_number,
+                    status=status,
+                    error_message=error_message
+                )
+            )
+        else:
+            report.rejected_truncated = True
+
     def get_score(self, score_id: int) -> ServiceResult[ScoreDTO]:
+        if self.entity_cache is not None:
+            cached = self.entity_cache.get(score_id)
+            if cached is not None:
+                return ServiceResult.ok(cached)
+            generation = self.entity_cache.generation
+
         get_result = self.repository.get_by_id(score_id)
-        return ServiceResult.from_repository_action_result(
+        service_result = ServiceResult.from_repository_action_result(
             get_result,
             convert_score_entity_to_dto
         )
+        if self.entity_cache is not None and service_result.is_ok:
+            self.entity_cache.set(score_id, service_result.data, generation)
+        return service_result
+
+    def get_scores(
+        self,
+        ids: List[int],
+        keys: List[ScoreKey]
+    ) -> ServiceResult[ScoreBatchResponse]:
+        """
+        Read many scores at once, by ID with a single IN query and by
+        player and date with the chunked key lookup. Cached scores are not
+        read again. IDs and keys without a score are listed apart.
+        """
+        ids = list(dict.fromkeys(ids))
+        keys = list(dict.fromkeys(keys))
+        if len(ids) + len(keys) > BATCH_GET_MAX_ITEMS:
+            return ServiceResult.bad_request(
+                f"At most {BATCH_GET_MAX_ITEMS} IDs and keys can be read "
+                "at once."
+            )
+
+        by_id: Dict[int, ScoreDTO] = {}
+        uncached_ids = ids
+        if self.entity_cache is not None:
+            generation = self.entity_cache.generation
+            uncached_ids = []
+            for score_id in ids:
+                cached = self.entity_cache.get(score_id)
+                if cached is not None:
+                    by_id[score_id] = cached
+                else:
+                    uncached_ids.append(score_id)
+
+        if uncached_ids:
+            get_result = self.repository.get_many(uncached_ids)
+            if get_result.is_error:
+                return ServiceResult.error(
+                    exception=get_result.exception,
+                    error_message=get_result.error_message
+                )
+            for row in get_result.entity:
+                score = convert_score_entity_to_dto(row)
+                by_id[score.id] = score
+                if self.entity_cache is not None:
+                    self.entity_cache.set(score.id, score, generation)
+
+        by_key: Dict[ScoreKey, ScoreDTO] = {}
+        if keys:
+            get_result = self.repository.get_scores_by_player_dates(
+                (key.player_name, key.match_date) for key in keys
+            )
+            if get_result.is_error:
+                return ServiceResult.error(
+                    exception=get_result.exception,
+                    error_message=get_result.error_message
+                )
+            for row in get_result.entity:
+                score = convert_score_entity_to_dto(row)
+                key = ScoreKey(
+                    player_name=score.player_name,
+                    match_date=score.match_date
+                )
+                by_key[key] = score
+
+        items = {
+            score.id: score for score in (
+                [by_id[score_id] for score_id in ids if score_id in by_id]
+                + [by_key[key] for key in keys if key in by_key]
+            )
+        }
+        return ServiceResult.ok(
+            ScoreBatchResponse(
+                items=list(items.values()),
+                missing_ids=[
+                    score_id for score_id in ids if score_id not in by_id
+                ],
+                missing_keys=[key for key in keys if key not in by_key]
+            )
+        )
+
+    def get_score_json(self, score_id: int) -> ServiceResult[bytes]:
+        """
+        Same as get_score, returned as the encoded JSON of the ScoreDTO,
+        reused from the JSON cache while the score is unchanged.
+        """
+        get_result = self.get_score(score_id)
+        if not get_result.is_ok:
+            return get_result
+        if self.json_cache is None:
+            return ServiceResult.ok(encode_score_json(get_result.data))
+        return ServiceResult.ok(self.json_cache.encode_row(get_result.data))
 
     def update_score(
         self,
@@ -77,6 +394,235 @@ class ScoreService:
             convert_score_entity_to_dto
         )
 
+    def update_scores(
+        self,
+        items: List[Dict[str, Any]],
+        mode: BatchWriteMode = BatchWriteMode.ATOMIC
+    ) -> ServiceResult[BulkScoreWriteResponse]:
+        """
+        Apply many patches in one transaction, with an executemany per set
+        of patched fields. Items are validated one by one and an ID may
+        only be patched once per batch.
+        """
+        results: List[Optional[BulkScoreItemResult]] = [None] * len(items)
+        patches = []
+        for index, item in enumerate(items):
+            try:
+                patch = ScoreBatchUpdate.model_validate(item)
+            except ValidationError as e:
+                results[index] = BulkScoreItemResult(
+                    index=index,
+                    status=BulkItemStatus.INVALID,
+                    error_message=format_validation_error(e)
+                )
+                continue
+            patch_values = patch.model_dump(exclude_unset=True, exclude={'id'})
+            patches.append((index, patch.id, (patch.id, patch_values)))
+
+        return self._write_batch(
+            results,
+            patches,
+            self.repository.update_many,
+            BulkItemStatus.UPDATED,
+            mode
+        )
+
+    def delete_scores(
+        self,
+        ids: List[int],
+        mode: BatchWriteMode = BatchWriteMode.ATOMIC
+    ) -> ServiceResult[BulkScoreWriteResponse]:
+        """
+        Delete many scores in one transaction with a single statement. An
+        ID may only be listed once per batch.
+        """
+        return self._write_batch(
+            [None] * len(ids),
+            [
+                (index, score_id, score_id)
+                for index, score_id in enumerate(ids)
+            ],
+            self.repository.delete_many,
+            BulkItemStatus.DELETED,
+            mode
+        )
+
+    @staticmethod
+    def _write_batch(
+        results: List[Optional[BulkScoreItemResult]],
+        targets: List[Tuple[int, int, Any]],
+        write: Callable[
+            [List[Any], bool],
+            RepositoryActionResult[List[RepositoryActionResult]]
+        ],
+        applied_status: BulkItemStatus,
+        mode: BatchWriteMode
+    ) -> ServiceResult[BulkScoreWriteResponse]:
+        """
+        Run `write` on the items of the (index, score_id, item) targets and
+        fill in the outcome of each in `results`, where invalid items are
+        already set. In atomic mode nothing is written once one is.
+        """
+        seen_ids = set()
+        valid_targets = []
+        for index, score_id, item in targets:
+            if score_id in seen_ids:
+                results[index] = BulkScoreItemResult(
+                    index=index,
+                    status=BulkItemStatus.INVALID,
+                    error_message=(
+                        f"Score ID [{score_id}] is listed more than once."
+                    )
+                )
+            else:
+                seen_ids.add(score_id)
+                valid_targets.append((index, score_id, item))
+
+        atomic = mode == BatchWriteMode.ATOMIC
+        committed = not atomic or len(valid_targets) == len(results)
+        item_results: Dict[int, RepositoryActionResult] = {}
+        if valid_targets and committed:
+            write_result = write(
+                [item for _, _, item in valid_targets],
+                atomic
+            )
+            if write_result.is_error:
+                return ServiceResult.error(
+                    exception=write_result.exception,
+                    error_message=write_result.error_message
+                )
+            item_results = {
+                index: item_result for (index, _, _), item_result
+                in zip(valid_targets, write_result.entity)
+            }
+            committed = not atomic or all(
+                item_result.is_ok for item_result in item_results.values()
+            )
+
+        for index, _, _ in valid_targets:
+            item_result = item_results.get(index)
+            if item_result is None or (item_result.is_ok and not committed):
+                results[index] = BulkScoreItemResult(
+                    index=index,
+                    status=BulkItemStatus.ROLLED_BACK
+                )
+            elif item_result.is_ok:
+                results[index] = BulkScoreItemResult(
+                    index=index,
+                    status=applied_status,
+                    score=convert_score_entity_to_dto(item_result.entity)
+                )
+            else:
+                results[index] = BulkScoreItemResult(
+                    index=index,
+                    status=(
+                        BulkItemStatus.NOT_FOUND if item_result.is_not_found
+                        else BulkItemStatus.CONFLICT
+                    ),
+                    error_message=item_result.error_message
+                )
+
+        def count(status: BulkItemStatus) -> int:
+            return sum(1 for result in results if result.status == status)
+
+        return ServiceResult.ok(
+            BulkScoreWriteResponse(
+                committed=committed,
+                applied=count(applied_status),
+                not_found=count(BulkItemStatus.NOT_FOUND),
+                conflicts=count(BulkItemStatus.CONFLICT),
+                invalid=count(BulkItemStatus.INVALID),
+                results=results
+            )
+        )
+
+    def check_mass_update(
+        self,
+        updated_data: Dict[str, Any],
+        shift_days: int
+    ) -> ServiceResult[None]:
+        """
+        Refuse mass updates moving scores to another player or date off
+        SQLite. Only SQLite can skip the scores whose new player and date
+        are taken (UPDATE OR IGNORE) and shift dates with date().
+        """
+        moves_scores = shift_days != 0 or 'player_name' in updated_data
+        if moves_scores and self.repository.dialect_name != 'sqlite':
+            return ServiceResult.bad_request(
+                "Changing the player or the match date of scores in a mass "
+                "update is only supported on SQLite."
+            )
+        return ServiceResult.ok(None)
+
+    def run_mass_write(
+        self,
+        job: MassWriteJob,
+        chunk_ids: int = MASS_WRITE_CHUNK_IDS,
+        pause_seconds: float = MASS_WRITE_PAUSE_MS / 1000
+    ) -> None:
+        """
+        Run a mass delete or update over the score IDs present when it
+        starts, `chunk_ids` IDs per transaction with a pause in between so
+        readers and other writers are never held for long. Cancellation is
+        checked between chunks. The outcome is recorded on the job.
+        """
+        if job.kind == MassWriteKind.UPDATE:
+            check_result = self.check_mass_update(
+                job.updated_data,
+                job.shift_days
+            )
+            if not check_result.is_ok:
+                job.finish(MassWriteStatus.FAILED, check_result.error_message)
+                return
+
+        bounds_result = self.repository.get_id_bounds()
+        if bounds_result.is_error:
+            job.finish(MassWriteStatus.FAILED, bounds_result.error_message)
+            return
+        first_id, last_id = bounds_result.entity
+        job.start(first_id, last_id)
+
+        chunks = []
+        if first_id is not None:
+            chunks = [
+                (start_id, min(start_id + chunk_ids, last_id + 1))
+                for start_id in range(first_id, last_id + 1, chunk_ids)
+            ]
+        if job.shift_days > 0:
+            # Scores are mostly created in date order, moving the latest
+            # ones first lets the earlier ones take their former dates.
+            chunks.reverse()
+
+        for position, (start_id, end_id) in enumerate(chunks):
+            if job.cancel_requested:
+                job.finish(MassWriteStatus.CANCELLED)
+                return
+            if position > 0 and pause_seconds > 0:
+                time.sleep(pause_seconds)
+
+            if job.kind == MassWriteKind.DELETE:
+                write_result = self.repository.delete_matching_in_range(
+                    job.search_filter,
+                    start_id,
+                    end_id
+                )
+                written, skipped = write_result.entity, 0
+            else:
+                write_result = self.repository.update_matching_in_range(
+                    job.search_filter,
+                    start_id,
+                    end_id,
+                    job.updated_data,
+                    job.shift_days
+                )
+                written, skipped = write_result.entity or (0, 0)
+            if write_result.is_error:
+                job.finish(MassWriteStatus.FAILED, write_result.error_message)
+                return
+            job.record_chunk(end_id - start_id, written, skipped)
+
+        job.finish(MassWriteStatus.COMPLETED)
+
     def search_scores(
         self,
         player_name: Optional[str],
@@ -85,44 +631,254 @@ class ScoreService:
         start_date: Optional[date],
         end_date: Optional[date],
         page: int,
-        page_size: int
+        page_size: int,
+        sort_order: ScoreSortOrder = ScoreSortOrder.MATCH_DATE_ASC,
+        cursor: Optional[str] = None,
+        include_total: TotalCountMode = TotalCountMode.EXACT,
+        name_query: Optional[str] = None
     ) -> ServiceResult[PaginationResponse]:
+        return self._search(
+            ScoreSearchFilter(
+                player_name,
+                player_team,
+                min_score,
+                start_date,
+                end_date,
+                name_query
+            ),
+            page,
+            page_size,
+            sort_order,
+            cursor,
+            include_total,
+            as_json=False
+        )
+
+    def search_scores_json(
+        self,
+        player_name: Optional[str],
+        player_team: Optional[str],
+        min_score: Optional[int],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        page: int,
+        page_size: int,
+        sort_order: ScoreSortOrder = ScoreSortOrder.MATCH_DATE_ASC,
+        cursor: Optional[str] = None,
+        include_total: TotalCountMode = TotalCountMode.EXACT,
+        name_query: Optional[str] = None
+    ) -> ServiceResult[bytes]:
+        """
+        Same search as search_scores, returned as the encoded JSON of the
+        PaginationResponse. Items are joined from cached score fragments,
+        no DTO is built for them.
+        """
+        return self._search(
+            ScoreSearchFilter(
+                player_name,
+                player_team,
+                min_score,
+                start_date,
+                end_date,
+                name_query
+            ),
+            page,
+            page_size,
+            sort_order,
+            cursor,
+            include_total,
+            as_json=True
+        )
+
+    def _search(
+        self,
+        search_filter: ScoreSearchFilter,
+        page: int,
+        page_size: int,
+        sort_order: ScoreSortOrder,
+        cursor: Optional[str],
+        include_total: TotalCountMode,
+        as_json: bool
+    ):
+        if self.search_cache is not None:
+            cache_key = SearchCacheKey(
+                search_filter,
+                page,
+                page_size,
+                sort_order,
+                cursor,
+                include_total,
+                as_json
+            )
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                return ServiceResult.ok(cached)
+            generation = self.search_cache.generation
+
+        after = None
+        if cursor is not None:
+            try:
+                after = decode_cursor(cursor, sort_order)
+            except ValueError as e:
+                return ServiceResult.bad_request(error_message=str(e))
+
         search_result = self.repository.search_scores(
+            player_name=search_filter.player_name,
+            player_team=search_filter.player_team,
+            min_score=search_filter.min_score,
+            start_date=search_filter.start_date,
+            end_date=search_filter.end_date,
+            page=page,
+            page_size=page_size,
+            sort_order=sort_order,
+            after=after,
+            include_total=include_total,
+            name_query=search_filter.name_query
+        )
+        if as_json:
+            service_result = build_search_json(
+                search_result,
+                page,
+                page_size,
+                sort_order,
+                cursor,
+                lambda rows: encode_score_rows(rows, self.json_cache)
+            )
+        else:
+            service_result = build_search_response(
+                search_result,
+                page,
+                page_size,
+                sort_order,
+                cursor
+            )
+        if self.search_cache is not None and service_result.is_ok:
+            self.search_cache.set(cache_key, service_result.data, generation)
+        return service_result
+
+    def export_scores(
+        self,
+        player_name: Optional[str],
+        player_team: Optional[str],
+        min_score: Optional[int],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        file_format: ScoreFileFormat,
+        chunk_size: int = EXPORT_CHUNK_SIZE
+    ) -> ServiceResult[Iterator[bytes]]:
+        stream_result = self.repository.stream_scores(
             player_name=player_name,
             player_team=player_team,
             min_score=min_score,
             start_date=start_date,
             end_date=end_date,
-            page=page,
-            page_size=page_size
-        )
-        if search_result.is_ok:
-            pagination = Pagination(
-                total_items=search_result.entity.total_items,
-                total_pages=calculate_total_pages(
-                    search_result.entity.total_items,
-                    page_size
-                ),
-                current_page=page,
-                page_size=page_size
-            )
-            paginated_result = PaginationResponse(
-                items=[
-                    convert_score_entity_to_dto(score)
-                    for score in search_result.entity.items
-                ],
-                pagination=pagination
-            )
-            return ServiceResult.ok(paginated_result)
-        else:
-            error_message = (
-                str(search_result.exception)
-                or search_result.error_message
-                or "An error occurred please try again later."
+            chunk_size=chunk_size
+        )
+        if not stream_result.is_ok:
+            return ServiceResult.error(
+                exception=stream_result.exception,
+                error_message=stream_result.error_message
             )
-            return ServiceResult.error(error_message=error_message)
+        return ServiceResult.ok(
+            write_export_chunks(stream_result.entity, file_format, chunk_size)
+        )
 
-        return ServiceResult.from_repository_action_result(
-            search_result,
-            convert_score_entity_to_dto
+
+def build_pagination(
+    pagination_result: PaginationResult,
+    page: int,
+    page_size: int,
+    sort_order: ScoreSortOrder,
+    cursor: Optional[str]
+) -> Pagination:
+    total_items = pagination_result.total_items
+    return Pagination(
+        total_items=total_items,
+        total_pages=(
+            calculate_total_pages(total_items, page_size)
+            if total_items is not None
+            else None
+        ),
+        total_is_estimate=pagination_result.total_is_estimate,
+        current_page=page if cursor is None else None,
+        page_size=page_size,
+        next_cursor=(
+            encode_cursor(sort_order, pagination_result.items[-1])
+            if pagination_result.has_more
+            else None
         )
+    )
+
+
+def build_search_response(
+    search_result: RepositoryActionResult[PaginationResult],
+    page: int,
+    page_size: int,
+    sort_order: ScoreSortOrder,
+    cursor: Optional[str]
+) -> ServiceResult[PaginationResponse]:
+    if search_result.is_ok:
+        paginated_result = PaginationResponse(
+            items=convert_score_rows_to_dtos(search_result.entity.items),
+            pagination=build_pagination(
+                search_result.entity,
+                page,
+                page_size,
+                sort_order,
+                cursor
+            )
+        )
+        return ServiceResult.ok(paginated_result)
+    else:
+        return search_error_result(search_result)
+
+
+def build_search_json(
+    search_result: RepositoryActionResult[PaginationResult],
+    page: int,
+    page_size: int,
+    sort_order: ScoreSortOrder,
+    cursor: Optional[str],
+    encode_rows: Callable[[List[Any]], List[bytes]]
+) -> ServiceResult[bytes]:
+    if search_result.is_ok:
+        return ServiceResult.ok(join_score_page(
+            encode_rows(search_result.entity.items),
+            build_pagination(
+                search_result.entity,
+                page,
+                page_size,
+                sort_order,
+                cursor
+            )
+        ))
+    else:
+        return search_error_result(search_result)
+
+
+def search_error_result(
+    search_result: RepositoryActionResult[PaginationResult]
+) -> ServiceResult:
+    error_message = (
+        str(search_result.exception)
+        or search_result.error_message
+        or "An error occurred please try again later."
+    )
+    return ServiceResult.error(error_message=error_message)
+
+
+def encode_score_rows(
+    rows: List[Any],
+    json_cache: Optional[ScoreJsonCache]
+) -> List[bytes]:
+    if json_cache is None:
+        return [encode_score_json(row) for row in rows]
+    return json_cache.encode_rows(rows)
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        if detail['loc'] else detail['msg']
+        for detail in error.errors()
+    )
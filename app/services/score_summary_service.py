@@ -0,0 +1,103 @@
+# Standard library imports
+from datetime import date
+from typing import List, Optional
+
+# Local application/library specific imports
+from app.domain.service_result import ServiceResult
+from app.mappings.score_summary_mapping import (
+    convert_player_total_to_dto,
+    convert_team_total_to_dto,
+)
+from app.repositories.score_summary_repository import ScoreSummaryRepository
+from app.schemas.score_total_dto import PlayerTotalDTO, TeamTotalDTO
+
+
+class ScoreSummaryService:
+    def __init__(self, repository: ScoreSummaryRepository):
+        self.repository = repository
+
+    def get_player_total(
+        self,
+        player_name: str
+    ) -> ServiceResult[PlayerTotalDTO]:
+        return ServiceResult.from_repository_action_result(
+            self.repository.get_player_total(player_name),
+            convert_player_total_to_dto
+        )
+
+    def search_players(
+        self,
+        name_query: str,
+        limit: int
+    ) -> ServiceResult[List[PlayerTotalDTO]]:
+        if not name_query.split():
+            return ServiceResult.bad_request(
+                error_message="name_query has no word to search."
+            )
+        return ServiceResult.from_repository_action_result(
+            self.repository.search_players(name_query, limit),
+            convert_player_total_to_dto
+        )
+
+    def get_player_leaderboard(
+        self,
+        limit: int,
+        season: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> ServiceResult[List[PlayerTotalDTO]]:
+        if season is not None and (
+            start_date is not None or end_date is not None
+        ):
+            return ServiceResult.bad_request(
+                error_message="Use either season or a date range."
+            )
+        if (start_date is not None and end_date is not None
+                and start_date > end_date):
+            return ServiceResult.bad_request(
+                error_message="start_date is after end_date."
+            )
+
+        return ServiceResult.from_repository_action_result(
+            self.repository.get_player_leaderboard(
+                limit,
+                season=season,
+                start_date=start_date,
+                end_date=end_date
+            ),
+            convert_player_total_to_dto
+        )
+
+    def get_team_daily_totals(
+        self,
+        player_team: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        limit: int
+    ) -> ServiceResult[List[TeamTotalDTO]]:
+        return ServiceResult.from_repository_action_result(
+            self.repository.get_team_daily_totals(
+                player_team,
+                start_date,
+                end_date,
+                limit
+            ),
+            convert_team_total_to_dto
+        )
+
+    def get_team_season_totals(
+        self,
+        player_team: Optional[str],
+        season: Optional[int],
+        limit: int
+    ) -> ServiceResult[List[TeamTotalDTO]]:
+        return ServiceResult.from_repository_action_result(
+            self.repository.get_team_season_totals(player_team, season, limit),
+            convert_team_total_to_dto
+        )
+
+    def rebuild_summaries(self) -> ServiceResult[None]:
+        return ServiceResult.from_repository_action_result(
+            self.repository.rebuild(),
+            lambda entity: entity
+        )
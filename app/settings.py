@@ -0,0 +1,132 @@
+# Standard library imports
+import os
+
+# Related third-party imports
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Maximum number of filtered search counts kept in memory, and how long
+# one is trusted to cover writes made by other processes.
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv('COUNT_CACHE_MAX_ENTRIES', '1024'))
+COUNT_CACHE_TTL_SECONDS = float(os.getenv('COUNT_CACHE_TTL_SECONDS', '30'))
+
+# Number of rows an estimated count reads before extrapolating.
+COUNT_ESTIMATE_SAMPLE_SIZE = int(
+    os.getenv('COUNT_ESTIMATE_SAMPLE_SIZE', '10000')
+)
+
+# Maximum number of scores accepted by POST /scores/bulk.
+BULK_CREATE_MAX_ITEMS = int(os.getenv('BULK_CREATE_MAX_ITEMS', '10000'))
+
+# Maximum number of IDs and keys, together, read by one batch get.
+BATCH_GET_MAX_ITEMS = int(os.getenv('BATCH_GET_MAX_ITEMS', '1000'))
+
+# Maximum number of scores patched or deleted by one batch write.
+BATCH_WRITE_MAX_ITEMS = int(os.getenv('BATCH_WRITE_MAX_ITEMS', '1000'))
+
+# Width of the score ID range written per transaction by mass delete and
+# update jobs, and pause between two ranges so other connections get the
+# database lock.
+MASS_WRITE_CHUNK_IDS = int(os.getenv('MASS_WRITE_CHUNK_IDS', '1000'))
+MASS_WRITE_PAUSE_MS = float(os.getenv('MASS_WRITE_PAUSE_MS', '10'))
+# Number of finished mass write jobs kept for GET /scores/jobs.
+MASS_WRITE_MAX_FINISHED_JOBS = int(
+    os.getenv('MASS_WRITE_MAX_FINISHED_JOBS', '100')
+)
+
+# Number of rows inserted per executemany transaction by bulk writes.
+BULK_INSERT_BATCH_SIZE = int(os.getenv('BULK_INSERT_BATCH_SIZE', '1000'))
+
+# Maximum number of rejected rows listed in an import report.
+IMPORT_MAX_REPORTED_REJECTIONS = int(
+    os.getenv('IMPORT_MAX_REPORTED_REJECTIONS', '100')
+)
+
+# Number of rows fetched from the database and encoded per export chunk.
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '1000'))
+
+# Serve the score CRUD and search routes with async handlers backed by an
+# AsyncSession (requires aiosqlite).
+DATABASE_ASYNC = os.getenv('DATABASE_ASYNC', 'false').lower() == 'true'
+
+# Read-through cache of scores by id used by GET /scores/{score_id}.
+ENTITY_CACHE_ENABLED = (
+    os.getenv('ENTITY_CACHE_ENABLED', 'true').lower() == 'true'
+)
+ENTITY_CACHE_MAX_ENTRIES = int(os.getenv('ENTITY_CACHE_MAX_ENTRIES', '10000'))
+ENTITY_CACHE_TTL_SECONDS = float(os.getenv('ENTITY_CACHE_TTL_SECONDS', '60'))
+
+# Cache of GET /scores responses, invalidated by matching writes.
+SEARCH_CACHE_ENABLED = (
+    os.getenv('SEARCH_CACHE_ENABLED', 'true').lower() == 'true'
+)
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '1024'))
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv('SEARCH_CACHE_TTL_SECONDS', '30'))
+
+# Cache-Control sent with GET /scores/{score_id} and GET /scores, an empty
+# value sends none. "no-cache" lets clients keep the body but revalidate
+# it with If-None-Match on every use.
+GET_SCORE_CACHE_CONTROL = os.getenv('GET_SCORE_CACHE_CONTROL', 'no-cache')
+SEARCH_SCORES_CACHE_CONTROL = os.getenv(
+    'SEARCH_SCORES_CACHE_CONTROL', 'no-cache'
+)
+
+# Encoded JSON of scores reused across GET /scores and GET /scores/{id}
+# responses. Entries are keyed by the score values and never go stale.
+SCORE_JSON_CACHE_ENABLED = (
+    os.getenv('SCORE_JSON_CACHE_ENABLED', 'true').lower() == 'true'
+)
+SCORE_JSON_CACHE_MAX_ENTRIES = int(
+    os.getenv('SCORE_JSON_CACHE_MAX_ENTRIES', '100000')
+)
+SCORE_JSON_CACHE_TTL_SECONDS = float(
+    os.getenv('SCORE_JSON_CACHE_TTL_SECONDS', '3600')
+)
+
+# Maximum number of totals returned by the leaderboard and summary routes.
+SUMMARY_MAX_ITEMS = int(os.getenv('SUMMARY_MAX_ITEMS', '1000'))
+
+# Keep a NumPy column copy of the scores for the /analytics routes
+# (requires numpy). It is loaded at startup and follows the writes made
+# through this process.
+ANALYTICS_ENABLED = os.getenv('ANALYTICS_ENABLED', 'false').lower() == 'true'
+
+# Record per route latency, status codes and SQL usage, served at /metrics.
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+# SQL budget each request is checked against when metrics are enabled, see
+# metrics/query_budget.py. An empty value disables a check.
+# Statement limits per route, e.g. "GET /scores=2,POST /scores=1".
+QUERY_BUDGETS = os.getenv('QUERY_BUDGETS', '')
+# Statement limit of the routes QUERY_BUDGETS does not list.
+QUERY_BUDGET_DEFAULT = (
+    int(os.environ['QUERY_BUDGET_DEFAULT'])
+    if os.getenv('QUERY_BUDGET_DEFAULT') else None
+)
+# Runs of the same statement within one request, above which it is reported
+# as possible N+1 queries.
+QUERY_REPEAT_LIMIT = (
+    int(os.environ['QUERY_REPEAT_LIMIT'])
+    if os.getenv('QUERY_REPEAT_LIMIT') else None
+)
+# Duration above which a statement is reported as slow.
+SLOW_QUERY_MS = (
+    float(os.getenv('SLOW_QUERY_MS', '250'))
+    if os.getenv('SLOW_QUERY_MS', '250') else None
+)
+# Raise on violations instead of only logging them, for tests.
+QUERY_BUDGET_STRICT = (
+    os.getenv('QUERY_BUDGET_STRICT', 'false').lower() == 'true'
+)
+
+# Synthetic scores generated by the seeder, see database/score_generator.py.
+# With RUN_SEEDER=true an empty database gets SEED_ROWS generated scores,
+# or the two sample scores when SEED_ROWS is 0.
+SEED_ROWS = int(os.getenv('SEED_ROWS', '0'))
+SEED_TEAMS = int(os.getenv('SEED_TEAMS', '30'))
+SEED_ROSTER_SIZE = int(os.getenv('SEED_ROSTER_SIZE', '26'))
+SEED_LAST_SEASON = int(os.getenv('SEED_LAST_SEASON', '2023'))
+SEED_RANDOM_SEED = int(os.getenv('SEED_RANDOM_SEED', '42'))
+# Number of generated rows inserted per executemany transaction.
+SEED_BATCH_SIZE = int(os.getenv('SEED_BATCH_SIZE', '50000'))
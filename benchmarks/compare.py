@@ -0,0 +1,52 @@
+# Standard library imports
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+
+class Comparison(NamedTuple):
+    """One benchmark case present in both runs."""
+    layer: str
+    name: str
+    rows: int
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change of the metric, positive when slower."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def compare_runs(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    metric: str = 'p50_us'
+) -> List[Comparison]:
+    """
+    Pair the results of two runs written by `benchmarks.suite run` by
+    layer, case name and database size. Cases missing from either run are
+    left out.
+    """
+    def by_key(run) -> Dict[Tuple[str, str, int], float]:
+        return {
+            (result['layer'], result['name'], result['rows']): result[metric]
+            for result in run['results']
+        }
+
+    baseline_values = by_key(baseline)
+    return [
+        Comparison(layer, name, rows, baseline_values[key], value)
+        for key, value in by_key(current).items()
+        if key in baseline_values
+        for layer, name, rows in [key]
+    ]
+
+
+def regressions(
+    comparisons: List[Comparison],
+    threshold: float
+) -> List[Comparison]:
+    """Cases slower than the baseline by more than `threshold` (0.1: 10%)."""
+    return [
+        comparison for comparison in comparisons
+        if comparison.change > threshold
+    ]
@@ -0,0 +1,118 @@
+# Standard library imports
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Tuple
+
+# Related third-party imports
+from sqlalchemy import Engine, create_engine, func, select
+
+# Local application/library specific imports
+from app.database.schema_migrations import upgrade_schema
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.models.baseball_player_score import BaseballPlayerScore
+
+SEED = 2024
+FIRST_MATCH_DATE = date(2015, 1, 1)
+TEAM_COUNT = 30
+SEED_BATCH_SIZE = 50000
+
+
+class Dataset(NamedTuple):
+    """
+    Shape of a seeded benchmark database. Row `i` belongs to player
+    `i % players` and is played `i // players` days after the first match
+    date, so every player and date pair is unique.
+    """
+    rows: int
+    players: int
+
+    @property
+    def days(self) -> int:
+        return -(-self.rows // self.players)
+
+    def player_name(self, index: int) -> str:
+        return f"Player {index % self.players}"
+
+    def team_name(self, index: int) -> str:
+        # Players stay in one team.
+        return f"Team {index % self.players % TEAM_COUNT}"
+
+    def match_date(self, index: int) -> date:
+        return FIRST_MATCH_DATE + timedelta(days=index // self.players)
+
+    def search_filter(self, fields: Tuple[str, ...]) -> ScoreSearchFilter:
+        """
+        Filter on `fields` with values matching part of the rows: one
+        player, one team, the best scores and the middle of the season.
+        """
+        values = {
+            'player_name': self.player_name(7),
+            'player_team': self.team_name(7),
+            'min_score': 80,
+            'start_date': self.match_date(self.rows // 4),
+            'end_date': self.match_date(self.rows // 2),
+        }
+        return ScoreSearchFilter(**{field: values[field] for field in fields})
+
+
+def dataset_for(rows: int) -> Dataset:
+    # About 200 matches per player, as for a few seasons of play.
+    return Dataset(rows=rows, players=max(rows // 200, 10))
+
+
+def open_database(data_dir: Path, rows: int) -> Tuple[Engine, Dataset]:
+    """
+    Return an engine on a benchmark database of `rows` scores, reusing the
+    one left in `data_dir` by a previous run so large databases are only
+    seeded once.
+    """
+    dataset = dataset_for(rows)
+    path = Path(data_dir) / f"scores-{rows}.db"
+    engine = create_engine(f"sqlite:///{path}")
+    upgrade_schema(engine)
+    with engine.connect() as connection:
+        stored = connection.scalar(
+            select(func.count()).select_from(BaseballPlayerScore)
+        )
+    if stored != rows:
+        engine.dispose()
+        path.unlink()
+        engine = create_engine(f"sqlite:///{path}")
+        upgrade_schema(engine)
+        seed_database(engine, dataset)
+    return engine, dataset
+
+
+def seed_database(engine: Engine, dataset: Dataset) -> None:
+    """Insert the rows of `dataset` by executemany batches."""
+    with engine.begin() as connection:
+        # Nothing is lost if the machine fails while the database is built.
+        connection.exec_driver_sql("PRAGMA journal_mode = OFF")
+        connection.exec_driver_sql("PRAGMA synchronous = OFF")
+        for batch in _batches(dataset):
+            connection.exec_driver_sql(
+                "INSERT INTO baseball_player_scores "
+                "(player_name, player_team, score, match_date) "
+                "VALUES (?, ?, ?, ?)",
+                batch
+            )
+        connection.exec_driver_sql("ANALYZE")
+    print(f"SEEDED: {dataset.rows} rows, {dataset.players} players")
+
+
+def _batches(dataset: Dataset) -> Iterator[List[tuple]]:
+    generator = random.Random(SEED)
+    for start in range(0, dataset.rows, SEED_BATCH_SIZE):
+        yield [
+            (
+                dataset.player_name(index),
+                dataset.team_name(index),
+                generator.randint(1, 100),
+                dataset.match_date(index).isoformat(),
+            )
+            for index in range(
+                start,
+                min(start + SEED_BATCH_SIZE, dataset.rows)
+            )
+        ]
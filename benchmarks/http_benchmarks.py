@@ -0,0 +1,162 @@
+# Standard library imports
+import asyncio
+import random
+from typing import List
+
+# Related third-party imports
+import httpx
+from sqlalchemy import Engine, delete
+from sqlalchemy.orm import sessionmaker
+
+# Local application/library specific imports
+from app.database.engine_profile import load_engine_profile
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.settings import DATABASE_ASYNC
+from benchmarks.dataset import FIRST_MATCH_DATE, SEED, Dataset
+from benchmarks.repository_benchmarks import BENCHMARK_PLAYER_PREFIX
+from benchmarks.timing import Measurement, measure
+
+LAYER = 'http'
+
+
+def run(
+    engine: Engine,
+    dataset: Dataset,
+    min_time: float
+) -> List[Measurement]:
+    """
+    Time requests sent in process to the ASGI application, through
+    routing, validation, dependencies and the configured caches, with the
+    database dependencies pointed at the benchmark database.
+    """
+    # Imported here so the application engine is never opened by the
+    # repository and service benchmarks.
+    from app import dependencies
+    from app.main import app
+
+    session_factory = sessionmaker(bind=engine)
+
+    def get_db():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[dependencies.get_db] = get_db
+    async_engine = None
+    if DATABASE_ASYNC:
+        from sqlalchemy.ext.asyncio import (
+            async_sessionmaker,
+            create_async_engine,
+        )
+
+        async_engine = create_async_engine(load_engine_profile({
+            'DATABASE_URL': engine.url.render_as_string(hide_password=False)
+        }).async_url)
+        async_session_factory = async_sessionmaker(
+            bind=async_engine,
+            expire_on_commit=False
+        )
+
+        async def get_async_db():
+            async with async_session_factory() as db:
+                yield db
+
+        app.dependency_overrides[dependencies.get_async_db] = get_async_db
+
+    loop = asyncio.new_event_loop()
+    # No lifespan events: the schema is already up to date.
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://benchmark"
+    )
+    generator = random.Random(SEED)
+    ids = [generator.randint(1, dataset.rows) for _ in range(1000)]
+    team = dataset.team_name(7)
+    results = []
+
+    def request(method, url, **options):
+        response = loop.run_until_complete(
+            client.request(method, url, **options)
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"Benchmark request {method} {url} failed: "
+                f"{response.status_code} {response.text}"
+            )
+        return response
+
+    def case(name, operation, **options):
+        results.append(measure(
+            name,
+            LAYER,
+            dataset.rows,
+            operation,
+            min_time,
+            **options
+        ))
+
+    created_ids = []
+
+    def create(iteration):
+        created_ids.append(request('POST', '/scores', json={
+            'player_name': f"{BENCHMARK_PLAYER_PREFIX} {iteration}",
+            'player_team': team,
+            'score': iteration % 100 + 1,
+            'match_date': FIRST_MATCH_DATE.isoformat(),
+        }).json()['id'])
+
+    try:
+        case(
+            'GET /scores/{score_id}',
+            lambda iteration: request(
+                'GET',
+                f"/scores/{ids[iteration % len(ids)]}"
+            )
+        )
+        case(
+            'GET /scores?player_team',
+            lambda iteration: request('GET', '/scores', params={
+                'player_team': team,
+                'page': 1 + iteration % 5,
+                'page_size': 100,
+            })
+        )
+        case(
+            'GET /scores?include_total=false',
+            lambda iteration: request('GET', '/scores', params={
+                'page': 1 + iteration % 5,
+                'page_size': 100,
+                'sort': '-match_date',
+                'include_total': 'false',
+            })
+        )
+        case('POST /scores', create)
+        case(
+            'PATCH /scores/{score_id}',
+            lambda iteration: request(
+                'PATCH',
+                f"/scores/{created_ids[iteration % len(created_ids)]}",
+                json={'score': iteration % 100 + 1}
+            )
+        )
+        case(
+            'DELETE /scores/{score_id}',
+            lambda iteration: request(
+                'DELETE',
+                f"/scores/{created_ids[iteration]}"
+            ),
+            min_iterations=1,
+            max_iterations=len(created_ids) - 1
+        )
+    finally:
+        loop.run_until_complete(client.aclose())
+        if async_engine is not None:
+            loop.run_until_complete(async_engine.dispose())
+        loop.close()
+        app.dependency_overrides.clear()
+        with engine.begin() as connection:
+            connection.execute(delete(BaseballPlayerScore).where(
+                BaseballPlayerScore.player_name.startswith(
+                    BENCHMARK_PLAYER_PREFIX
+                )
+            ))
+    return results
@@ -0,0 +1,113 @@
+# Standard library imports
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Related third-party imports
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+# Local application/library specific imports
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.mappings.score_mapping import (
+    convert_score_entity_to_dto,
+    convert_score_rows_to_dtos,
+)
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.baseball_player_score_repository import (
+    BaseballPlayerScoreRepository,
+)
+from app.repositories.score_queries import filter_conditions
+
+# Per-row cost of reading a page of scores into DTOs, through ORM entity
+# hydration (the former read path) and through Core column projection.
+#
+#   python -m benchmarks.read_path [--rows 20000] [--page-size 100]
+
+
+def orm_page(db, page_size):
+    conditions = filter_conditions(
+        ScoreSearchFilter(),
+        db.get_bind().dialect.name
+    )
+    statement = (
+        select(BaseballPlayerScore)
+        .where(*conditions)
+        .order_by(BaseballPlayerScore.match_date, BaseballPlayerScore.id)
+        .limit(page_size + 1)
+    )
+    scores = db.scalars(statement).all()[:page_size]
+    return [convert_score_entity_to_dto(score) for score in scores]
+
+
+def core_page(db, page_size):
+    result = BaseballPlayerScoreRepository(db).search_scores(
+        player_name=None,
+        player_team=None,
+        min_score=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=page_size,
+        sort_order=ScoreSortOrder.MATCH_DATE_ASC,
+        include_total=TotalCountMode.NONE
+    )
+    return convert_score_rows_to_dtos(result.entity.items)
+
+
+def measure(session_factory, read_page, page_size, iterations):
+    """Return the mean cost per row in microseconds."""
+    with session_factory() as db:
+        read_page(db, page_size)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        # A fresh session per page, like one request per page.
+        with session_factory() as db:
+            read_page(db, page_size)
+    elapsed = time.perf_counter() - started
+    return elapsed / (iterations * page_size) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Per-row cost of reading score pages into DTOs."
+    )
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'bench.db'}")
+        BaseballPlayerScore.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        with session_factory() as db:
+            BaseballPlayerScoreRepository(db).create_many([
+                {
+                    "player_name": f"Player {index % 500}",
+                    "player_team": f"Team {index % 30}",
+                    "score": index % 90 + 1,
+                    "match_date": (
+                        date(2020, 1, 1) + timedelta(days=index // 500)
+                    ),
+                }
+                for index in range(args.rows)
+            ])
+
+        for name, read_page in (("orm", orm_page), ("core", core_page)):
+            cost = measure(
+                session_factory,
+                read_page,
+                args.page_size,
+                args.iterations
+            )
+            print(f"{name}: {cost:.2f} us/row at {args.page_size}-row pages")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
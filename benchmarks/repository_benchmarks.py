@@ -0,0 +1,148 @@
+# Standard library imports
+import itertools
+import random
+from typing import List
+
+# Related third-party imports
+from sqlalchemy import Engine, delete
+from sqlalchemy.orm import sessionmaker
+
+# Local application/library specific imports
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.baseball_player_score_repository import (
+    BaseballPlayerScoreRepository,
+)
+from benchmarks.dataset import FIRST_MATCH_DATE, SEED, Dataset
+from benchmarks.read_path import core_page, orm_page
+from benchmarks.timing import Measurement, expect_ok, measure
+
+LAYER = 'repository'
+
+SEARCH_FILTER_FIELDS = (
+    'player_name',
+    'player_team',
+    'min_score',
+    'start_date',
+    'end_date',
+)
+
+# Players of the rows written by the CRUD cases, removed afterwards.
+BENCHMARK_PLAYER_PREFIX = 'Benchmark Player'
+
+
+def run(
+    engine: Engine,
+    dataset: Dataset,
+    min_time: float
+) -> List[Measurement]:
+    """
+    Time the CRUD operations of RepositoryBase and search_scores for each
+    combination of the search filters, without caches or listeners.
+    """
+    session_factory = sessionmaker(bind=engine)
+    generator = random.Random(SEED)
+    ids = [generator.randint(1, dataset.rows) for _ in range(1000)]
+    results = []
+
+    def case(name, operation, **options):
+        results.append(measure(
+            name,
+            LAYER,
+            dataset.rows,
+            operation,
+            min_time,
+            **options
+        ))
+
+    with session_factory() as db:
+        repository = BaseballPlayerScoreRepository(db)
+        created_ids = []
+
+        def create(iteration):
+            row = expect_ok(repository.create(BaseballPlayerScore(
+                player_name=f"{BENCHMARK_PLAYER_PREFIX} {iteration}",
+                player_team=dataset.team_name(iteration),
+                score=iteration % 100 + 1,
+                match_date=FIRST_MATCH_DATE
+            ))).entity
+            created_ids.append(row.id)
+
+        def create_many(iteration):
+            expect_ok(repository.create_many([
+                {
+                    'player_name': f"{BENCHMARK_PLAYER_PREFIX} {iteration}",
+                    'player_team': dataset.team_name(iteration),
+                    'score': day % 100 + 1,
+                    'match_date': dataset.match_date(day * dataset.players),
+                }
+                for day in range(1, 101)
+            ]))
+
+        case('create', create)
+        case('create_many[100]', create_many)
+        case(
+            'get_by_id',
+            lambda iteration: expect_ok(
+                repository.get_by_id(ids[iteration % len(ids)])
+            )
+        )
+        case(
+            'update',
+            lambda iteration: expect_ok(repository.update(
+                ids[iteration % len(ids)],
+                {'score': iteration % 100 + 1}
+            ))
+        )
+        # Deletes the rows of the create case, the warm-up call included.
+        case(
+            'delete',
+            lambda iteration: expect_ok(
+                repository.delete(created_ids[iteration])
+            ),
+            min_iterations=1,
+            max_iterations=len(created_ids) - 1
+        )
+        db.execute(delete(BaseballPlayerScore).where(
+            BaseballPlayerScore.player_name.startswith(
+                BENCHMARK_PLAYER_PREFIX
+            )
+        ))
+        db.commit()
+
+        for size in range(len(SEARCH_FILTER_FIELDS) + 1):
+            for fields in itertools.combinations(SEARCH_FILTER_FIELDS, size):
+                search_filter = dataset.search_filter(fields)
+                case(
+                    f"search_scores[{'+'.join(fields) or 'no_filter'}]",
+                    lambda iteration, search_filter=search_filter: expect_ok(
+                        repository.search_scores(
+                            **search_filter._asdict(),
+                            page=1 + iteration % 5,
+                            page_size=20,
+                            sort_order=ScoreSortOrder.MATCH_DATE_DESC,
+                            include_total=TotalCountMode.EXACT
+                        )
+                    )
+                )
+        case(
+            'search_scores[name_query]',
+            lambda iteration: expect_ok(repository.search_scores(
+                **ScoreSearchFilter(
+                    name_query=f"ayer {iteration % 10}"
+                )._asdict(),
+                page=1,
+                page_size=20
+            ))
+        )
+
+    # A fresh session per page, like one request per page.
+    for name, read_page in (('orm', orm_page), ('core', core_page)):
+        def read(iteration, read_page=read_page):
+            with session_factory() as db:
+                read_page(db, 100)
+
+        case(f"read_page[{name}]", read)
+    return results
@@ -0,0 +1,76 @@
+# Standard library imports
+import argparse
+import time
+from datetime import date, timedelta
+
+# Related third-party imports
+from sqlalchemy import create_engine, select
+
+# Local application/library specific imports
+from app.cache.score_json_cache import ScoreJsonCache
+from app.helper.score_json_writer import join_score_page
+from app.mappings.score_mapping import convert_score_rows_to_dtos
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.schemas.pagination_response import Pagination, PaginationResponse
+
+# Cost of encoding a page of score rows to the response JSON, through DTOs
+# and the PaginationResponse model (the former response path) and by
+# joining fragments of a warm ScoreJsonCache.
+#
+#   python -m benchmarks.response_encoding [--page-size 100]
+
+
+def dto_page(rows, pagination, json_cache):
+    return PaginationResponse(
+        items=convert_score_rows_to_dtos(rows),
+        pagination=pagination
+    ).model_dump_json().encode()
+
+
+def fragment_page(rows, pagination, json_cache):
+    return join_score_page(
+        json_cache.encode_rows(rows),
+        pagination
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cost of encoding score pages to response JSON."
+    )
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    engine = create_engine("sqlite://")
+    table = BaseballPlayerScore.__table__
+    BaseballPlayerScore.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [
+            {
+                "player_name": f"Player {index}",
+                "player_team": f"Team {index % 30}",
+                "score": index % 90 + 1,
+                "match_date": date(2020, 1, 1) + timedelta(days=index),
+            }
+            for index in range(args.page_size)
+        ])
+        rows = connection.execute(select(*table.columns)).all()
+    engine.dispose()
+
+    pagination = Pagination(page_size=args.page_size, current_page=1)
+    json_cache = ScoreJsonCache(
+        max_entries=args.page_size,
+        ttl_seconds=3600
+    )
+    for name, encode_page in (("dto", dto_page), ("fragments", fragment_page)):
+        encode_page(rows, pagination, json_cache)
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            encode_page(rows, pagination, json_cache)
+        cost = (time.perf_counter() - started) / args.iterations * 1e6
+        print(f"{name}: {cost:.0f} us per {args.page_size}-row page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Standard library imports
+import random
+from typing import List
+
+# Related third-party imports
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import sessionmaker
+
+# Local application/library specific imports
+from app.cache.score_json_cache import ScoreJsonCache
+from app.domain.total_count_mode import TotalCountMode
+from app.mappings.score_mapping import (
+    convert_score_entity_to_dto,
+    convert_score_rows_to_dtos,
+)
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.baseball_player_score_repository import (
+    BaseballPlayerScoreRepository,
+)
+from app.schemas.pagination_response import Pagination
+from app.services.score_service import ScoreService
+from benchmarks.dataset import SEED, Dataset
+from benchmarks.response_encoding import dto_page, fragment_page
+from benchmarks.timing import Measurement, expect_ok, measure
+
+LAYER = 'service'
+PAGE_SIZE = 100
+
+
+def run(
+    engine: Engine,
+    dataset: Dataset,
+    min_time: float
+) -> List[Measurement]:
+    """
+    Time ScoreService reads and the mapping of rows to DTOs and JSON, to
+    compare with the repository cases of the same operations.
+    """
+    session_factory = sessionmaker(bind=engine)
+    generator = random.Random(SEED)
+    ids = [generator.randint(1, dataset.rows) for _ in range(1000)]
+    results = []
+
+    def case(name, operation):
+        results.append(measure(
+            name,
+            LAYER,
+            dataset.rows,
+            operation,
+            min_time
+        ))
+
+    with session_factory() as db:
+        table = BaseballPlayerScore.__table__
+        rows = db.execute(
+            select(*table.columns).order_by(table.c.id).limit(PAGE_SIZE)
+        ).all()
+        pagination = Pagination(page_size=PAGE_SIZE, current_page=1)
+        json_cache = ScoreJsonCache(
+            max_entries=PAGE_SIZE,
+            ttl_seconds=3600
+        )
+
+        case(
+            'map_row_to_dto',
+            lambda iteration: convert_score_entity_to_dto(
+                rows[iteration % PAGE_SIZE]
+            )
+        )
+        case(
+            f"map_rows_to_dtos[{PAGE_SIZE}]",
+            lambda iteration: convert_score_rows_to_dtos(rows)
+        )
+        for name, encode_page in (
+            ('dto', dto_page),
+            ('fragments', fragment_page),
+        ):
+            case(
+                f"encode_page[{name}]",
+                lambda iteration, encode_page=encode_page: encode_page(
+                    rows,
+                    pagination,
+                    json_cache
+                )
+            )
+
+        service = ScoreService(BaseballPlayerScoreRepository(db))
+        json_service = ScoreService(
+            BaseballPlayerScoreRepository(db),
+            json_cache=ScoreJsonCache(
+                max_entries=10000,
+                ttl_seconds=3600
+            )
+        )
+        case(
+            'get_score',
+            lambda iteration: expect_ok(
+                service.get_score(ids[iteration % len(ids)])
+            )
+        )
+        search_filter = dataset.search_filter(('player_team',))
+        for name, search in (
+            ('dto', service.search_scores),
+            ('json', json_service.search_scores_json),
+        ):
+            case(
+                f"search_scores[{name}]",
+                lambda iteration, search=search: expect_ok(search(
+                    **search_filter._asdict(),
+                    page=1 + iteration % 5,
+                    page_size=PAGE_SIZE,
+                    include_total=TotalCountMode.NONE
+                ))
+            )
+    return results
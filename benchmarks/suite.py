@@ -0,0 +1,170 @@
+# Standard library imports
+import argparse
+import json
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Related third-party imports
+import sqlalchemy
+
+# Local application/library specific imports
+from benchmarks import http_benchmarks, repository_benchmarks
+from benchmarks import service_benchmarks
+from benchmarks.compare import compare_runs, regressions
+from benchmarks.dataset import open_database
+
+# Repository, service and in-process HTTP benchmarks over seeded databases,
+# written to JSON, and comparison of two runs.
+#
+#   python -m benchmarks.suite run --rows 10000 --rows 1000000 \
+#       --output current.json [--data-dir .benchmarks]
+#   python -m benchmarks.suite compare baseline.json current.json \
+#       [--threshold 0.1] [--metric p50_us]
+
+LAYERS = {
+    'repository': repository_benchmarks.run,
+    'service': service_benchmarks.run,
+    'http': http_benchmarks.run,
+}
+
+METRICS = ('mean_us', 'p50_us', 'p95_us', 'p99_us')
+
+
+def run(args) -> int:
+    data_dir = args.data_dir
+    temporary_dir = None
+    if data_dir is None:
+        temporary_dir = tempfile.TemporaryDirectory()
+        data_dir = temporary_dir.name
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
+
+    results = []
+    try:
+        for rows in args.rows:
+            engine, dataset = open_database(Path(data_dir), rows)
+            try:
+                for layer in args.layers:
+                    for measurement in LAYERS[layer](
+                        engine,
+                        dataset,
+                        args.min_time
+                    ):
+                        print(
+                            f"{measurement.rows:>9} {layer:<10} "
+                            f"{measurement.name:<55} "
+                            f"p50 {measurement.p50_us:>10.1f} us  "
+                            f"p95 {measurement.p95_us:>10.1f} us"
+                        )
+                        results.append(measurement._asdict())
+            finally:
+                engine.dispose()
+    finally:
+        if temporary_dir is not None:
+            temporary_dir.cleanup()
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sqlalchemy': sqlalchemy.__version__,
+            'sqlite': sqlite3.sqlite_version,
+        },
+        'settings': {'min_time': args.min_time, 'layers': args.layers},
+        'results': results,
+    }
+    if args.output is not None:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"RESULTS: {len(results)} cases written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+def compare(args) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    comparisons = compare_runs(baseline, current, args.metric)
+    slower = regressions(comparisons, args.threshold)
+    for comparison in comparisons:
+        flag = 'REGRESSION' if comparison in slower else ''
+        print(
+            f"{comparison.rows:>9} {comparison.layer:<10} "
+            f"{comparison.name:<55} "
+            f"{comparison.baseline:>10.1f} -> {comparison.current:>10.1f} "
+            f"{args.metric} ({comparison.change:+.1%}) {flag}"
+        )
+    print(
+        f"COMPARED: {len(comparisons)} cases, {len(slower)} slower than "
+        f"the baseline by more than {args.threshold:.0%}"
+    )
+    return 1 if slower else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Score API benchmark suite."
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser(
+        'run',
+        help="Run the benchmarks and write the results as JSON."
+    )
+    run_parser.add_argument(
+        '--rows',
+        type=int,
+        action='append',
+        help="Scores in the benchmark database, repeat for several sizes "
+             "(default 10000)."
+    )
+    run_parser.add_argument(
+        '--layers',
+        nargs='+',
+        choices=list(LAYERS),
+        default=list(LAYERS)
+    )
+    run_parser.add_argument(
+        '--min-time',
+        type=float,
+        default=0.5,
+        help="Seconds spent timing each case."
+    )
+    run_parser.add_argument(
+        '--data-dir',
+        help="Directory keeping the seeded databases between runs, a "
+             "temporary one is used when omitted."
+    )
+    run_parser.add_argument(
+        '--output',
+        help="JSON file of the results, printed when omitted."
+    )
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser(
+        'compare',
+        help="Compare two result files, exit with 1 on a regression."
+    )
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help="Relative slowdown flagged as a regression (default 0.1)."
+    )
+    compare_parser.add_argument('--metric', choices=METRICS, default='p50_us')
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    if args.command == 'run' and not args.rows:
+        args.rows = [10000]
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# Standard library imports
+import statistics
+import time
+from typing import Callable, NamedTuple, Optional
+
+
+class Measurement(NamedTuple):
+    """Latency of one benchmark case, in microseconds per operation."""
+    name: str
+    layer: str
+    rows: int
+    iterations: int
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    ops_per_second: float
+
+
+def measure(
+    name: str,
+    layer: str,
+    rows: int,
+    operation: Callable[[int], object],
+    min_time: float,
+    min_iterations: int = 5,
+    max_iterations: Optional[int] = None
+) -> Measurement:
+    """
+    Call `operation` with the iteration number until `min_time` seconds
+    and `min_iterations` calls have passed, timing each call. The first
+    call warms caches and connections up and is not counted.
+
+    `max_iterations` bounds the timed calls of operations that consume a
+    finite input, such as deleting rows created beforehand.
+    """
+    operation(0)
+    durations = []
+    started = time.perf_counter()
+    iteration = 1
+    while (
+        len(durations) < min_iterations
+        or time.perf_counter() - started < min_time
+    ):
+        if max_iterations is not None and len(durations) >= max_iterations:
+            break
+        call_started = time.perf_counter()
+        operation(iteration)
+        durations.append(time.perf_counter() - call_started)
+        iteration += 1
+
+    durations.sort()
+    mean = statistics.fmean(durations)
+    return Measurement(
+        name=name,
+        layer=layer,
+        rows=rows,
+        iterations=len(durations),
+        mean_us=round(mean * 1e6, 2),
+        p50_us=round(_percentile(durations, 0.50) * 1e6, 2),
+        p95_us=round(_percentile(durations, 0.95) * 1e6, 2),
+        p99_us=round(_percentile(durations, 0.99) * 1e6, 2),
+        ops_per_second=round(1 / mean, 1),
+    )
+
+
+def _percentile(sorted_durations, fraction: float) -> float:
+    index = min(
+        int(fraction * len(sorted_durations)),
+        len(sorted_durations) - 1
+    )
+    return sorted_durations[index]
+
+
+def expect_ok(result):
+    """
+    Return a repository or service result, raising when it failed so a
+    benchmark never times an error path by accident.
+    """
+    if not result.is_ok:
+        raise RuntimeError(
+            f"Benchmark operation failed: {result.error_message}"
+        )
+    return result
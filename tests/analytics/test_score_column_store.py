@@ -0,0 +1,141 @@
+# test_score_column_store.py
+import statistics
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.models.baseball_player_score import BaseballPlayerScore
+
+pytest.importorskip("numpy")
+
+from app.analytics.score_column_store import ScoreColumnStore  # noqa: E402
+from app.repositories.baseball_player_score_repository import (  # noqa: E402
+    BaseballPlayerScoreRepository,
+)
+
+
+def make_score(score_id, player_name, player_team, score, match_date):
+    return BaseballPlayerScore(
+        id=score_id,
+        player_name=player_name,
+        player_team=player_team,
+        score=score,
+        match_date=match_date
+    )
+
+
+def test_load_and_writes_keep_statistics_in_step(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    BaseballPlayerScore.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        BaseballPlayerScoreRepository(db).create_many([
+            {
+                "player_name": "John Doe",
+                "player_team": "Team A",
+                "score": score,
+                "match_date": date(2024, 1, day),
+            }
+            for day, score in enumerate((10, 20, 60), start=1)
+        ])
+    column_store = ScoreColumnStore(capacity=2)
+    column_store.load(engine)
+    engine.dispose()
+
+    # Act
+    column_store.after_create(
+        make_score(4, "Jane Doe", None, 50, date(2024, 1, 4))
+    )
+    column_store.after_update(
+        make_score(1, "John Doe", "Team A", 30, date(2024, 1, 1)),
+        ["score"]
+    )
+    column_store.after_delete(
+        make_score(3, "John Doe", "Team A", 60, date(2024, 1, 3))
+    )
+    john = column_store.statistics(player_name="John Doe")
+    everyone = column_store.statistics(percentiles=[50])
+
+    # Assert
+    assert (john.count, john.mean, john.min, john.max) == (2, 25.0, 20, 30)
+    assert everyone.count == 3
+    assert everyone.stddev == pytest.approx(statistics.pstdev([30, 20, 50]))
+    assert everyone.percentiles == {"50": 30.0}
+    assert sum(bucket.count for bucket in everyone.histogram) == 3
+    assert column_store.statistics(player_team="Team B").count == 0
+    assert column_store.stats().rows == 3
+
+
+def test_writes_during_a_load_are_kept(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'scores.db'}")
+    BaseballPlayerScore.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        BaseballPlayerScoreRepository(db).create_many([{
+            "player_name": "John Doe",
+            "score": 10,
+            "match_date": date(2024, 1, 1),
+        }])
+    column_store = ScoreColumnStore()
+    column_store.after_create(
+        make_score(1, "John Doe", None, 10, date(2024, 1, 1))
+    )
+
+    def write_while_loading(*args):
+        # Runs while the load reads the table, without holding the lock.
+        column_store.after_create(
+            make_score(2, "Jane Doe", None, 30, date(2024, 1, 2))
+        )
+        assert column_store.statistics().count == 2
+
+    event.listen(engine, "before_cursor_execute", write_while_loading)
+
+    # Act
+    column_store.load(engine)
+    engine.dispose()
+
+    # Assert
+    assert column_store.statistics().count == 2
+    assert column_store.statistics(player_name="Jane Doe").max == 30
+
+
+def test_rolling_average_covers_the_days_of_the_window():
+    # Arrange
+    column_store = ScoreColumnStore()
+    for score_id, score, day in ((1, 10, 1), (2, 20, 2), (3, 30, 2),
+                                 (4, 40, 5)):
+        column_store.after_create(
+            make_score(score_id, "John Doe", "Team A", score,
+                       date(2024, 1, day))
+        )
+
+    # Act
+    points = column_store.rolling_average(window_days=2)
+
+    # Assert
+    assert [
+        (point.match_date.day, point.average_score, point.matches)
+        for point in points
+    ] == [(1, 10.0, 1), (2, 20.0, 3), (5, 40.0, 1)]
+
+
+def test_deleted_rows_are_compacted_away():
+    # Arrange
+    column_store = ScoreColumnStore()
+    scores = [
+        make_score(score_id, "John Doe", "Team A", score_id,
+                   date(2024, 1, score_id))
+        for score_id in range(1, 5)
+    ]
+    for score in scores:
+        column_store.after_create(score)
+
+    # Act
+    for score in scores[:3]:
+        column_store.after_delete(score)
+
+    # Assert
+    assert column_store.stats().deleted_rows == 0
+    assert column_store.statistics().max == 4
+    column_store.after_update(scores[3], ["score"])
+    assert column_store.stats().rows == 1
@@ -0,0 +1,45 @@
+# test_compare.py
+from benchmarks.compare import compare_runs, regressions
+
+
+def make_run(*results):
+    return {
+        "results": [
+            {"layer": layer, "name": name, "rows": 10000, "p50_us": p50}
+            for layer, name, p50 in results
+        ]
+    }
+
+
+def test_compare_runs_pairs_cases_present_in_both_runs():
+    # Arrange
+    baseline = make_run(
+        ("repository", "get_by_id", 100.0),
+        ("repository", "delete", 300.0),
+    )
+    current = make_run(
+        ("repository", "get_by_id", 150.0),
+        ("service", "get_score", 200.0),
+    )
+
+    # Act
+    comparisons = compare_runs(baseline, current)
+
+    # Assert
+    assert len(comparisons) == 1
+    assert comparisons[0].name == "get_by_id"
+    assert comparisons[0].change == 0.5
+
+
+def test_regressions_flags_slowdowns_beyond_threshold():
+    # Arrange
+    comparisons = compare_runs(
+        make_run(("http", "GET", 100.0), ("http", "POST", 100.0)),
+        make_run(("http", "GET", 109.0), ("http", "POST", 111.0))
+    )
+
+    # Act
+    slower = regressions(comparisons, threshold=0.1)
+
+    # Assert
+    assert [comparison.name for comparison in slower] == ["POST"]
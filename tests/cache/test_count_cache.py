@@ -0,0 +1,97 @@
+# test_count_cache.py
+from datetime import date
+from app.cache.count_cache import CountCache
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.models.baseball_player_score import BaseballPlayerScore
+
+
+def make_score(**overrides):
+    values = {
+        "id": 1,
+        "player_name": "John Doe",
+        "player_team": "Team A",
+        "score": 10,
+        "match_date": date(2023, 1, 1),
+    }
+    values.update(overrides)
+    return BaseballPlayerScore(**values)
+
+
+def test_create_invalidates_only_matching_filters():
+    # Arrange
+    cache = CountCache()
+    team_a = ScoreSearchFilter(player_team="Team A")
+    team_b = ScoreSearchFilter(player_team="Team B")
+    cache.set(team_a, 5, cache.generation)
+    cache.set(team_b, 7, cache.generation)
+
+    # Act
+    cache.after_create(make_score(player_team="Team A"))
+
+    # Assert
+    assert cache.get(team_a) is None
+    assert cache.get(team_b) == 7
+
+
+def test_update_treats_changed_fields_as_unknown():
+    # Arrange
+    cache = CountCache()
+    high_scores = ScoreSearchFilter(min_score=50)
+    cache.set(high_scores, 3, cache.generation)
+
+    # Act
+    # The new score is below the filter but the old one may have matched.
+    cache.after_update(make_score(score=10), ["score"])
+
+    # Assert
+    assert cache.get(high_scores) is None
+
+
+def test_stale_count_is_not_stored():
+    # Arrange
+    cache = CountCache()
+    search_filter = ScoreSearchFilter()
+    generation = cache.generation
+
+    # Act
+    cache.after_delete(make_score())
+    cache.set(search_filter, 4, generation)
+
+    # Assert
+    assert cache.get(search_filter) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    # Arrange
+    cache = CountCache(max_entries=2)
+    first = ScoreSearchFilter(player_name="A")
+    second = ScoreSearchFilter(player_name="B")
+    third = ScoreSearchFilter(player_name="C")
+    cache.set(first, 1, cache.generation)
+    cache.set(second, 2, cache.generation)
+
+    # Act
+    cache.get(first)
+    cache.set(third, 3, cache.generation)
+
+    # Assert
+    assert cache.get(first) == 1
+    assert cache.get(second) is None
+    assert cache.get(third) == 3
+
+
+def test_count_expires_after_ttl():
+    # Arrange
+    now = [0.0]
+    cache = CountCache(ttl_seconds=5, clock=lambda: now[0])
+    search_filter = ScoreSearchFilter(player_team="Team A")
+    cache.set(search_filter, 5, cache.generation)
+
+    # Act
+    before_expiry = cache.get(search_filter)
+    now[0] = 5
+    after_expiry = cache.get(search_filter)
+
+    # Assert
+    assert before_expiry == 5
+    assert after_expiry is None
@@ -0,0 +1,62 @@
+# test_lru_ttl_cache.py
+from app.cache.lru_ttl_cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_returns_cached_value_until_ttl():
+    # Arrange
+    clock = FakeClock()
+    cache = LruTtlCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.set(1, "one", cache.generation)
+
+    # Act
+    before_expiry = cache.get(1)
+    clock.now = 5
+    after_expiry = cache.get(1)
+
+    # Assert
+    assert before_expiry == "one"
+    assert after_expiry is None
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.expirations == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    # Arrange
+    cache = LruTtlCache(max_entries=2, ttl_seconds=60)
+    cache.set(1, "one", cache.generation)
+    cache.set(2, "two", cache.generation)
+
+    # Act
+    cache.get(1)
+    cache.set(3, "three", cache.generation)
+
+    # Assert
+    assert cache.get(1) == "one"
+    assert cache.get(2) is None
+    assert cache.get(3) == "three"
+    assert cache.stats().evictions == 1
+
+
+def test_invalidation_blocks_stale_set():
+    # Arrange
+    cache = LruTtlCache(max_entries=10, ttl_seconds=60)
+    cache.set(1, "old", cache.generation)
+    generation = cache.generation
+
+    # Act
+    cache.invalidate(1)
+    cache.set(1, "loaded before the write", generation)
+
+    # Assert
+    assert cache.get(1) is None
+    assert cache.stats().invalidations == 1
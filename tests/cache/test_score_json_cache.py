@@ -0,0 +1,31 @@
+# test_score_json_cache.py
+import json
+from datetime import date
+
+from app.cache.score_json_cache import ScoreJsonCache
+from app.models.baseball_player_score import BaseballPlayerScore
+
+
+def make_score(score_id, score=10):
+    return BaseballPlayerScore(
+        id=score_id,
+        player_name="John Doe",
+        player_team="Team A",
+        score=score,
+        match_date=date(2024, 1, 1)
+    )
+
+
+def test_fragments_are_reused_until_the_row_is_written():
+    # Arrange
+    json_cache = ScoreJsonCache(max_entries=10, ttl_seconds=60)
+    json_cache.encode_rows([make_score(1)])
+
+    # Act
+    reused = json_cache.encode_rows([make_score(1)])
+    written = json_cache.encode_rows([make_score(1, score=30)])
+
+    # Assert
+    assert json.loads(reused[0])["score"] == 10
+    assert json.loads(written[0])["score"] == 30
+    assert json_cache.stats().hits == 1
@@ -0,0 +1,81 @@
+# test_search_result_cache.py
+from datetime import date
+from app.cache.search_result_cache import SearchCacheKey, SearchResultCache
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.models.baseball_player_score import BaseballPlayerScore
+
+
+def make_key(search_filter, page=1):
+    return SearchCacheKey(
+        search_filter,
+        page,
+        10,
+        ScoreSortOrder.MATCH_DATE_ASC,
+        None,
+        TotalCountMode.EXACT
+    )
+
+
+def make_score(**overrides):
+    values = {
+        "id": 1,
+        "player_name": "John Doe",
+        "player_team": "Team A",
+        "score": 10,
+        "match_date": date(2023, 1, 1),
+    }
+    values.update(overrides)
+    return BaseballPlayerScore(**values)
+
+
+def test_write_invalidates_every_page_of_matching_searches():
+    # Arrange
+    cache = SearchResultCache(max_entries=10, ttl_seconds=60)
+    team_a = ScoreSearchFilter(player_team="Team A")
+    team_b = ScoreSearchFilter(player_team="Team B")
+    for key in (make_key(team_a), make_key(team_a, 2), make_key(team_b)):
+        cache.set(key, "page", cache.generation)
+
+    # Act
+    cache.after_delete(make_score(player_team="Team A"))
+
+    # Assert
+    assert cache.get(make_key(team_a)) is None
+    assert cache.get(make_key(team_a, 2)) is None
+    assert cache.get(make_key(team_b)) == "page"
+
+
+def test_update_invalidates_searches_the_row_may_leave():
+    # Arrange
+    cache = SearchResultCache(max_entries=10, ttl_seconds=60)
+    high_scores = make_key(ScoreSearchFilter(min_score=50))
+    other_team = make_key(ScoreSearchFilter(player_team="Team B"))
+    cache.set(high_scores, "page", cache.generation)
+    cache.set(other_team, "page", cache.generation)
+
+    # Act
+    cache.after_update(make_score(score=5), ["score"])
+
+    # Assert
+    assert cache.get(high_scores) is None
+    assert cache.get(other_team) == "page"
+
+
+def test_write_of_many_rows_invalidates_every_search():
+    # Arrange
+    cache = SearchResultCache(max_entries=10, ttl_seconds=60)
+    team_b = make_key(ScoreSearchFilter(player_team="Team B"))
+    cache.set(team_b, "page", cache.generation)
+    generation = cache.generation
+
+    # Act
+    cache.after_delete_many([make_score(), make_score(id=2)])
+    deleted_generation = cache.generation
+    cache.set(team_b, "page", cache.generation)
+    cache.after_create_many([make_score(id=3), make_score(id=4)])
+
+    # Assert
+    assert cache.get(team_b) is None
+    assert generation != deleted_generation != cache.generation
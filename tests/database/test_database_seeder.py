@@ -0,0 +1,83 @@
+# test_database_seeder.py
+import pytest
+import statistics
+from sqlalchemy import create_engine, text
+from app.database.database_seeder import seed_synthetic_data
+from app.database.schema_migrations import upgrade_schema
+from app.database.score_generator import GeneratorConfig, generate_scores
+
+
+def test_generate_scores_is_reproducible_and_realistic():
+    # Arrange
+    config = GeneratorConfig(rows=20000, teams=4, roster_size=10, seed=7)
+
+    # Act
+    scores = list(generate_scores(config))
+    again = list(generate_scores(config))
+
+    # Assert
+    assert scores == again
+    assert len(scores) == 20000
+    assert len({score["player_team"] for score in scores}) == 4
+    # Players are replaced between seasons, so there are more than rosters.
+    assert len({score["player_name"] for score in scores}) > 40
+    keys = {(score["player_name"], score["match_date"]) for score in scores}
+    assert len(keys) == len(scores)
+    assert all(
+        score["match_date"].year >= config.first_season
+        and 4 <= score["match_date"].month <= 9
+        for score in scores
+    )
+    values = [score["score"] for score in scores]
+    # Skewed towards low scores with a long tail.
+    assert statistics.median(values) < statistics.mean(values)
+    assert max(values) > 4 * statistics.mean(values)
+
+
+def test_seed_synthetic_data_loads_scores_and_restores_triggers(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    upgrade_schema(engine)
+    config = GeneratorConfig(rows=5000, teams=3, roster_size=8)
+    progress = []
+
+    # Act
+    loaded = seed_synthetic_data(
+        engine,
+        config,
+        batch_size=2000,
+        on_progress=progress.append
+    )
+
+    # Assert
+    assert loaded == 5000
+    assert progress == [2000, 4000, 5000]
+    with engine.begin() as connection:
+        matches = connection.execute(text(
+            "SELECT SUM(matches) FROM player_score_totals"
+        )).scalar()
+        names = connection.execute(text(
+            "SELECT COUNT(*) FROM player_names"
+        )).scalar()
+        indexes = connection.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )).scalars().all()
+        # Writes after the load are followed by the summary triggers.
+        connection.execute(text(
+            "INSERT INTO baseball_player_scores "
+            "(player_name, player_team, score, match_date) "
+            "VALUES ('New Player', 'New Team', 4, '2030-01-01')"
+        ))
+        new_total = connection.execute(text(
+            "SELECT total_score FROM player_score_totals "
+            "WHERE player_name = 'New Player'"
+        )).scalar()
+    assert matches == 5000
+    assert names == len(
+        {score["player_name"] for score in generate_scores(config)}
+    )
+    assert "ix_player_team_match_date_id_score" in indexes
+    assert new_total == 4
+    with pytest.raises(ValueError):
+        seed_synthetic_data(engine, config)
+    engine.dispose()
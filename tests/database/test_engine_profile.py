@@ -0,0 +1,49 @@
+# test_engine_profile.py
+import pytest
+from sqlalchemy import create_engine
+from app.database.engine_profile import (
+    describe_engine,
+    install_sqlite_pragmas,
+    load_engine_profile,
+)
+
+
+def test_production_profile_defaults_can_be_overridden():
+    # Act
+    profile = load_engine_profile({
+        "DATABASE_PROFILE": "production",
+        "SQLITE_SYNCHRONOUS": "full",
+    })
+
+    # Assert
+    assert profile.echo is False
+    assert profile.journal_mode == "WAL"
+    assert profile.synchronous == "FULL"
+    assert profile.pool_pre_ping is True
+    assert profile.async_url == "sqlite+aiosqlite:///mydatabase.db"
+
+
+def test_invalid_setting_is_rejected():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        load_engine_profile({"SQLITE_JOURNAL_MODE": "wal; DROP TABLE x"})
+
+
+def test_pragmas_are_applied_to_new_connections(tmp_path):
+    # Arrange
+    profile = load_engine_profile({
+        "DATABASE_PROFILE": "production",
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'test.db'}",
+        "SQLITE_BUSY_TIMEOUT_MS": "1234",
+    })
+    engine = create_engine(profile.url, **profile.engine_options())
+    install_sqlite_pragmas(engine, profile)
+
+    # Act
+    description = describe_engine(engine, profile)
+
+    # Assert
+    assert "journal_mode=wal" in description
+    assert "synchronous=NORMAL" in description
+    assert "busy_timeout=1234" in description
+    engine.dispose()
@@ -0,0 +1,197 @@
+# test_schema_migrations.py
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+from app.database.schema_migrations import (
+    DuplicateScoresError,
+    remove_duplicate_scores,
+    upgrade_schema,
+)
+
+
+def create_table_without_unique_key(engine):
+    # Table created while the unique constraint was lost.
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE baseball_player_scores ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "player_name VARCHAR NOT NULL, player_team VARCHAR, "
+            "score INTEGER NOT NULL, match_date DATE NOT NULL)"
+        ))
+        connection.execute(text(
+            "CREATE INDEX ix_player_name_match_date "
+            "ON baseball_player_scores (player_name, match_date)"
+        ))
+        connection.execute(text(
+            "CREATE INDEX ix_match_date_id "
+            "ON baseball_player_scores (match_date, id)"
+        ))
+        connection.execute(text(
+            "INSERT INTO baseball_player_scores "
+            "(player_name, score, match_date) VALUES "
+            "('John Doe', 10, '2023-01-01'), "
+            "('John Doe', 20, '2023-01-01'), "
+            "('Jane Doe', 30, '2023-01-01')"
+        ))
+
+
+def test_upgrade_refuses_to_add_unique_key_over_duplicates(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    create_table_without_unique_key(engine)
+
+    # Act
+    with pytest.raises(DuplicateScoresError) as raised:
+        upgrade_schema(engine)
+
+    # Assert
+    assert raised.value.duplicates == [
+        ("John Doe", date(2023, 1, 1), 2)
+    ]
+    assert "John Doe on 2023-01-01: 2 scores" in str(raised.value)
+    with engine.connect() as connection:
+        count = connection.execute(text(
+            "SELECT count(*) FROM baseball_player_scores"
+        )).scalar()
+    assert count == 3
+    engine.dispose()
+
+
+def test_upgrade_adds_unique_key_once_duplicates_are_removed(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    create_table_without_unique_key(engine)
+
+    # Act
+    with engine.begin() as connection:
+        removed = remove_duplicate_scores(connection)
+    upgrade_schema(engine)
+    upgrade_schema(engine)
+
+    # Assert
+    with engine.connect() as connection:
+        rows = connection.execute(text(
+            "SELECT player_name, score FROM baseball_player_scores "
+            "ORDER BY id"
+        )).all()
+        indexes = connection.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )).scalars().all()
+    assert removed == 1
+    assert rows == [("John Doe", 10), ("Jane Doe", 30)]
+    assert "uix_player_name_match_date" in indexes
+    assert "ix_player_name_match_date" not in indexes
+    assert "ix_match_date_id" not in indexes
+    assert "ix_match_date_id_score" in indexes
+    with pytest.raises(IntegrityError):
+        with engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO baseball_player_scores "
+                "(player_name, score, match_date) "
+                "VALUES ('Jane Doe', 40, '2023-01-01')"
+            ))
+    engine.dispose()
+
+
+def test_upgrade_backfills_summaries_of_existing_scores(tmp_path):
+    # Arrange: scores stored before the summary tables existed.
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE baseball_player_scores ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "player_name VARCHAR NOT NULL, player_team VARCHAR, "
+            "score INTEGER NOT NULL, match_date DATE NOT NULL)"
+        ))
+        connection.execute(text(
+            "INSERT INTO baseball_player_scores "
+            "(player_name, player_team, score, match_date) VALUES "
+            "('John Doe', 'Team A', 10, '2023-01-01'), "
+            "('John Doe', 'Team A', 20, '2023-01-02')"
+        ))
+
+    # Act
+    upgrade_schema(engine)
+    upgrade_schema(engine)
+
+    # Assert
+    with engine.connect() as connection:
+        totals = connection.execute(text(
+            "SELECT player_name, matches, total_score "
+            "FROM player_score_totals"
+        )).all()
+    assert totals == [("John Doe", 2, 30)]
+    engine.dispose()
+
+
+def test_upgrade_replaces_triggers_of_earlier_versions(tmp_path):
+    # Arrange: summaries of a version without monthly player totals.
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    upgrade_schema(engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE player_month_totals"))
+        connection.execute(text("DROP TRIGGER score_summaries_after_insert"))
+        connection.execute(text(
+            "CREATE TRIGGER score_summaries_after_insert AFTER INSERT "
+            "ON baseball_player_scores BEGIN SELECT 1; END"
+        ))
+
+    # Act
+    upgrade_schema(engine)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO baseball_player_scores "
+            "(player_name, score, match_date) "
+            "VALUES ('John Doe', 10, '2023-01-02')"
+        ))
+
+    # Assert
+    with engine.connect() as connection:
+        months = connection.execute(text(
+            "SELECT month, player_name, matches, total_score "
+            "FROM player_month_totals"
+        )).all()
+    assert months == [(202301, "John Doe", 1, 10)]
+    engine.dispose()
+
+
+def test_upgrade_rebuilds_name_search_of_earlier_versions(tmp_path):
+    # Arrange: name index of a version matching with the tokenizer's
+    # Unicode case folding.
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    upgrade_schema(engine)
+    with engine.begin() as connection:
+        for statement in (
+            "DROP TRIGGER name_search_after_insert",
+            "DROP TRIGGER name_search_after_update",
+            "DROP TABLE player_name_search",
+            "DROP TABLE player_names",
+            "CREATE TABLE player_names (id INTEGER PRIMARY KEY, "
+            "player_name VARCHAR NOT NULL UNIQUE)",
+            "CREATE VIRTUAL TABLE player_name_search USING fts5("
+            "player_name, content='player_names', content_rowid='id', "
+            "tokenize='trigram')",
+            "CREATE TRIGGER name_search_after_insert AFTER INSERT "
+            "ON baseball_player_scores BEGIN INSERT OR IGNORE INTO "
+            "player_names (player_name) VALUES (NEW.player_name); END",
+            "INSERT INTO baseball_player_scores "
+            "(player_name, score, match_date) "
+            "VALUES ('ÉMILE Dupont', 10, '2023-01-02')",
+        ):
+            connection.execute(text(statement))
+
+    # Act
+    upgrade_schema(engine)
+
+    # Assert
+    with engine.connect() as connection:
+        def matching(term):
+            return connection.execute(text(
+                "SELECT player_name FROM player_name_search "
+                "WHERE player_name_search MATCH :term"
+            ), {"term": term}).scalars().all()
+
+        assert matching("Émile") == ["ÉMILE Dupont"]
+        assert matching("émile") == []
+    engine.dispose()
@@ -0,0 +1,48 @@
+# test_etag_helper.py
+from app.helper.etag_helper import (
+    body_etag,
+    cache_headers,
+    conditional_json_response,
+    etag_matches,
+)
+
+
+def test_etag_matches_any_listed_tag_weakly():
+    # Arrange
+    etag = '"abc-r1-2"'
+
+    # Act & Assert
+    assert etag_matches('"other", W/"abc-r1-2"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abc-r1-1"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_cache_headers_skip_empty_cache_control():
+    # Act
+    headers = cache_headers('"abc-t1"', "")
+
+    # Assert
+    assert headers == {"ETag": '"abc-t1"'}
+
+
+def test_conditional_json_response_tags_the_body():
+    # Arrange
+    body = b'{"id":1}'
+
+    # Act
+    sent = conditional_json_response(body, None, "no-cache")
+    not_modified = conditional_json_response(
+        body,
+        body_etag(body),
+        "no-cache"
+    )
+
+    # Assert
+    assert sent.status_code == 200
+    assert sent.body == body
+    assert sent.headers["ETag"] == body_etag(body)
+    assert sent.headers["Cache-Control"] == "no-cache"
+    assert body_etag(b'{"id":2}') != body_etag(body)
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
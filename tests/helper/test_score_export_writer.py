@@ -0,0 +1,63 @@
+# test_score_export_writer.py
+import json
+from datetime import date
+from app.domain.score_file_format import ScoreFileFormat
+from app.helper.score_export_writer import write_export_chunks
+from app.models.baseball_player_score import BaseballPlayerScore
+
+
+def make_scores(count):
+    return [
+        BaseballPlayerScore(
+            id=index + 1,
+            player_name=f"Player {index}",
+            player_team="Team, A" if index % 2 else None,
+            score=index,
+            match_date=date(2023, 1, 1)
+        )
+        for index in range(count)
+    ]
+
+
+def test_write_csv_chunks():
+    # Act
+    chunks = list(
+        write_export_chunks(make_scores(3), ScoreFileFormat.CSV, 2)
+    )
+
+    # Assert
+    assert len(chunks) == 2
+    assert b"".join(chunks).decode().splitlines() == [
+        "id,player_name,player_team,score,match_date",
+        "1,Player 0,,0,2023-01-01",
+        '2,Player 1,"Team, A",1,2023-01-01',
+        "3,Player 2,,2,2023-01-01",
+    ]
+
+
+def test_write_csv_chunks_empty_export_has_header():
+    # Act
+    chunks = list(write_export_chunks([], ScoreFileFormat.CSV, 2))
+
+    # Assert
+    assert b"".join(chunks) == (
+        b"id,player_name,player_team,score,match_date\r\n"
+    )
+
+
+def test_write_ndjson_chunks():
+    # Act
+    chunks = list(
+        write_export_chunks(make_scores(3), ScoreFileFormat.NDJSON, 2)
+    )
+
+    # Assert
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(chunks) == 2
+    assert json.loads(lines[1]) == {
+        "id": 2,
+        "player_name": "Player 1",
+        "player_team": "Team, A",
+        "score": 1,
+        "match_date": "2023-01-01",
+    }
@@ -0,0 +1,53 @@
+# test_score_import_reader.py
+from app.domain.score_file_format import ScoreFileFormat
+from app.helper.score_import_reader import read_import_rows
+
+
+def test_read_csv_rows():
+    # Arrange
+    lines = [
+        "player_name,player_team,score,match_date\n",
+        "John Doe,,10,2023-01-01\n",
+        "Jane Doe,Team B,12,2023-01-02,extra\n",
+    ]
+
+    # Act
+    rows = list(read_import_rows(lines, ScoreFileFormat.CSV))
+
+    # Assert
+    assert rows[0].line_number == 2
+    assert rows[0].values == {
+        "player_name": "John Doe",
+        "score": "10",
+        "match_date": "2023-01-01",
+    }
+    assert rows[1].line_number == 3
+    assert rows[1].values is None
+    assert rows[1].error_message is not None
+
+
+def test_read_ndjson_rows():
+    # Arrange
+    lines = [
+        '{"player_name": "John Doe", "score": 10}\n',
+        "\n",
+        "{not json\n",
+        "[1, 2]\n",
+    ]
+
+    # Act
+    rows = list(read_import_rows(lines, ScoreFileFormat.NDJSON))
+
+    # Assert
+    assert [row.line_number for row in rows] == [1, 3, 4]
+    assert rows[0].values == {"player_name": "John Doe", "score": 10}
+    assert rows[1].values is None
+    assert rows[2].error_message == "Line is not a JSON object"
+
+
+def test_score_file_format_from_filename():
+    assert ScoreFileFormat.from_filename("2019.CSV") == ScoreFileFormat.CSV
+    assert (
+        ScoreFileFormat.from_filename("2019.jsonl") == ScoreFileFormat.NDJSON
+    )
+    assert ScoreFileFormat.from_filename("2019.txt") is None
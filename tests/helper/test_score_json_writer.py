@@ -0,0 +1,41 @@
+# test_score_json_writer.py
+import json
+from datetime import date
+
+from app.helper.score_json_writer import encode_score_json, join_score_page
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.schemas.pagination_response import Pagination, PaginationResponse
+from app.schemas.score_dto import ScoreDTO
+
+
+def test_joined_page_matches_the_pagination_response_json():
+    # Arrange
+    scores = [
+        BaseballPlayerScore(
+            id=index,
+            player_name=f"Player {index}",
+            player_team="Team A",
+            score=index * 10,
+            match_date=date(2024, 1, index)
+        )
+        for index in (1, 2)
+    ]
+    pagination = Pagination(
+        total_items=2,
+        total_pages=1,
+        current_page=1,
+        page_size=10
+    )
+    expected = PaginationResponse(
+        items=[ScoreDTO.model_validate(score) for score in scores],
+        pagination=pagination
+    )
+
+    # Act
+    body = join_score_page(
+        [encode_score_json(score) for score in scores],
+        pagination
+    )
+
+    # Assert
+    assert json.loads(body) == json.loads(expected.model_dump_json())
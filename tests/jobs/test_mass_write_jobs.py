@@ -0,0 +1,83 @@
+# test_mass_write_jobs.py
+import threading
+from app.domain.mass_write_kind import MassWriteKind
+from app.domain.mass_write_status import MassWriteStatus
+from app.jobs.mass_write_jobs import MassWriteJob, MassWriteJobs
+from app.schemas.mass_write_schema import ScoreFilter
+
+
+def make_job():
+    return MassWriteJob(MassWriteKind.DELETE, ScoreFilter(player_team="X"))
+
+
+def test_submitted_job_reports_progress_until_it_completes():
+    # Arrange
+    chunk_done = threading.Event()
+    resume = threading.Event()
+
+    def run_job(job):
+        job.start(1, 100)
+        job.record_chunk(25, rows_written=3)
+        chunk_done.set()
+        resume.wait(5)
+        job.record_chunk(75, rows_written=2, rows_skipped=1)
+        job.finish(MassWriteStatus.COMPLETED)
+
+    jobs = MassWriteJobs(run_job)
+
+    # Act
+    job = jobs.submit(make_job())
+    chunk_done.wait(5)
+    running = job.snapshot()
+    resume.set()
+    job.wait(5)
+    completed = jobs.get(job.id).snapshot()
+
+    # Assert
+    assert running.status == MassWriteStatus.RUNNING
+    assert (running.progress, running.rows_written) == (0.25, 3)
+    assert completed.status == MassWriteStatus.COMPLETED
+    assert (completed.progress, completed.chunks) == (1.0, 2)
+    assert (completed.rows_written, completed.rows_skipped) == (5, 1)
+    assert completed.finished_at is not None
+
+
+def test_cancel_is_only_accepted_while_running():
+    # Arrange
+    jobs = MassWriteJobs(
+        lambda job: job.finish(
+            MassWriteStatus.CANCELLED if job.cancel_requested
+            else MassWriteStatus.COMPLETED
+        )
+    )
+    job = make_job()
+
+    # Act
+    accepted = job.cancel()
+    jobs.submit(job).wait(5)
+
+    # Assert
+    assert accepted
+    assert job.snapshot().status == MassWriteStatus.CANCELLED
+    assert not job.cancel()
+
+
+def test_failing_job_is_reported_and_old_finished_jobs_are_dropped():
+    # Arrange
+    def run_job(job):
+        raise RuntimeError("database is locked")
+
+    jobs = MassWriteJobs(run_job, max_finished_jobs=2)
+
+    # Act
+    submitted = [jobs.submit(make_job()) for _ in range(3)]
+    for job in submitted:
+        job.wait(5)
+    jobs.submit(make_job()).wait(5)
+
+    # Assert
+    snapshot = submitted[0].snapshot()
+    assert snapshot.status == MassWriteStatus.FAILED
+    assert snapshot.error_message == "database is locked"
+    assert len(jobs.list_jobs()) <= 3
+    assert jobs.get(submitted[0].id) is None
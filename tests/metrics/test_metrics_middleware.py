@@ -0,0 +1,82 @@
+# test_metrics_middleware.py
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from app.metrics.metrics_middleware import MetricsMiddleware
+from app.metrics.request_metrics import RequestMetrics
+from app.metrics.sql_usage import install_sql_metrics
+
+
+# Fixture for an application whose sync handler runs two statements
+@pytest.fixture(scope="function")
+def app_and_engine():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    install_sql_metrics(engine)
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        return {"id": item_id}
+
+    yield app, engine
+    engine.dispose()
+
+
+def send_requests(app, metrics, *paths):
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(
+                app=MetricsMiddleware(app, metrics=metrics)
+            ),
+            base_url="http://test"
+        ) as client:
+            for path in paths:
+                await client.get(path)
+
+    asyncio.run(send())
+
+
+def test_requests_are_recorded_under_their_route(app_and_engine):
+    # Arrange
+    app, _ = app_and_engine
+    metrics = RequestMetrics()
+
+    # Act
+    send_requests(app, metrics, "/items/1", "/items/2", "/unknown/3")
+
+    # Assert
+    lines = metrics.render().splitlines()
+    labels = 'method="GET",route="/items/{item_id}"'
+    assert f'http_requests_total{{{labels},status="200"}} 2' in lines
+    assert f"http_request_sql_statements_total{{{labels}}} 4" in lines
+    assert (
+        'http_requests_total{method="GET",route="unmatched",status="404"} 1'
+        in lines
+    )
+
+
+def test_statements_outside_requests_are_not_counted(app_and_engine):
+    # Arrange
+    app, engine = app_and_engine
+    metrics = RequestMetrics()
+
+    # Act
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 3"))
+    send_requests(app, metrics, "/items/1")
+
+    # Assert
+    assert (
+        'http_request_sql_statements_total{method="GET",'
+        'route="/items/{item_id}"} 2'
+    ) in metrics.render().splitlines()
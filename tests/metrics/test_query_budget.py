@@ -0,0 +1,83 @@
+# test_query_budget.py
+import pytest
+from app.metrics.query_budget import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    bind_shape,
+    parse_route_budgets,
+)
+from app.metrics.sql_usage import SqlUsage
+
+
+def make_sql_usage(*statements):
+    sql_usage = SqlUsage(record_queries=True)
+    for statement in statements:
+        sql_usage.statements += 1
+        sql_usage.queries.append((statement, ("John", 5), False))
+    return sql_usage
+
+
+def test_check_request_uses_the_route_budget_before_the_default():
+    # Arrange
+    query_budget = QueryBudget(
+        route_budgets={"GET /scores": 2},
+        default_budget=1,
+        strict=True
+    )
+    sql_usage = make_sql_usage("SELECT 1", "SELECT 2")
+
+    # Act / Assert
+    query_budget.check_request("GET", "/scores", sql_usage)
+    with pytest.raises(QueryBudgetExceeded, match="over its budget of 1"):
+        query_budget.check_request("GET", "/scores/{score_id}", sql_usage)
+
+
+def test_check_request_reports_repeated_statements(caplog):
+    # Arrange
+    query_budget = QueryBudget(repeat_limit=2)
+    sql_usage = make_sql_usage(*["SELECT ? FROM scores"] * 3)
+
+    # Act
+    query_budget.check_request("GET", "/scores", sql_usage)
+
+    # Assert
+    assert "3 times, possible N+1 queries" in caplog.text
+
+
+def test_slow_statements_fail_the_request_in_strict_mode(caplog):
+    # Arrange
+    query_budget = QueryBudget(slow_query_seconds=0.1, strict=True)
+    sql_usage = SqlUsage()
+
+    # Act
+    query_budget.check_statement(
+        "SELECT * FROM scores WHERE player_name = ?",
+        ("John",),
+        False,
+        0.25,
+        sql_usage
+    )
+
+    # Assert
+    assert "Slow SQL statement: 250.0 ms" in caplog.text
+    assert "binds: (str)" in caplog.text
+    with pytest.raises(QueryBudgetExceeded):
+        query_budget.check_request("GET", "/scores", sql_usage)
+
+
+def test_bind_shape_hides_values():
+    # Act
+    shape = bind_shape(("John", "Team A", 5, 6, 7))
+
+    # Assert
+    assert shape == "(str x 2, int x 3)"
+
+
+def test_parse_route_budgets():
+    # Act
+    budgets = parse_route_budgets("get /scores=2, POST /scores/bulk=10")
+
+    # Assert
+    assert budgets == {"GET /scores": 2, "POST /scores/bulk": 10}
+    with pytest.raises(ValueError):
+        parse_route_budgets("/scores=2")
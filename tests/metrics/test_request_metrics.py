@@ -0,0 +1,54 @@
+# test_request_metrics.py
+from app.metrics.request_metrics import RequestMetrics
+from app.metrics.sql_usage import SqlUsage
+
+
+def make_sql_usage(statements, seconds):
+    sql_usage = SqlUsage()
+    sql_usage.statements = statements
+    sql_usage.seconds = seconds
+    return sql_usage
+
+
+def test_render_reports_cumulative_buckets_statuses_and_sql():
+    # Arrange
+    metrics = RequestMetrics()
+    metrics.observe("GET", "/scores/{score_id}", 200, 0.0007, SqlUsage())
+    metrics.observe(
+        "GET", "/scores/{score_id}", 404, 0.003, make_sql_usage(1, 0.002)
+    )
+
+    # Act
+    lines = metrics.render().splitlines()
+
+    # Assert
+    labels = 'method="GET",route="/scores/{score_id}"'
+    assert (
+        f'http_request_duration_seconds_bucket{{{labels},le="0.0005"}} 0'
+        in lines
+    )
+    assert (
+        f'http_request_duration_seconds_bucket{{{labels},le="0.001"}} 1'
+        in lines
+    )
+    assert (
+        f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2'
+        in lines
+    )
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert f'http_requests_total{{{labels},status="200"}} 1' in lines
+    assert f'http_requests_total{{{labels},status="404"}} 1' in lines
+    assert f"http_request_sql_statements_total{{{labels}}} 1" in lines
+    assert f"http_request_sql_seconds_total{{{labels}}} 0.002" in lines
+
+
+def test_render_escapes_label_values():
+    # Arrange
+    metrics = RequestMetrics()
+    metrics.observe("GET", 'a"b\\c', 200, 0.1, SqlUsage())
+
+    # Act
+    text = metrics.render()
+
+    # Assert
+    assert 'route="a\\"b\\\\c"' in text
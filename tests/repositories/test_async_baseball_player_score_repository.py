@@ -0,0 +1,91 @@
+# test_async_baseball_player_score_repository.py
+import asyncio
+import pytest
+from datetime import date
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.async_baseball_player_score_repository import (
+    AsyncBaseballPlayerScoreRepository,
+)
+
+pytest.importorskip("aiosqlite")
+
+
+def run_with_repository(test):
+    # Runs the coroutine `test(repository)` against an in-memory database.
+    async def run():
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            poolclass=StaticPool
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(BaseballPlayerScore.metadata.create_all)
+        SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+        async with SessionLocal() as session:
+            await test(AsyncBaseballPlayerScoreRepository(session))
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_create_get_update_delete():
+    async def test(repository):
+        # Arrange
+        created = (
+            await repository.create(
+                BaseballPlayerScore(
+                    player_name="Jane Doe",
+                    player_team="Team B",
+                    score=15,
+                    match_date=date(2023, 2, 1)
+                )
+            )
+        ).entity
+
+        # Act
+        retrieved = await repository.get_by_id(created.id)
+        updated = await repository.update(created.id, {"score": 30})
+        deleted = await repository.delete(created.id)
+        missing = await repository.get_by_id(created.id)
+
+        # Assert
+        assert retrieved.is_ok
+        assert retrieved.entity.player_name == "Jane Doe"
+        assert updated.entity.score == 30
+        assert deleted.is_ok
+        assert missing.is_not_found
+
+    run_with_repository(test)
+
+
+def test_search_scores():
+    async def test(repository):
+        # Arrange
+        for index in range(6):
+            await repository.create(
+                BaseballPlayerScore(
+                    player_name=f"Player {index}",
+                    player_team="Team X" if index % 2 else "Team Y",
+                    score=index * 10,
+                    match_date=date(2023, 6, index + 1)
+                )
+            )
+
+        # Act
+        result = await repository.search_scores(
+            player_name=None,
+            player_team="Team X",
+            min_score=20,
+            start_date=None,
+            end_date=None,
+            page=1,
+            page_size=10
+        )
+
+        # Assert
+        assert result.is_ok
+        assert [score.score for score in result.entity.items] == [30, 50]
+        assert result.entity.total_items == 2
+
+    run_with_repository(test)
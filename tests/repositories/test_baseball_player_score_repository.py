@@ -1,12 +1,27 @@
 # test_baseball_player_score_repository.py
 import pytest
 from datetime import datetime
+from unittest.mock import MagicMock
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from app.cache.count_cache import CountCache
+from app.domain.repository_action_status import RepositoryActionStatus
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.domain.total_count_mode import TotalCountMode
+from app.mappings.score_mapping import (
+    convert_score_entity_to_dto,
+    convert_score_rows_to_dtos,
+)
 from app.models.baseball_player_score import BaseballPlayerScore
 from app.repositories.baseball_player_score_repository import (
     BaseballPlayerScoreRepository,
 )
+from app.repositories.repository_listener import RepositoryListener
+from app.repositories.score_queries import (
+    count_statement,
+    id_update_statement,
+)
 
 
 # Fixture for an in-memory SQLite database
@@ -49,6 +64,35 @@ def test_create_baseball_player_score(baseball_player_score_repository):
     )
 
 
+def test_create_duplicate_player_and_date_is_a_conflict(
+    baseball_player_score_repository
+):
+    # Arrange
+    match_date = datetime.strptime("2023-01-01", "%Y-%m-%d").date()
+    baseball_player_score_repository.create(
+        BaseballPlayerScore(player_name="John Doe", score=10,
+                            match_date=match_date)
+    )
+
+    # Act
+    result = baseball_player_score_repository.create(
+        BaseballPlayerScore(player_name="John Doe", score=20,
+                            match_date=match_date)
+    )
+
+    # Assert
+    assert result.is_conflict
+    assert baseball_player_score_repository.search_scores(
+        player_name="John Doe",
+        player_team=None,
+        min_score=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=10
+    ).entity.total_items == 1
+
+
 def test_get_by_id(baseball_player_score_repository):
     # Arrange
     new_score = BaseballPlayerScore(
@@ -149,6 +193,76 @@ def test_update(baseball_player_score_repository):
     assert updated_score.match_date == update_result.entity.match_date
 
 
+def test_reads_return_untracked_rows_that_map_to_dtos(
+    db_session,
+    baseball_player_score_repository
+):
+    # Arrange
+    created_score = baseball_player_score_repository.create(
+        BaseballPlayerScore(
+            player_name="Emily Johnson",
+            player_team="Team D",
+            score=25,
+            match_date=datetime.strptime("2023-04-01", "%Y-%m-%d").date()
+        )
+    ).entity
+
+    # Act
+    get_result = baseball_player_score_repository.get_by_id(created_score.id)
+    search_result = baseball_player_score_repository.search_scores(
+        player_name=None,
+        player_team="Team D",
+        min_score=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=10
+    )
+
+    # Assert
+    assert len(db_session.identity_map) == 0
+    dtos = convert_score_rows_to_dtos(search_result.entity.items)
+    assert dtos == [convert_score_entity_to_dto(get_result.entity)]
+    assert dtos[0].player_team == "Team D"
+
+
+def test_update_missing_score_is_not_found(baseball_player_score_repository):
+    # Act
+    update_result = baseball_player_score_repository.update(42, {"score": 1})
+    delete_result = baseball_player_score_repository.delete(42)
+
+    # Assert
+    assert update_result.is_not_found
+    assert delete_result.is_not_found
+
+
+def test_update_to_existing_player_and_date_is_a_conflict(
+    baseball_player_score_repository
+):
+    # Arrange
+    match_date = datetime.strptime("2023-04-01", "%Y-%m-%d").date()
+    baseball_player_score_repository.create(
+        BaseballPlayerScore(player_name="Emily Johnson", score=25,
+                            match_date=match_date)
+    )
+    other_score = baseball_player_score_repository.create(
+        BaseballPlayerScore(player_name="Mark Smith", score=20,
+                            match_date=match_date)
+    ).entity
+
+    # Act
+    update_result = baseball_player_score_repository.update(
+        other_score.id,
+        {"player_name": "Emily Johnson"}
+    )
+
+    # Assert
+    assert update_result.is_conflict
+    assert baseball_player_score_repository.get_by_id(
+        other_score.id
+    ).entity.player_name == "Mark Smith"
+
+
 def test_get_score_from_player_and_date(baseball_player_score_repository):
     # Arrange
     test_score = BaseballPlayerScore(
@@ -270,3 +384,504 @@ def test_search_scores_by_names(baseball_player_score_repository):
         score.player_team >= "Team Y" for score in search_result.entity.items
     )
     assert search_result.entity.total_items >= 1
+
+
+def test_search_scores_by_name_query(baseball_player_score_repository):
+    # Arrange
+    for name, score in (
+        ("Jane Smith", 40),
+        ("Will Smithers", 60),
+        ("John Doe", 80),
+        ("Li Smi", 90),
+    ):
+        baseball_player_score_repository.create(
+            BaseballPlayerScore(
+                player_name=name,
+                player_team="Team X",
+                score=score,
+                match_date=datetime(2023, 6, 1).date()
+            )
+        )
+    baseball_player_score_repository.update(1, {"player_name": "Jo Smith"})
+
+    def names(name_query, min_score=None):
+        return sorted(
+            score.player_name
+            for score in baseball_player_score_repository.search_scores(
+                player_name=None,
+                player_team=None,
+                min_score=min_score,
+                start_date=None,
+                end_date=None,
+                page=1,
+                page_size=10,
+                name_query=name_query
+            ).entity.items
+        )
+
+    # Act / Assert
+    assert names("smi") == ["Jo Smith", "Li Smi", "Will Smithers"]
+    assert names("SMITH", min_score=50) == ["Will Smithers"]
+    assert names("jo smi") == ["Jo Smith"]
+    # Words shorter than a trigram are matched without the index.
+    assert names("ll") == ["Will Smithers"]
+    assert names("jane") == []
+
+
+def test_search_scores_keyset_pagination(baseball_player_score_repository):
+    # Arrange
+    for day in range(1, 8):
+        baseball_player_score_repository.create(
+            BaseballPlayerScore(
+                player_name=f"Player {day}",
+                player_team="Team X",
+                score=day * 10,
+                match_date=datetime(2023, 6, day).date()
+            )
+        )
+
+    # Act
+    first_page = baseball_player_score_repository.search_scores(
+        player_name=None,
+        player_team=None,
+        min_score=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=5,
+        sort_order=ScoreSortOrder.SCORE_DESC
+    ).entity
+    last_item = first_page.items[-1]
+    second_page = baseball_player_score_repository.search_scores(
+        player_name=None,
+        player_team=None,
+        min_score=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=5,
+        sort_order=ScoreSortOrder.SCORE_DESC,
+        after=(last_item.score, last_item.id)
+    ).entity
+
+    # Assert
+    assert [s.score for s in first_page.items] == [70, 60, 50, 40, 30]
+    assert first_page.has_more
+    assert [s.score for s in second_page.items] == [20, 10]
+    assert not second_page.has_more
+    assert second_page.total_items == 7
+
+
+def test_search_scores_count_is_cached_until_write(db_session):
+    # Arrange
+    repository = BaseballPlayerScoreRepository(
+        db_session,
+        count_cache=CountCache()
+    )
+    repository.create(
+        BaseballPlayerScore(
+            player_name="Player A",
+            player_team="Team X",
+            score=40,
+            match_date=datetime(2023, 6, 1).date()
+        )
+    )
+    search = dict(
+        player_name=None,
+        player_team="Team X",
+        min_score=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=10
+    )
+    assert repository.search_scores(**search).entity.total_items == 1
+
+    # Act
+    repository.create(
+        BaseballPlayerScore(
+            player_name="Player B",
+            player_team="Team X",
+            score=50,
+            match_date=datetime(2023, 6, 2).date()
+        )
+    )
+    result = repository.search_scores(**search).entity
+    skipped = repository.search_scores(
+        **search,
+        include_total=TotalCountMode.NONE
+    ).entity
+    estimated = repository.search_scores(
+        **search,
+        include_total=TotalCountMode.ESTIMATE
+    ).entity
+
+    # Assert
+    assert result.total_items == 2
+    assert skipped.total_items is None
+    assert estimated.total_items == 2
+    assert not estimated.total_is_estimate
+
+
+def test_create_many_and_get_existing_player_dates(
+    baseball_player_score_repository
+):
+    # Arrange
+    values = [
+        {
+            "player_name": f"Player {index}",
+            "player_team": "Team X",
+            "score": index,
+            "match_date": datetime(2023, 6, 1).date(),
+        }
+        for index in range(3)
+    ]
+
+    # Act
+    create_result = baseball_player_score_repository.create_many(values)
+    existing_result = (
+        baseball_player_score_repository.get_existing_player_dates([
+            ("Player 1", datetime(2023, 6, 1).date()),
+            ("Player 1", datetime(2023, 6, 2).date()),
+            ("Player 9", datetime(2023, 6, 1).date()),
+        ])
+    )
+
+    # Assert
+    assert create_result.is_ok
+    assert [
+        item.entity.player_name for item in create_result.entity
+    ] == ["Player 0", "Player 1", "Player 2"]
+    assert all(item.entity.id is not None for item in create_result.entity)
+    assert existing_result.entity == {
+        ("Player 1", datetime(2023, 6, 1).date())
+    }
+
+
+def test_create_many_reports_conflicts_per_row(
+    baseball_player_score_repository
+):
+    # Arrange
+    def value(player_name, score):
+        return {
+            "player_name": player_name,
+            "score": score,
+            "match_date": datetime(2023, 6, 1).date(),
+        }
+
+    baseball_player_score_repository.create_many([value("Player 1", 1)])
+
+    # Act
+    result = baseball_player_score_repository.create_many([
+        value("Player 2", 2),
+        value("Player 1", 3),
+        value("Player 3", 4),
+        value("Player 2", 5),
+    ])
+
+    # Assert
+    assert result.is_ok
+    assert [item.status for item in result.entity] == [
+        RepositoryActionStatus.OK,
+        RepositoryActionStatus.CONFLICT,
+        RepositoryActionStatus.OK,
+        RepositoryActionStatus.CONFLICT,
+    ]
+    assert [result.entity[0].entity.score, result.entity[2].entity.score] == [
+        2, 4
+    ]
+
+
+def test_create_many_notifies_listeners_once_per_batch(db_session):
+    # Arrange
+    listener = MagicMock(spec=RepositoryListener)
+    repository = BaseballPlayerScoreRepository(
+        db_session,
+        listeners=[listener]
+    )
+
+    # Act
+    result = repository.create_many([
+        {
+            "player_name": f"Player {index}",
+            "score": index,
+            "match_date": datetime(2023, 6, 1).date(),
+        }
+        for index in range(3)
+    ])
+
+    # Assert
+    listener.after_create_many.assert_called_once_with(
+        [item.entity for item in result.entity]
+    )
+    listener.after_create.assert_not_called()
+
+
+def test_get_many_and_get_scores_by_player_dates(
+    baseball_player_score_repository
+):
+    # Arrange
+    created = baseball_player_score_repository.create_many([
+        {
+            "player_name": f"Player {index}",
+            "player_team": "Team X",
+            "score": index,
+            "match_date": datetime(2023, 6, 1).date(),
+        }
+        for index in range(3)
+    ]).entity
+    created = [item.entity for item in created]
+    ids = [row.id for row in created]
+
+    # Act
+    many_result = baseball_player_score_repository.get_many(
+        [ids[2], ids[0], ids[2], 999]
+    )
+    keys_result = (
+        baseball_player_score_repository.get_scores_by_player_dates([
+            ("Player 1", datetime(2023, 6, 1).date()),
+            ("Player 1", datetime(2023, 6, 2).date()),
+        ])
+    )
+
+    # Assert
+    assert many_result.is_ok
+    assert sorted(row.id for row in many_result.entity) == [ids[0], ids[2]]
+    assert keys_result.is_ok
+    assert [
+        convert_score_entity_to_dto(row) for row in keys_result.entity
+    ] == [convert_score_entity_to_dto(created[1])]
+
+
+@pytest.mark.parametrize("atomic", [True, False])
+def test_update_many_reports_each_patch(
+    baseball_player_score_repository,
+    atomic
+):
+    # Arrange
+    ids = [
+        item.entity.id
+        for item in baseball_player_score_repository.create_many([
+            {
+                "player_name": f"Player {index}",
+                "player_team": "Team X",
+                "score": index,
+                "match_date": datetime(2023, 6, 1).date(),
+            }
+            for index in range(3)
+        ]).entity
+    ]
+
+    # Act
+    result = baseball_player_score_repository.update_many([
+        (ids[0], {"score": 50}),
+        (ids[1], {"player_name": "Player 2"}),
+        (999, {"score": 1}),
+        (ids[2], {"score": 70, "player_team": "Team Y"}),
+    ], atomic=atomic)
+
+    # Assert
+    assert result.is_ok
+    assert [item.status for item in result.entity] == [
+        RepositoryActionStatus.OK,
+        RepositoryActionStatus.CONFLICT,
+        RepositoryActionStatus.NOT_FOUND,
+        RepositoryActionStatus.OK,
+    ]
+    stored = {
+        row.id: row.score
+        for row in baseball_player_score_repository.get_many(ids).entity
+    }
+    if atomic:
+        assert result.entity[0].entity is None
+        assert stored == {ids[0]: 0, ids[1]: 1, ids[2]: 2}
+    else:
+        assert result.entity[0].entity.score == 50
+        assert stored == {ids[0]: 50, ids[1]: 1, ids[2]: 70}
+
+
+@pytest.mark.parametrize("atomic", [True, False])
+def test_delete_many_reports_each_id(
+    baseball_player_score_repository,
+    atomic
+):
+    # Arrange
+    created = baseball_player_score_repository.create_many([
+        {
+            "player_name": f"Player {index}",
+            "score": index,
+            "match_date": datetime(2023, 6, 1).date(),
+        }
+        for index in range(2)
+    ]).entity
+    created = [item.entity for item in created]
+
+    # Act
+    result = baseball_player_score_repository.delete_many(
+        [created[1].id, 999],
+        atomic=atomic
+    )
+
+    # Assert
+    assert [item.status for item in result.entity] == [
+        RepositoryActionStatus.OK,
+        RepositoryActionStatus.NOT_FOUND,
+    ]
+    remaining = baseball_player_score_repository.get_many(
+        [row.id for row in created]
+    ).entity
+    assert len(remaining) == (2 if atomic else 1)
+
+
+def test_update_matching_in_range_shifts_consecutive_dates(
+    baseball_player_score_repository
+):
+    # Arrange
+    baseball_player_score_repository.create_many([
+        {
+            "player_name": player_name,
+            "player_team": player_team,
+            "score": day,
+            "match_date": datetime(2023, 6, day).date(),
+        }
+        for player_name, player_team, day in (
+            ("John Doe", "Team A", 1),
+            ("John Doe", "Team A", 2),
+            ("John Doe", "Team A", 3),
+            ("Jane Doe", "Team A", 1),
+            ("Jane Doe", "Team B", 2),
+        )
+    ])
+
+    # Act
+    result = baseball_player_score_repository.update_matching_in_range(
+        ScoreSearchFilter(player_team="Team A"),
+        1,
+        100,
+        {},
+        shift_days=1
+    )
+
+    # Assert
+    assert result.entity == (3, 1)
+    scores = baseball_player_score_repository.get_many(range(1, 6)).entity
+    assert sorted(
+        (row.player_name, row.match_date.day) for row in scores
+    ) == [
+        ("Jane Doe", 1), ("Jane Doe", 2),
+        ("John Doe", 2), ("John Doe", 3), ("John Doe", 4),
+    ]
+
+
+def test_stream_scores(baseball_player_score_repository):
+    # Arrange
+    baseball_player_score_repository.create_many([
+        {
+            "player_name": f"Player {index}",
+            "player_team": "Team X",
+            "score": index,
+            "match_date": datetime(2023, 6, 1).date(),
+        }
+        for index in range(10)
+    ])
+
+    # Act
+    stream_result = baseball_player_score_repository.stream_scores(
+        player_name=None,
+        player_team="Team X",
+        min_score=5,
+        start_date=None,
+        end_date=None,
+        chunk_size=2
+    )
+
+    # Assert
+    assert stream_result.is_ok
+    assert [row.score for row in stream_result.entity] == [5, 6, 7, 8, 9]
+
+
+@pytest.mark.parametrize(
+    "name_query",
+    ["smi", "SMI", "sm", "émile", "Émile", "ÉM", "é", "dupont", "ss", "ß"]
+)
+def test_name_query_matches_the_names_the_filter_matches(
+    baseball_player_score_repository,
+    name_query
+):
+    # Arrange
+    names = ["Jane Smith", "ÉMILE Dupont", "émile Durand", "Groß"]
+    for name in names:
+        baseball_player_score_repository.create(
+            BaseballPlayerScore(
+                player_name=name,
+                player_team="Team X",
+                score=10,
+                match_date=datetime(2023, 6, 1).date()
+            )
+        )
+    search_filter = ScoreSearchFilter(name_query=name_query)
+
+    # Act
+    found = {
+        score.player_name
+        for score in baseball_player_score_repository.search_scores(
+            player_name=None,
+            player_team=None,
+            min_score=None,
+            start_date=None,
+            end_date=None,
+            page=1,
+            page_size=10,
+            name_query=name_query
+        ).entity.items
+    }
+
+    # Assert: searches and cache invalidation fold case the same way.
+    assert found == {
+        score.player_name
+        for score in baseball_player_score_repository.get_many(
+            list(range(1, len(names) + 1))
+        ).entity
+        if search_filter.matches(score)
+    }
+
+
+def test_name_query_falls_back_to_like_without_the_name_index(
+    db_session,
+    baseball_player_score_repository
+):
+    # Arrange
+    for name in ("Jane Smith", "Will Smithers", "John Doe"):
+        baseball_player_score_repository.create(
+            BaseballPlayerScore(
+                player_name=name,
+                player_team="Team X",
+                score=10,
+                match_date=datetime(2023, 6, 1).date()
+            )
+        )
+    statement = count_statement(
+        ScoreSearchFilter(name_query="SMITH j"),
+        "postgresql"
+    )
+
+    # Act
+    sql = str(statement)
+    count = db_session.scalar(statement)
+
+    # Assert
+    assert "player_name_search" not in sql
+    assert "player_names" not in sql
+    assert count == 1
+
+
+def test_date_shift_statement_is_refused_off_sqlite():
+    # Arrange
+    search_filter = ScoreSearchFilter(player_team="Team X")
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        id_update_statement(search_filter, "postgresql", {}, shift_days=1)
+    assert "date(" in str(
+        id_update_statement(search_filter, "sqlite", {}, shift_days=1)
+    )
@@ -0,0 +1,155 @@
+# test_score_query_plans.py
+import itertools
+import pytest
+from datetime import date, timedelta
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from app.database.schema_migrations import upgrade_schema
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.domain.score_sort_order import ScoreSortOrder
+from app.repositories.score_queries import count_statement, page_statement
+
+# Query plans of the search statements for each of the 32 combinations of
+# the player_name, player_team, min_score, start_date and end_date
+# filters. A filter must be served by an index SEARCH, a full SCAN of the
+# scores means an index is missing, and a page sorted in a TEMP B-TREE
+# means no index returns its rows in order.
+
+FILTER_VALUES = {
+    "player_name": "Player 1",
+    "player_team": "Team 1",
+    "min_score": 50,
+    "start_date": date(2020, 2, 1),
+    "end_date": date(2020, 3, 1),
+}
+
+FILTER_COMBINATIONS = [
+    combination
+    for size in range(len(FILTER_VALUES) + 1)
+    for combination in itertools.combinations(FILTER_VALUES, size)
+]
+
+# No index can both seek a range on one column and return rows ordered by
+# another. For a lone range filter SQLite reads the sort index in order
+# instead and LIMIT stops it after one page of matches, which is accepted.
+ORDERED_SCANS = {
+    (("min_score",), "match_date"),
+    (("start_date",), "score"),
+    (("end_date",), "score"),
+}
+
+# Column each range filter bounds.
+RANGE_FILTERS = {
+    "min_score": "score",
+    "start_date": "match_date",
+    "end_date": "match_date",
+}
+
+# Nor can an index seek a range on one column and return rows ordered by
+# another, so pages with such a range filter sort the rows the seek reads,
+# bounded by the range and any player or team filter. Every other page,
+# keyset or not, must read its rows in order and stop after one page.
+SORTED_PAGES = {
+    (combination, sort_field)
+    for combination in FILTER_COMBINATIONS
+    for sort_field in ("match_date", "score")
+    if any(
+        RANGE_FILTERS.get(name) not in (None, sort_field)
+        for name in combination
+    )
+}
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["", "analyzed"])
+def engine(request):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    upgrade_schema(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO baseball_player_scores "
+            "(player_name, player_team, score, match_date) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (
+                    f"Player {index % 500}",
+                    f"Team {index % 30}",
+                    index % 90,
+                    (date(2020, 1, 1) + timedelta(days=index // 500))
+                    .isoformat(),
+                )
+                for index in range(20000)
+            ]
+        )
+        if request.param:
+            connection.exec_driver_sql("ANALYZE")
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, statement):
+    sql = statement.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as connection:
+        return [
+            row[-1] for row in
+            connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+        ]
+
+
+def search_statements(combination):
+    search_filter = ScoreSearchFilter(
+        **{name: FILTER_VALUES[name] for name in combination}
+    )
+    yield "count", count_statement(search_filter, "sqlite")
+    for sort_order in ScoreSortOrder:
+        yield sort_order.value, page_statement(
+            search_filter, "sqlite", sort_order, page=3, page_size=20
+        )
+        after = (
+            FILTER_VALUES["start_date"]
+            if sort_order.field_name == "match_date"
+            else FILTER_VALUES["min_score"]
+        ), 100
+        yield f"{sort_order.value} after", page_statement(
+            search_filter, "sqlite", sort_order,
+            page=1, page_size=20, after=after
+        )
+
+
+@pytest.mark.parametrize(
+    "combination",
+    FILTER_COMBINATIONS,
+    ids=lambda combination: "+".join(combination) or "no_filter"
+)
+def test_filters_never_scan_the_scores(engine, combination):
+    # Arrange
+    statements = list(search_statements(combination))
+
+    # Act
+    plans = {
+        label: query_plan(engine, statement)
+        for label, statement in statements
+    }
+
+    # Assert
+    for label, plan in plans.items():
+        scans = [
+            step for step in plan
+            if step.startswith("SCAN baseball_player_scores")
+        ]
+        sort_field = label.split()[0].lstrip("-")
+        if scans:
+            # Without filter every row matches, only the order must come
+            # from an index.
+            accepted = (
+                not combination
+                or (combination, sort_field) in ORDERED_SCANS
+            )
+            assert accepted, f"{label}: {plan}"
+            assert all("INDEX" in step for step in scans), (
+                f"{label}: {plan}"
+            )
+        if (label != "count"
+                and (combination, sort_field) not in SORTED_PAGES):
+            assert not any("TEMP B-TREE" in step for step in plan), (
+                f"{label}: {plan}"
+            )
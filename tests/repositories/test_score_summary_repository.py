@@ -0,0 +1,192 @@
+# test_score_summary_repository.py
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database.schema_migrations import upgrade_schema
+from app.domain.score_search_filter import ScoreSearchFilter
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.models.score_summaries import SUMMARY_TABLES
+from app.repositories.baseball_player_score_repository import (
+    BaseballPlayerScoreRepository,
+)
+from app.repositories.score_summary_repository import ScoreSummaryRepository
+
+
+# Fixture for an in-memory SQLite database with the summary triggers
+@pytest.fixture(scope="function")
+def db_session():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    upgrade_schema(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+def make_score(player_name, player_team, score, match_date):
+    return BaseballPlayerScore(
+        player_name=player_name,
+        player_team=player_team,
+        score=score,
+        match_date=match_date
+    )
+
+
+def read_summaries(db_session):
+    return [
+        sorted(tuple(row) for row in db_session.execute(select(table)))
+        for table in SUMMARY_TABLES
+    ]
+
+
+def test_writes_keep_summaries_equal_to_a_rebuild(db_session):
+    # Arrange
+    score_repository = BaseballPlayerScoreRepository(db_session)
+    summary_repository = ScoreSummaryRepository(db_session)
+    first = score_repository.create(
+        make_score("John Doe", "Team A", 10, date(2023, 12, 31))
+    ).entity
+    score_repository.create(
+        make_score("John Doe", None, 20, date(2024, 1, 1))
+    )
+    last = score_repository.create(
+        make_score("Jane Doe", "Team B", 30, date(2024, 1, 1))
+    ).entity
+
+    # Act
+    score_repository.update(
+        first.id,
+        {"player_team": "Team B", "match_date": date(2024, 1, 2)}
+    )
+    score_repository.delete(last.id)
+    maintained = read_summaries(db_session)
+    rebuild_result = summary_repository.rebuild()
+
+    # Assert
+    assert rebuild_result.is_ok
+    assert maintained == read_summaries(db_session)
+    total = summary_repository.get_player_total("John Doe").entity
+    assert (total.matches, total.total_score) == (2, 30)
+    assert summary_repository.get_player_total("Jane Doe").is_not_found
+
+
+def test_range_writes_keep_summaries_equal_to_a_rebuild(db_session):
+    # Arrange
+    score_repository = BaseballPlayerScoreRepository(db_session)
+    summary_repository = ScoreSummaryRepository(db_session)
+    for day in range(1, 6):
+        score_repository.create(
+            make_score("John Doe", "Team A", day, date(2023, 6, day))
+        )
+        score_repository.create(
+            make_score("Jane Doe", "Team B", day, date(2023, 6, day))
+        )
+
+    # Act
+    score_repository.update_matching_in_range(
+        ScoreSearchFilter(player_team="Team A"),
+        1,
+        100,
+        {"score": 7},
+        shift_days=1
+    )
+    score_repository.delete_matching_in_range(
+        ScoreSearchFilter(player_team="Team B", min_score=3),
+        1,
+        100
+    )
+    maintained = read_summaries(db_session)
+    summary_repository.rebuild()
+
+    # Assert
+    assert maintained == read_summaries(db_session)
+    john = summary_repository.get_player_total("John Doe").entity
+    jane = summary_repository.get_player_total("Jane Doe").entity
+    assert (john.matches, john.total_score) == (5, 35)
+    assert (jane.matches, jane.total_score) == (2, 3)
+
+
+def test_leaderboards_rank_by_total_score(db_session):
+    # Arrange
+    score_repository = BaseballPlayerScoreRepository(db_session)
+    summary_repository = ScoreSummaryRepository(db_session)
+    for score in (
+        make_score("John Doe", "Team A", 10, date(2023, 6, 1)),
+        make_score("John Doe", "Team A", 40, date(2024, 6, 1)),
+        make_score("Jane Doe", "Team B", 30, date(2023, 6, 1)),
+        make_score("Jim Doe", "Team B", 30, date(2023, 6, 2)),
+    ):
+        score_repository.create(score)
+
+    # Act
+    career = summary_repository.get_player_leaderboard(2).entity
+    season = summary_repository.get_player_leaderboard(
+        3,
+        season=2023
+    ).entity
+    date_range = summary_repository.get_player_leaderboard(
+        1,
+        start_date=date(2024, 1, 1)
+    ).entity
+
+    # Assert
+    assert [row.player_name for row in career] == ["John Doe", "Jane Doe"]
+    assert [row.player_name for row in season] == [
+        "Jane Doe", "Jim Doe", "John Doe"
+    ]
+    assert [(row.player_name, row.total_score) for row in date_range] == [
+        ("John Doe", 40)
+    ]
+
+
+def test_range_leaderboard_adds_months_and_partial_months(db_session):
+    # Arrange
+    score_repository = BaseballPlayerScoreRepository(db_session)
+    summary_repository = ScoreSummaryRepository(db_session)
+    for player_name, score, match_date in (
+        ("John Doe", 1, date(2023, 1, 14)),
+        ("John Doe", 2, date(2023, 1, 15)),
+        ("John Doe", 4, date(2023, 3, 31)),
+        ("Jane Doe", 8, date(2023, 2, 1)),
+        ("Jane Doe", 16, date(2023, 4, 10)),
+        ("Jane Doe", 32, date(2023, 4, 11)),
+    ):
+        score_repository.create(
+            make_score(player_name, "Team A", score, match_date)
+        )
+
+    # Act
+    spanning = summary_repository.get_player_leaderboard(
+        10,
+        start_date=date(2023, 1, 15),
+        end_date=date(2023, 4, 10)
+    ).entity
+    within_month = summary_repository.get_player_leaderboard(
+        10,
+        start_date=date(2023, 4, 2),
+        end_date=date(2023, 4, 10)
+    ).entity
+
+    # Assert
+    assert [tuple(row) for row in spanning] == [
+        ("Jane Doe", 2, 24), ("John Doe", 2, 6)
+    ]
+    assert [tuple(row) for row in within_month] == [("Jane Doe", 1, 16)]
+
+
+def test_search_players_ranks_matching_names(db_session):
+    # Arrange
+    score_repository = BaseballPlayerScoreRepository(db_session)
+    for name in ("Will Smithers", "Jane Smith", "John Doe"):
+        score_repository.create(make_score(name, None, 10, date(2024, 1, 1)))
+
+    # Act
+    players = ScoreSummaryRepository(db_session).search_players("smith", 10)
+
+    # Assert
+    assert players.is_ok
+    assert sorted(player.player_name for player in players.entity) == [
+        "Jane Smith", "Will Smithers"
+    ]
@@ -0,0 +1,181 @@
+# test_query_budgets.py
+import asyncio
+import httpx
+import pytest
+from datetime import date
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app import dependencies
+from app.database.schema_migrations import upgrade_schema
+from app.metrics.metrics_middleware import MetricsMiddleware
+from app.metrics.query_budget import QueryBudget, QueryBudgetExceeded
+from app.metrics.request_metrics import RequestMetrics
+from app.metrics.sql_usage import install_sql_metrics
+from app.models.baseball_player_score import BaseballPlayerScore
+from app.repositories.baseball_player_score_repository import (
+    BaseballPlayerScoreRepository,
+)
+from app.routers import baseball_scores_router, score_summary_router
+from app.services.score_service import ScoreService
+
+# SQL statements each endpoint runs, without caches. A change of one of
+# these numbers is a change of the cost of the endpoint: update it on
+# purpose, with the reason in the commit.
+STATEMENT_COUNTS = [
+    ("POST", "/scores", {
+        "player_name": "Jane Smith",
+        "player_team": "Team B",
+        "score": 3,
+        "match_date": "2023-01-02",
+    }, 1),
+    # One lookup of the existing keys, then one multi-row insert.
+    ("POST", "/scores/bulk", [
+        {
+            "player_name": "Jane Smith",
+            "player_team": "Team B",
+            "score": 3,
+            "match_date": "2023-01-02",
+        },
+        {
+            "player_name": "Jane Smith",
+            "player_team": "Team B",
+            "score": 4,
+            "match_date": "2023-01-03",
+        },
+    ], 2),
+    ("GET", "/scores/1", None, 1),
+    ("GET", "/scores/batch?ids=1,2&ids=3", None, 1),
+    ("POST", "/scores/batch", {
+        "ids": [1, 2],
+        "keys": [{"player_name": "John Doe", "match_date": "2023-01-01"}],
+    }, 2),
+    ("PATCH", "/scores/1", {"score": 9}, 1),
+    ("DELETE", "/scores/1", None, 1),
+    # One UPDATE per set of patched fields, then the rows are read back.
+    ("PATCH", "/scores/batch", [
+        {"id": 1, "score": 9},
+        {"id": 2, "score": 8},
+        {"id": 3, "player_team": "Team B"},
+    ], 3),
+    ("DELETE", "/scores/batch", [1, 2], 1),
+    ("GET", "/scores?player_team=Team%20A", None, 2),
+    ("GET", "/scores?include_total=false", None, 1),
+    ("GET", "/scores/export", None, 1),
+    ("GET", "/leaderboards/players", None, 1),
+    ("GET", "/summaries/players?name_query=doe", None, 1),
+    ("GET", "/summaries/players/John%20Doe", None, 1),
+    ("GET", "/summaries/teams/daily?player_team=Team%20A", None, 1),
+    ("GET", "/summaries/teams/seasons?player_team=Team%20A", None, 1),
+]
+
+
+# Fixture for the score routes on an in-memory database holding one score
+@pytest.fixture(scope="function")
+def app():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    upgrade_schema(engine)
+    with engine.begin() as connection:
+        connection.execute(BaseballPlayerScore.__table__.insert(), {
+            "player_name": "John Doe",
+            "player_team": "Team A",
+            "score": 5,
+            "match_date": date(2023, 1, 1),
+        })
+    install_sql_metrics(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    def get_db():
+        with SessionLocal() as db:
+            yield db
+
+    def get_score_service(db=Depends(get_db)):
+        return ScoreService(BaseballPlayerScoreRepository(db))
+
+    app = FastAPI()
+    app.include_router(baseball_scores_router.router)
+    app.include_router(score_summary_router.router)
+    app.dependency_overrides[dependencies.get_db] = get_db
+    app.dependency_overrides[dependencies.get_score_service] = (
+        get_score_service
+    )
+    yield app
+    engine.dispose()
+
+
+def send_request(app, method, url, body, budget, headers=None):
+    query_budget = QueryBudget(default_budget=budget, strict=True)
+
+    async def send():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(
+                app=MetricsMiddleware(app, RequestMetrics(), query_budget)
+            ),
+            base_url="http://test"
+        ) as client:
+            return await client.request(
+                method,
+                url,
+                json=body,
+                headers=headers
+            )
+
+    return asyncio.run(send())
+
+
+@pytest.mark.parametrize(
+    "method, url, body, statements",
+    STATEMENT_COUNTS,
+    ids=[f"{method} {url}" for method, url, _, _ in STATEMENT_COUNTS]
+)
+def test_endpoint_runs_its_statement_count(app, method, url, body, statements):
+    # Act
+    response = send_request(app, method, url, body, budget=statements)
+
+    # Assert
+    assert response.status_code < 400
+
+
+@pytest.mark.parametrize(
+    "method, url, body, statements",
+    STATEMENT_COUNTS,
+    ids=[f"{method} {url}" for method, url, _, _ in STATEMENT_COUNTS]
+)
+def test_endpoint_needs_all_its_statements(app, method, url, body, statements):
+    # Act / Assert: the counts above are exact, not upper bounds.
+    with pytest.raises(QueryBudgetExceeded):
+        send_request(app, method, url, body, budget=statements - 1)
+
+
+def test_etag_follows_writes_made_outside_the_app(app):
+    # Arrange
+    etag = send_request(app, "GET", "/scores/1", None, 1).headers["ETag"]
+    # Written by another connection, as by another worker or the importer.
+    with next(app.dependency_overrides[dependencies.get_db]()) as db:
+        table = BaseballPlayerScore.__table__
+        db.execute(update(table).where(table.c.id == 1).values(score=8))
+        db.commit()
+
+    # Act
+    changed = send_request(
+        app, "GET", "/scores/1", None, 1, headers={"If-None-Match": etag}
+    )
+    unchanged = send_request(
+        app, "GET", "/scores/1", None, 1,
+        headers={"If-None-Match": changed.headers["ETag"]}
+    )
+    missing = send_request(
+        app, "GET", "/scores/2", None, 1, headers={"If-None-Match": "*"}
+    )
+
+    # Assert
+    assert changed.status_code == 200
+    assert changed.json()["score"] == 8
+    assert changed.headers["ETag"] != etag
+    assert unchanged.status_code == 304
+    assert missing.status_code == 404
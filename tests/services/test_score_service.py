@@ -1,21 +1,37 @@
 # test_score_service.py
+import json
 import pytest
 from unittest.mock import Mock
 from datetime import date
 from app.services.score_service import ScoreService
+from app.cache.score_entity_cache import ScoreEntityCache
+from app.cache.score_json_cache import ScoreJsonCache
+from app.cache.search_result_cache import SearchResultCache
+from app.domain.batch_write_mode import BatchWriteMode
+from app.domain.bulk_item_status import BulkItemStatus
+from app.domain.mass_write_kind import MassWriteKind
+from app.domain.mass_write_status import MassWriteStatus
+from app.helper.score_import_reader import ImportRow
+from app.jobs.mass_write_jobs import MassWriteJob
 from app.domain.pagination_result import PaginationResult
 from app.domain.repository_action_result import RepositoryActionResult
+from app.domain.score_sort_order import ScoreSortOrder
 from app.models.baseball_player_score import BaseballPlayerScore
 from app.repositories.baseball_player_score_repository import (
     BaseballPlayerScoreRepository,
 )
+from app.schemas.mass_write_schema import ScoreFilter
+from app.schemas.score_batch_schema import ScoreKey
 from app.schemas.score_create_schema import ScoreCreate
 from app.schemas.score_update_schema import ScoreUpdate
+from app.settings import BATCH_GET_MAX_ITEMS
 
 
 @pytest.fixture
 def mock_repository():
-    return Mock(BaseballPlayerScoreRepository)
+    repository = Mock(BaseballPlayerScoreRepository)
+    repository.dialect_name = "sqlite"
+    return repository
 
 
 @pytest.fixture
@@ -25,9 +41,6 @@ def score_service(mock_repository):
 
 def test_create_score_new(score_service, mock_repository):
     # Arrange
-    mock_repository.get_score_from_player_and_date.return_value = (
-        RepositoryActionResult.not_found("not found")
-    )
     new_score_data = {
         "player_name": "John Doe",
         "score": 10,
@@ -47,14 +60,8 @@ def test_create_score_new(score_service, mock_repository):
 
 def test_create_score_duplicate(score_service, mock_repository):
     # Arrange
-    existing_score = BaseballPlayerScore(
-        id=1,
-        player_name="John Doe",
-        score=10,
-        match_date=date.today()
-    )
-    mock_repository.get_score_from_player_and_date.return_value = (
-        RepositoryActionResult.ok(existing_score)
+    mock_repository.create.return_value = (
+        RepositoryActionResult.conflict("conflict")
     )
     score_create = ScoreCreate(
         player_name="John Doe",
@@ -67,6 +74,7 @@ def test_create_score_duplicate(score_service, mock_repository):
 
     # Assert
     assert result.is_conflict
+    mock_repository.get_score_from_player_and_date.assert_not_called()
 
 
 def test_get_score(score_service, mock_repository):
@@ -190,3 +198,477 @@ def test_search_scores(score_service, mock_repository):
     assert result.data.pagination.total_pages == 1
     assert result.data.pagination.current_page == 1
     assert result.data.pagination.page_size == 10
+
+
+def test_search_scores_returns_next_cursor(score_service, mock_repository):
+    # Arrange
+    mock_scores = [
+        BaseballPlayerScore(
+            id=7,
+            player_name="John Doe",
+            score=20,
+            match_date=date(2023, 5, 1)
+        ),
+    ]
+    pagination_result = PaginationResult(
+        items=mock_scores,
+        total_items=2,
+        has_more=True
+    )
+    mock_repository.search_scores.return_value = RepositoryActionResult.ok(
+        pagination_result
+    )
+
+    # Act
+    result = score_service.search_scores(
+        min_score=None,
+        player_name=None,
+        player_team=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=1,
+        sort_order=ScoreSortOrder.MATCH_DATE_ASC
+    )
+    next_result = score_service.search_scores(
+        min_score=None,
+        player_name=None,
+        player_team=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=1,
+        sort_order=ScoreSortOrder.MATCH_DATE_ASC,
+        cursor=result.data.pagination.next_cursor
+    )
+
+    # Assert
+    assert result.data.pagination.next_cursor is not None
+    assert next_result.is_ok
+    assert next_result.data.pagination.current_page is None
+    assert mock_repository.search_scores.call_args.kwargs["after"] == (
+        date(2023, 5, 1), 7
+    )
+
+
+def test_search_scores_invalid_cursor(score_service, mock_repository):
+    # Act
+    result = score_service.search_scores(
+        min_score=None,
+        player_name=None,
+        player_team=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=10,
+        cursor="not-a-cursor"
+    )
+
+    # Assert
+    assert result.is_bad_request
+    mock_repository.search_scores.assert_not_called()
+
+
+def test_create_scores_reports_each_item(score_service, mock_repository):
+    # Arrange
+    mock_repository.get_existing_player_dates.return_value = (
+        RepositoryActionResult.ok({("Jane Doe", date(2023, 1, 1))})
+    )
+    mock_repository.create_many.side_effect = lambda values: (
+        RepositoryActionResult.ok([
+            RepositoryActionResult.ok(
+                BaseballPlayerScore(id=index + 1, **value)
+            )
+            for index, value in enumerate(values)
+        ])
+    )
+    items = [
+        {"player_name": "John Doe", "score": 10, "match_date": "2023-01-01"},
+        {"player_name": "Jane Doe", "score": 12, "match_date": "2023-01-01"},
+        {"player_name": " ", "score": 5, "match_date": "2023-01-01"},
+        {"player_name": "John Doe", "score": 11, "match_date": "2023-01-01"},
+        {"player_name": "Jim Doe", "score": 9, "match_date": "2023-01-02"},
+    ]
+
+    # Act
+    result = score_service.create_scores(items, batch_size=1)
+
+    # Assert
+    assert result.is_ok
+    assert [item.status for item in result.data.results] == [
+        BulkItemStatus.CREATED,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.INVALID,
+        BulkItemStatus.CONFLICT,
+        BulkItemStatus.CREATED,
+    ]
+    assert result.data.created == 2
+    assert result.data.conflicts == 2
+    assert result.data.invalid == 1
+    assert mock_repository.get_existing_player_dates.call_count == 1
+    assert mock_repository.create_many.call_count == 2
+
+
+def test_create_scores_reports_concurrent_insert_as_conflict(
+    score_service,
+    mock_repository
+):
+    # Arrange
+    mock_repository.get_existing_player_dates.return_value = (
+        RepositoryActionResult.ok(set())
+    )
+    mock_repository.create_many.return_value = RepositoryActionResult.ok([
+        RepositoryActionResult.conflict("Entity conflicts")
+    ])
+    items = [
+        {"player_name": "John Doe", "score": 10, "match_date": "2023-01-01"},
+    ]
+
+    # Act
+    result = score_service.create_scores(items)
+
+    # Assert
+    assert result.is_ok
+    assert result.data.results[0].status == BulkItemStatus.CONFLICT
+    assert result.data.errors == 0
+
+
+def test_import_scores_commits_in_batches(score_service, mock_repository):
+    # Arrange
+    mock_repository.get_existing_player_dates.return_value = (
+        RepositoryActionResult.ok(set())
+    )
+    mock_repository.create_many.side_effect = lambda values: (
+        RepositoryActionResult.ok([
+            RepositoryActionResult.ok(
+                BaseballPlayerScore(id=index + 1, **value)
+            )
+            for index, value in enumerate(values)
+        ])
+    )
+
+    def row(line_number, name, score):
+        return ImportRow(
+            line_number,
+            {"player_name": name, "score": score, "match_date": "2023-01-01"}
+        )
+
+    rows = [
+        row(2, "A", 1),
+        ImportRow(3, None, "Invalid JSON"),
+        row(4, "B", 2),
+        row(5, "C", -1),
+        row(6, "D", 4),
+    ]
+    progress = []
+
+    # Act
+    result = score_service.import_scores(
+        iter(rows),
+        batch_size=2,
+        on_progress=lambda report: progress.append(report.rows_read)
+    )
+
+    # Assert
+    assert result.is_ok
+    assert result.data.rows_read == 5
+    assert result.data.created == 3
+    assert result.data.invalid == 2
+    assert [row.line_number for row in result.data.rejected] == [3, 5]
+    assert progress == [2, 4, 5]
+    assert mock_repository.create_many.call_count == 3
+
+
+def test_get_score_reads_through_entity_cache(mock_repository):
+    # Arrange
+    entity_cache = ScoreEntityCache(max_entries=10, ttl_seconds=60)
+    score_service = ScoreService(mock_repository, entity_cache=entity_cache)
+    mock_score = BaseballPlayerScore(
+        id=1,
+        player_name="John Doe",
+        score=10,
+        match_date=date.today()
+    )
+    mock_repository.get_by_id.return_value = (
+        RepositoryActionResult.ok(mock_score)
+    )
+
+    # Act
+    first = score_service.get_score(1)
+    second = score_service.get_score(1)
+    entity_cache.after_update(mock_score, ["score"])
+    third = score_service.get_score(1)
+
+    # Assert
+    assert first.data == second.data == third.data
+    assert mock_repository.get_by_id.call_count == 2
+    assert entity_cache.stats().hits == 1
+
+
+def test_get_scores_reports_missing_ids_and_keys(mock_repository):
+    # Arrange
+    entity_cache = ScoreEntityCache(max_entries=10, ttl_seconds=60)
+    score_service = ScoreService(mock_repository, entity_cache=entity_cache)
+    first_score = BaseballPlayerScore(
+        id=1, player_name="John Doe", score=10, match_date=date(2023, 1, 1)
+    )
+    second_score = BaseballPlayerScore(
+        id=2, player_name="Jane Doe", score=20, match_date=date(2023, 1, 2)
+    )
+    mock_repository.get_many.return_value = (
+        RepositoryActionResult.ok([first_score])
+    )
+    mock_repository.get_scores_by_player_dates.return_value = (
+        RepositoryActionResult.ok([first_score, second_score])
+    )
+    keys = [
+        ScoreKey(player_name="Jane Doe", match_date=date(2023, 1, 2)),
+        ScoreKey(player_name="John Doe", match_date=date(2023, 1, 1)),
+        ScoreKey(player_name="Nobody", match_date=date(2023, 1, 1)),
+    ]
+
+    # Act
+    first = score_service.get_scores([1, 3, 1], keys)
+    second = score_service.get_scores([1], [])
+
+    # Assert
+    assert [score.id for score in first.data.items] == [1, 2]
+    assert first.data.missing_ids == [3]
+    assert first.data.missing_keys == keys[2:]
+    mock_repository.get_many.assert_called_once_with([1, 3])
+    assert second.data.items == first.data.items[:1]
+
+
+def test_get_scores_rejects_too_many_items(score_service, mock_repository):
+    # Act
+    result = score_service.get_scores(
+        list(range(BATCH_GET_MAX_ITEMS + 1)), []
+    )
+
+    # Assert
+    assert result.is_bad_request
+    mock_repository.get_many.assert_not_called()
+
+
+@pytest.mark.parametrize("mode, committed, first_status", [
+    (BatchWriteMode.ATOMIC, False, BulkItemStatus.ROLLED_BACK),
+    (BatchWriteMode.BEST_EFFORT, True, BulkItemStatus.UPDATED),
+])
+def test_update_scores_reports_each_item(
+    score_service,
+    mock_repository,
+    mode,
+    committed,
+    first_status
+):
+    # Arrange
+    updated = BaseballPlayerScore(
+        id=1, player_name="John Doe", score=9, match_date=date(2023, 1, 1)
+    )
+    mock_repository.update_many.return_value = RepositoryActionResult.ok([
+        RepositoryActionResult.ok(updated if committed else None),
+        RepositoryActionResult.not_found("Entity with id 7 not found"),
+    ])
+
+    # Act
+    result = score_service.update_scores(
+        [{"id": 1, "score": 9}, {"id": 7, "score": 3}],
+        mode
+    )
+
+    # Assert
+    assert result.is_ok
+    assert result.data.committed == committed
+    assert [item.status for item in result.data.results] == [
+        first_status, BulkItemStatus.NOT_FOUND
+    ]
+    mock_repository.update_many.assert_called_once_with(
+        [(1, {"score": 9}), (7, {"score": 3})],
+        mode == BatchWriteMode.ATOMIC
+    )
+
+
+def test_delete_scores_atomic_skips_write_with_invalid_item(
+    score_service,
+    mock_repository
+):
+    # Act
+    result = score_service.delete_scores([1, 2, 1], BatchWriteMode.ATOMIC)
+
+    # Assert
+    assert not result.data.committed
+    assert [item.status for item in result.data.results] == [
+        BulkItemStatus.ROLLED_BACK,
+        BulkItemStatus.ROLLED_BACK,
+        BulkItemStatus.INVALID,
+    ]
+    mock_repository.delete_many.assert_not_called()
+
+
+def test_run_mass_write_covers_the_id_range_in_chunks(
+    score_service,
+    mock_repository
+):
+    # Arrange
+    job = MassWriteJob(
+        MassWriteKind.UPDATE,
+        ScoreFilter(player_team="Team A"),
+        shift_days=1
+    )
+    mock_repository.get_id_bounds.return_value = (
+        RepositoryActionResult.ok((1, 25))
+    )
+    mock_repository.update_matching_in_range.return_value = (
+        RepositoryActionResult.ok((4, 1))
+    )
+
+    # Act
+    score_service.run_mass_write(job, chunk_ids=10, pause_seconds=0)
+
+    # Assert
+    snapshot = job.snapshot()
+    assert snapshot.status == MassWriteStatus.COMPLETED
+    assert (snapshot.chunks, snapshot.rows_written) == (3, 12)
+    assert snapshot.rows_skipped == 3
+    # Dates move forward, the latest scores go first.
+    assert [
+        call.args[1:3]
+        for call in mock_repository.update_matching_in_range.call_args_list
+    ] == [(21, 26), (11, 21), (1, 11)]
+
+
+def test_run_mass_write_refuses_date_shifts_off_sqlite(
+    score_service,
+    mock_repository
+):
+    # Arrange
+    mock_repository.dialect_name = "postgresql"
+    job = MassWriteJob(
+        MassWriteKind.UPDATE,
+        ScoreFilter(player_team="Team A"),
+        shift_days=1
+    )
+
+    # Act
+    score_service.run_mass_write(job, chunk_ids=10, pause_seconds=0)
+
+    # Assert
+    snapshot = job.snapshot()
+    assert snapshot.status == MassWriteStatus.FAILED
+    assert "only supported on SQLite" in snapshot.error_message
+    mock_repository.update_matching_in_range.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "updated_data, shift_days, is_ok",
+    [
+        ({"score": 10}, 0, True),
+        ({"player_team": "Team B"}, 0, True),
+        ({"player_name": "Jane Doe"}, 0, False),
+        ({}, -2, False),
+    ]
+)
+def test_check_mass_update_off_sqlite(
+    score_service,
+    mock_repository,
+    updated_data,
+    shift_days,
+    is_ok
+):
+    # Arrange
+    mock_repository.dialect_name = "postgresql"
+
+    # Act
+    result = score_service.check_mass_update(updated_data, shift_days)
+
+    # Assert
+    assert result.is_ok == is_ok
+    assert result.is_bad_request != is_ok
+
+
+def test_run_mass_write_stops_when_cancelled(score_service, mock_repository):
+    # Arrange
+    job = MassWriteJob(MassWriteKind.DELETE, ScoreFilter(min_score=90))
+    mock_repository.get_id_bounds.return_value = (
+        RepositoryActionResult.ok((1, 25))
+    )
+
+    def delete_chunk(search_filter, start_id, end_id):
+        job.cancel()
+        return RepositoryActionResult.ok(2)
+
+    mock_repository.delete_matching_in_range.side_effect = delete_chunk
+
+    # Act
+    score_service.run_mass_write(job, chunk_ids=10, pause_seconds=0)
+
+    # Assert
+    snapshot = job.snapshot()
+    assert snapshot.status == MassWriteStatus.CANCELLED
+    assert (snapshot.chunks, snapshot.rows_written) == (1, 2)
+    assert snapshot.progress == 0.4
+
+
+def test_search_scores_reads_through_search_cache(mock_repository):
+    # Arrange
+    search_cache = SearchResultCache(max_entries=10, ttl_seconds=60)
+    score_service = ScoreService(mock_repository, search_cache=search_cache)
+    mock_score = BaseballPlayerScore(
+        id=1,
+        player_name="John Doe",
+        player_team="Team A",
+        score=20,
+        match_date=date.today()
+    )
+    mock_repository.search_scores.return_value = RepositoryActionResult.ok(
+        PaginationResult(items=[mock_score], total_items=1)
+    )
+    search = {
+        "player_name": None,
+        "player_team": "Team A",
+        "min_score": None,
+        "start_date": None,
+        "end_date": None,
+        "page": 1,
+        "page_size": 10,
+    }
+
+    # Act
+    first = score_service.search_scores(**search)
+    second = score_service.search_scores(**search)
+    search_cache.after_create(mock_score)
+    third = score_service.search_scores(**search)
+
+    # Assert
+    assert first.data == second.data == third.data
+    assert mock_repository.search_scores.call_count == 2
+    assert search_cache.stats().hits == 1
+
+
+def test_get_score_json_reuses_fragment_of_unchanged_score(mock_repository):
+    # Arrange
+    json_cache = ScoreJsonCache(max_entries=10, ttl_seconds=60)
+    score_service = ScoreService(mock_repository, json_cache=json_cache)
+    mock_score = BaseballPlayerScore(
+        id=1,
+        player_name="John Doe",
+        player_team="Team A",
+        score=10,
+        match_date=date.today()
+    )
+    mock_repository.get_by_id.return_value = (
+        RepositoryActionResult.ok(mock_score)
+    )
+
+    # Act
+    first = score_service.get_score_json(1)
+    second = score_service.get_score_json(1)
+    mock_score.score = 30
+    third = score_service.get_score_json(1)
+
+    # Assert
+    assert first.data == second.data
+    assert json.loads(first.data)["player_name"] == "John Doe"
+    assert json.loads(third.data)["score"] == 30
+    assert mock_repository.get_by_id.call_count == 3
+    assert json_cache.stats().hits == 1